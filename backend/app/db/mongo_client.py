@@ -94,6 +94,25 @@ class MongoDBClient:
         result = self.collection.insert_one(data_to_insert)
         return str(result.inserted_id)
 
+    def insert_bills_bulk(self, bills: List[Dict[str, Any]]) -> List[str]:
+        """Legacy insert for many bills in one round-trip.
+
+        Returns:
+            Inserted IDs in the order of ``bills``
+        """
+        if not bills:
+            return []
+
+        now = datetime.now().isoformat()
+        docs = []
+        for bill_data in bills:
+            doc = self._validate_and_transform(bill_data)
+            doc["inserted_at"] = now
+            docs.append(doc)
+
+        result = self.collection.insert_many(docs, ordered=False)
+        return [str(_id) for _id in result.inserted_ids]
+
     def upsert_bill(self, upload_id: str, bill_data: Dict[str, Any]) -> str:
         """Bill-scoped persistence: one upload_id -> one document.
 
@@ -223,6 +242,34 @@ class MongoDBClient:
         """
         return self.get_bill(bill_id)
 
+    def get_bills_by_ids(self, bill_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch many bills with one query, matching ``get_bill`` ID handling.
+
+        Each ID is looked up both as a string ``_id`` and, when valid, as an
+        ObjectId (legacy documents).
+
+        Args:
+            bill_ids: Bill identifiers
+
+        Returns:
+            Found bill documents in the order of ``bill_ids`` (missing IDs are skipped)
+        """
+        if not bill_ids:
+            return []
+
+        from bson import ObjectId
+
+        keys: List[Any] = list(bill_ids)
+        keys.extend(ObjectId(b) for b in bill_ids if ObjectId.is_valid(b))
+
+        try:
+            by_id = {str(doc["_id"]): doc for doc in self.collection.find({"_id": {"$in": keys}})}
+        except Exception as e:
+            logger.error(f"Error fetching bills {bill_ids}: {e}")
+            return []
+
+        return [by_id[b] for b in bill_ids if b in by_id]
+
     def get_bill_by_upload_id(self, upload_id: str) -> Optional[Dict[str, Any]]:
         return self.collection.find_one({"_id": upload_id})
 
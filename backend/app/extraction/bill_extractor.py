@@ -25,6 +25,7 @@ import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 # Import new modules for isolated parsing
@@ -54,8 +55,9 @@ from app.extraction.regex_utils import (
     safe_group,
     try_extract_labeled_field,
     is_label_only,
-    extract_from_next_line,
+    next_line_value,
     clean_extracted_value,
+    compile_any,
 )
 from app.extraction.column_parser import (
     parse_item_columns,
@@ -87,16 +89,21 @@ PAYMENT_PATTERNS = [
     r"\b(credit|debit)\s+card\b",
     r"\btransaction\s+id\b",
 ]
+_PAYMENT_RE = compile_any(PAYMENT_PATTERNS)
 
+# Tokens that mark a line as a medical item rather than a payment
+_MEDICAL_INDICATORS = (" TAB ", " CAP ", " INJ ", " SYR ", " MG ", " ML ", " TEST ", " SCAN ")
 
+
+@lru_cache(maxsize=4096)
 def is_paymentish(text: str) -> bool:
-    """Check if text indicates a payment/receipt entry."""
+    """Check if text indicates a payment/receipt entry (memoized)."""
     t = (text or "").upper()
     # Quick reject if looks like a medical item
-    medical_indicators = [" TAB ", " CAP ", " INJ ", " SYR ", " MG ", " ML ", " TEST ", " SCAN "]
-    if any(ind in f" {t} " for ind in medical_indicators):
+    padded = f" {t} "
+    if any(ind in padded for ind in _MEDICAL_INDICATORS):
         return False
-    return any(re.search(p, t, re.IGNORECASE) for p in PAYMENT_PATTERNS)
+    return _PAYMENT_RE.search(t) is not None
 
 
 # =============================================================================
@@ -129,6 +136,10 @@ SPONSOR_DISCOUNT_PATTERNS = [
     r"company\s*discount",
 ]
 
+_DISCOUNT_RE = compile_any(DISCOUNT_PATTERNS)
+_PATIENT_DISCOUNT_RE = compile_any(PATIENT_DISCOUNT_PATTERNS)
+_SPONSOR_DISCOUNT_RE = compile_any(SPONSOR_DISCOUNT_PATTERNS)
+
 
 def is_discount(text: str) -> bool:
     """Check if text indicates a discount line item.
@@ -141,8 +152,7 @@ def is_discount(text: str) -> bool:
     """
     if not text:
         return False
-    t = text.lower().strip()
-    return any(re.search(p, t, re.IGNORECASE) for p in DISCOUNT_PATTERNS)
+    return _DISCOUNT_RE.search(text.strip()) is not None
 
 
 def classify_discount_type(text: str) -> str:
@@ -156,17 +166,15 @@ def classify_discount_type(text: str) -> str:
     """
     if not text:
         return "general"
-    t = text.lower().strip()
+    t = text.strip()
 
     # Check for patient discount
-    for pattern in PATIENT_DISCOUNT_PATTERNS:
-        if re.search(pattern, t, re.IGNORECASE):
-            return "patient"
+    if _PATIENT_DISCOUNT_RE.search(t):
+        return "patient"
 
     # Check for sponsor discount
-    for pattern in SPONSOR_DISCOUNT_PATTERNS:
-        if re.search(pattern, t, re.IGNORECASE):
-            return "sponsor"
+    if _SPONSOR_DISCOUNT_RE.search(t):
+        return "sponsor"
 
     return "general"
 
@@ -245,6 +253,26 @@ AMOUNT_PATTERNS = [
     r"₹?\s*([\d,]+\.\d{2})\s*$",
     r"₹?\s*([\d,]+)\s*$",
 ]
+_AMOUNT_RES = tuple(re.compile(p) for p in AMOUNT_PATTERNS)
+
+_AMOUNT_DIGITS = frozenset("0123456789")
+_AMOUNT_INTEGER_CHARS = frozenset("0123456789,")
+
+
+def _bare_amount(s: str) -> Optional[str]:
+    """Return ``s`` without ₹/commas if it is only an amount ("₹5,000.00"), else None.
+
+    Matches what AMOUNT_PATTERNS would capture for such strings, without
+    running the regexes on the common column-value case.
+    """
+    if s.startswith("₹"):
+        s = s[1:].lstrip()
+    head, dot, frac = s.partition(".")
+    if not head or not _AMOUNT_INTEGER_CHARS.issuperset(head):
+        return None
+    if dot and (len(frac) != 2 or not _AMOUNT_DIGITS.issuperset(frac)):
+        return None
+    return s.replace(",", "")
 
 
 def extract_amount_from_text(text: str) -> Optional[float]:
@@ -252,12 +280,24 @@ def extract_amount_from_text(text: str) -> Optional[float]:
     if not text:
         return None
 
+    stripped = text.strip()
+
     # Quick rejection of suspect patterns
-    if is_suspect_numeric(text.strip()):
+    if is_suspect_numeric(stripped):
         return None
 
-    for pat in AMOUNT_PATTERNS:
-        m = re.search(pat, text.strip())
+    # Fast path: the whole text is the amount
+    bare = _bare_amount(stripped)
+    if bare is not None:
+        try:
+            val = float(bare)
+        except ValueError:
+            pass
+        else:
+            return None if val > MAX_LINE_ITEM_AMOUNT else val
+
+    for pat in _AMOUNT_RES:
+        m = pat.search(stripped)
         if not m:
             continue
         # Use safe_group to prevent None.replace() crashes
@@ -585,8 +625,7 @@ class HeaderParser:
             
             # Second try: multi-line extraction if current line has label only
             if next_line and is_label_only(text, [pat]):
-                next_text = (next_line.get("text") or "").strip()
-                multi_line_value = extract_from_next_line(text, next_text, [pat])
+                multi_line_value = next_line_value(next_line.get("text") or "")
                 if multi_line_value:
                     return multi_line_value
             
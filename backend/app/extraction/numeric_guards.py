@@ -12,6 +12,7 @@ Design principles:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
 # =============================================================================
@@ -60,10 +61,28 @@ SUSPECT_PATTERNS = [
     (r"^\d{2}[A-Z]{5}\d{4}[A-Z]\d[A-Z\d]$", "gstin"),
 ]
 
+# All suspect patterns as one alternation, tried in list order; the named
+# group that matched (m.lastgroup) identifies the pattern
+_SUSPECT_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(SUSPECT_PATTERNS)),
+    re.IGNORECASE,
+)
+_SUSPECT_TYPES = {f"p{i}": suspect_type for i, (_, suspect_type) in enumerate(SUSPECT_PATTERNS)}
 
+_CURRENCY_RE = re.compile(r"[₹$€£¥]")
+_AMOUNT_PATTERNS = (
+    re.compile(r"([+-]?[\d,]+\.\d{1,2})$"),     # With decimals: 1,234.56
+    re.compile(r"([+-]?[\d,]+)$"),              # Without decimals: 1,234
+)
+_ALPHA_RUN_RE = re.compile(r"[a-zA-Z]{2,}")
+
+
+@lru_cache(maxsize=4096)
 def classify_suspect_numeric(text: str) -> Optional[str]:
     """Classify a numeric string as suspect type or None if valid.
 
+    Memoized: the same tokens (dates, phone numbers, IDs) recur on every page.
+
     Args:
         text: The text to classify
 
@@ -75,11 +94,10 @@ def classify_suspect_numeric(text: str) -> Optional[str]:
 
     cleaned = text.strip().upper().replace(",", "").replace(" ", "")
 
-    for pattern, suspect_type in SUSPECT_PATTERNS:
-        if re.match(pattern, cleaned, re.IGNORECASE):
-            return suspect_type
-
-    return None
+    match = _SUSPECT_RE.match(cleaned)
+    if match is None:
+        return None
+    return _SUSPECT_TYPES[match.lastgroup]
 
 
 def is_suspect_numeric(text: str) -> bool:
@@ -111,17 +129,12 @@ def extract_numeric_value(text: str) -> Optional[float]:
 
     # Remove currency symbols and whitespace
     cleaned = text.strip()
-    cleaned = re.sub(r"[₹$€£¥]", "", cleaned)
+    cleaned = _CURRENCY_RE.sub("", cleaned)
     cleaned = cleaned.strip()
 
     # Try to extract amount pattern
-    patterns = [
-        r"([+-]?[\d,]+\.\d{1,2})$",     # With decimals: 1,234.56
-        r"([+-]?[\d,]+)$",              # Without decimals: 1,234
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, cleaned)
+    for pattern in _AMOUNT_PATTERNS:
+        match = pattern.search(cleaned)
         if match:
             num_str = match.group(1).replace(",", "")
             try:
@@ -158,8 +171,8 @@ def validate_amount(
         return False, f"exceeds_line_cap_{MAX_LINE_ITEM_AMOUNT}"
 
     # Check if source text is a suspect pattern
-    if source_text and is_suspect_numeric(source_text):
-        suspect_type = classify_suspect_numeric(source_text)
+    suspect_type = classify_suspect_numeric(source_text) if source_text else None
+    if suspect_type is not None:
         return False, f"suspect_pattern_{suspect_type}"
 
     # Require row context for amounts
@@ -251,7 +264,7 @@ def has_valid_row_context(
         return False
 
     # Description should have at least some alphabetic characters
-    if not re.search(r"[a-zA-Z]{2,}", description):
+    if not _ALPHA_RUN_RE.search(description):
         return False
 
     return True
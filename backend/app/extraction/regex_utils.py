@@ -4,10 +4,35 @@ Provides defensive helpers for handling regex matches in noisy OCR text
 where matches may be None or groups may not exist.
 """
 
-from typing import Optional, Match, Pattern
+from functools import lru_cache
+from typing import Optional, Match, Pattern, Sequence
 import re
 
 
+# Value cleanup runs on every OCR line
+_LEADING_PUNCT_RE = re.compile(r"^[:.\-\s]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=512)
+def _label_value_regex(label_pattern: str) -> Pattern:
+    """Compile ``label_pattern`` followed by a captured (possibly empty) value."""
+    return re.compile(label_pattern + r"\s*(.*)$", re.IGNORECASE)
+
+
+def compile_any(patterns: Sequence[str], flags: int = re.IGNORECASE) -> Pattern:
+    """Compile patterns into one regex that matches wherever any of them would.
+
+    Lets classifiers scan a line once instead of calling ``re.search`` per
+    pattern. Only suitable for yes/no checks: group numbers are shifted.
+
+    Examples:
+        >>> bool(compile_any([r"\\bpaid\\b", r"\\brefund\\b"]).search("Refund issued"))
+        True
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
 def safe_group(match: Optional[Match], group_idx: int = 1, default: str = "") -> str:
     """Safely extract a regex group with fallback.
     
@@ -87,9 +112,9 @@ def clean_extracted_value(value: str) -> str:
         return ""
     
     # Remove leading punctuation and whitespace
-    value = re.sub(r"^[:.\-\s]+", "", value)
+    value = _LEADING_PUNCT_RE.sub("", value)
     # Normalize internal whitespace
-    value = re.sub(r"\s+", " ", value)
+    value = _WHITESPACE_RE.sub(" ", value)
     return value.strip()
 
 
@@ -122,8 +147,7 @@ def try_extract_labeled_field(text: str, label_patterns: list[str],
     for pattern in label_patterns:
         # Try to match label + optional value
         # Use optional group to avoid crashes when value is missing
-        full_pattern = pattern + r"\s*(.*)$"
-        match = re.search(full_pattern, text, re.IGNORECASE)
+        match = _label_value_regex(pattern).search(text)
         
         if match:
             raw_value = safe_group(match, 1, "")
@@ -162,7 +186,7 @@ def is_label_only(text: str, label_patterns: list[str]) -> bool:
     
     for pattern in label_patterns:
         # Check if pattern matches but there's nothing substantial after it
-        match = re.search(pattern + r"\s*(.*)$", text, re.IGNORECASE)
+        match = _label_value_regex(pattern).search(text)
         if match:
             value_part = safe_group(match, 1, "")
             cleaned = clean_extracted_value(value_part)
@@ -200,18 +224,43 @@ def extract_from_next_line(current_text: str, next_text: str,
     if not is_label_only(current_text, label_patterns):
         return None
     
-    if not next_text or len(next_text.strip()) < 2:
+    return next_line_value(next_text)
+
+
+def next_line_value(next_text: str) -> Optional[str]:
+    """Return ``next_text`` as a field value, or None if it can't be one.
+
+    The next-line half of :func:`extract_from_next_line`, for callers that
+    have already established that the current line is label-only.
+
+    Args:
+        next_text: Line following a label-only line
+
+    Returns:
+        Stripped line, or None if it is too short, another label, or a bare number
+
+    Examples:
+        >>> next_line_value("  John Doe ")
+        'John Doe'
+
+        >>> next_line_value("12345") is None
+        True
+    """
+    if not next_text:
         return None
     
     # Basic validation: next line shouldn't be another label or amount
     next_cleaned = next_text.strip()
+    if len(next_cleaned) < 2:
+        return None
     
-    # Skip if next line looks like another label
-    if re.search(r"[:.]\s*$", next_cleaned):
+    # Skip if next line looks like another label (stripped, so only the last char matters)
+    if next_cleaned[-1] in ":.":
         return None
     
-    # Skip if next line is just a number (likely not a name/value)
-    if re.match(r"^\d+\.?\d*$", next_cleaned):
+    # Skip if next line is just a number (likely not a name/value): digits[.digits]
+    head, _, tail = next_cleaned.partition(".")
+    if head.isdecimal() and (not tail or tail.isdecimal()):
         return None
     
     return next_cleaned
@@ -271,11 +320,35 @@ class SafeFieldExtractor:
         
         # Try multi-line extraction (label on current, value on next)
         if is_label_only(current_line, patterns) and line_idx + 1 < len(self.lines):
-            next_line = self.lines[line_idx + 1]
-            value = extract_from_next_line(current_line, next_line, patterns)
+            value = next_line_value(self.lines[line_idx + 1])
             if value:
                 self._consumed_indices.add(line_idx)
                 self._consumed_indices.add(line_idx + 1)
                 return value
         
         return None
+
+    def extract_all(self) -> dict[str, str]:
+        """Extract every field in a single pass over the lines.
+
+        Lines are visited in order and the first value found for a field
+        wins; fields already found are not probed again, so the scan gets
+        cheaper as the header fills in.
+
+        Returns:
+            Dict mapping field names to extracted values (missing fields omitted)
+        """
+        results: dict[str, str] = {}
+        pending = [field for field, patterns in self.label_patterns.items() if patterns]
+
+        for line_idx in range(len(self.lines)):
+            if not pending:
+                break
+            for field_name in pending:
+                value = self.try_extract_at(line_idx, field_name)
+                if value:
+                    results[field_name] = value
+                    pending.remove(field_name)
+                    break
+
+        return results
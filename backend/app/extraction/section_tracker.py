@@ -17,8 +17,11 @@ from __future__ import annotations
 import bisect
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.extraction.regex_utils import compile_any
+
 
 # =============================================================================
 # Section Keywords (Generic - No Hospital-Specific Terms)
@@ -72,6 +75,96 @@ REGULATED_PRICING_KEYWORDS = [
     "price control", "scheduled drug",
 ]
 
+# Per-section header regex: any keyword at a word/separator boundary.
+# Allows section headers like "--- DIAGNOSTICS ---" or "DIAGNOSTICS:"
+_SECTION_HEADER_RES = [
+    (
+        section,
+        re.compile(
+            rf"(^|\s|[-=:])({'|'.join(map(re.escape, keywords))})(\s|[-=:]|$)",
+            re.IGNORECASE,
+        ),
+    )
+    for section, keywords in SECTION_KEYWORDS.items()
+]
+
+
+def _match_section_keywords(t: str) -> Optional[str]:
+    """First section (in SECTION_KEYWORDS order) with a keyword at a boundary in ``t``."""
+    for section, header_re in _SECTION_HEADER_RES:
+        if header_re.search(t):
+            return section
+    return None
+
+
+# Bare keyword headers ("RADIOLOGY", "--- Lab Services ---") resolved with one
+# dict probe; values come from the regex path so results are identical
+_SECTION_LITERALS: Dict[str, Optional[str]] = {
+    kw: _match_section_keywords(kw)
+    for keywords in SECTION_KEYWORDS.values()
+    for kw in keywords
+}
+_HEADER_DECORATION = " \t-=:"
+
+# Trailing amount, e.g. "1,200.00" (marks an item line, not a header)
+_TRAILING_AMOUNT_RE = re.compile(r"[\d,]+\.\d{2}\s*$")
+
+# Additional item-level patterns (fallback after keyword matching)
+ITEM_PATTERNS = {
+    "medicines": [
+        r"\d+\s*mg\b",       # Dosage: 500mg
+        r"\d+\s*ml\b",       # Volume: 100ml
+        r"\btablet\b",
+        r"\bcapsule\b",
+        r"\bsyrup\b",
+        r"\binjection\b",
+    ],
+    "diagnostics_tests": [
+        r"\btest\b",
+        r"\bprofile\b",
+        r"\bpanel\b",
+        r"\bculture\b",
+        r"\bhemoglobin\b",
+        r"\bcbc\b",
+        r"\blft\b",
+        r"\bkft\b",
+        r"\brft\b",
+    ],
+    "radiology": [
+        r"\bx[-\s]?ray\b",
+        r"\bct\s*scan\b",
+        r"\bmri\b",
+        r"\bultrasound\b",
+        r"\busg\b",
+        r"\becho\b",
+    ],
+    "consultation": [
+        r"\bconsult\b",
+        r"\bvisit\b",
+        r"\bopinion\b",
+    ],
+    "hospitalization": [
+        r"\broom\s*charge\b",
+        r"\bbed\s*charge\b",
+        r"\bward\b",
+        r"\bicu\b",
+        r"\bnursing\b",
+    ],
+}
+
+# Case-insensitive keyword containment per section, one scan each
+# ("kw in text.lower()" for any keyword)
+_SECTION_KEYWORD_RES = [
+    (section, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for section, keywords in SECTION_KEYWORDS.items()
+]
+_ITEM_PATTERN_RES = [
+    (section, compile_any(patterns)) for section, patterns in ITEM_PATTERNS.items()
+]
+_REGULATED_PRICING_RE = re.compile(
+    "|".join(map(re.escape, REGULATED_PRICING_KEYWORDS)), re.IGNORECASE
+)
+
 # Valid categories for item classification
 VALID_CATEGORIES = list(SECTION_KEYWORDS.keys()) + ["other"]
 
@@ -160,9 +253,12 @@ class SectionTracker:
         return section if section in VALID_CATEGORIES else "other"
 
 
+@lru_cache(maxsize=4096)
 def detect_section_header(text: str) -> Optional[str]:
     """Detect if text is a section header and return the category.
 
+    Memoized: the same header lines recur across pages and bills.
+
     Args:
         text: Line text to check
 
@@ -172,26 +268,23 @@ def detect_section_header(text: str) -> Optional[str]:
     if not text:
         return None
 
-    t = text.lower().strip()
+    t = text.strip()
 
     # Skip if too long (likely not a section header)
     if len(t) > 60:
         return None
 
     # Skip if looks like an item (has amount at end)
-    if re.search(r"[\d,]+\.\d{2}\s*$", t):
+    if _TRAILING_AMOUNT_RE.search(t):
         return None
 
-    # Check each category's keywords
-    for section, keywords in SECTION_KEYWORDS.items():
-        for kw in keywords:
-            # Match keyword at word boundary
-            # Allow section headers like "--- DIAGNOSTICS ---" or "DIAGNOSTICS:"
-            pattern = rf"(^|\s|[-=:])({re.escape(kw)})(\s|[-=:]|$)"
-            if re.search(pattern, t, re.IGNORECASE):
-                return section
+    # Plain or decorated single-keyword header
+    bare = t.strip(_HEADER_DECORATION).lower()
+    if bare in _SECTION_LITERALS:
+        return _SECTION_LITERALS[bare]
 
-    return None
+    # Check each category's keywords (first section in SECTION_KEYWORDS order wins)
+    return _match_section_keywords(t)
 
 
 def build_section_tracker(lines: List[Dict[str, Any]]) -> SectionTracker:
@@ -230,11 +323,12 @@ def _get_y(line: Dict[str, Any]) -> float:
     return 0.0
 
 
+@lru_cache(maxsize=4096)
 def classify_item_by_description(description: str) -> Optional[str]:
     """Attempt to classify an item by its description text.
 
     This is a fallback when no section context is available.
-    Uses keyword matching similar to section detection.
+    Uses keyword matching similar to section detection. Memoized per description.
 
     Args:
         description: Item description
@@ -245,61 +339,17 @@ def classify_item_by_description(description: str) -> Optional[str]:
     if not description:
         return None
 
-    t = description.lower().strip()
+    t = description.strip()
 
     # Check keywords with lower threshold (item descriptions are usually longer)
-    for section, keywords in SECTION_KEYWORDS.items():
-        for kw in keywords:
-            if kw in t:
-                return section
+    for section, keyword_re in _SECTION_KEYWORD_RES:
+        if keyword_re.search(t):
+            return section
 
     # Additional item-level patterns
-    item_patterns = {
-        "medicines": [
-            r"\d+\s*mg\b",       # Dosage: 500mg
-            r"\d+\s*ml\b",       # Volume: 100ml
-            r"\btablet\b",
-            r"\bcapsule\b",
-            r"\bsyrup\b",
-            r"\binjection\b",
-        ],
-        "diagnostics_tests": [
-            r"\btest\b",
-            r"\bprofile\b",
-            r"\bpanel\b",
-            r"\bculture\b",
-            r"\bhemoglobin\b",
-            r"\bcbc\b",
-            r"\blft\b",
-            r"\bkft\b",
-            r"\brft\b",
-        ],
-        "radiology": [
-            r"\bx[-\s]?ray\b",
-            r"\bct\s*scan\b",
-            r"\bmri\b",
-            r"\bultrasound\b",
-            r"\busg\b",
-            r"\becho\b",
-        ],
-        "consultation": [
-            r"\bconsult\b",
-            r"\bvisit\b",
-            r"\bopinion\b",
-        ],
-        "hospitalization": [
-            r"\broom\s*charge\b",
-            r"\bbed\s*charge\b",
-            r"\bward\b",
-            r"\bicu\b",
-            r"\bnursing\b",
-        ],
-    }
-
-    for section, patterns in item_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, t, re.IGNORECASE):
-                return section
+    for section, pattern_re in _ITEM_PATTERN_RES:
+        if pattern_re.search(t):
+            return section
 
     return None
 
@@ -315,8 +365,7 @@ def is_regulated_pricing_item(description: str) -> bool:
     """
     if not description:
         return False
-    t = description.lower().strip()
-    return any(kw in t for kw in REGULATED_PRICING_KEYWORDS)
+    return _REGULATED_PRICING_RE.search(description) is not None
 
 
 def get_category_for_item(
@@ -13,10 +13,12 @@ Design principles:
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.extraction.regex_utils import compile_any
+
 
 # =============================================================================
 # Zone Boundary Patterns
@@ -87,6 +89,22 @@ SECTION_HEADER_PATTERNS = [
     r"^\s*[-=]*\s*(administrative|admin|registration)\s*[-=]*\s*$",
 ]
 
+# Each pattern list compiled into a single case-insensitive regex (one scan
+# per line, no lower()/upper() copy of the line needed)
+_TABLE_START_RE = compile_any(TABLE_START_PATTERNS)
+_PAYMENT_ZONE_RE = compile_any(PAYMENT_ZONE_PATTERNS)
+_HEADER_LABEL_RE = compile_any(HEADER_LABEL_PATTERNS)
+_SECTION_HEADER_RE = compile_any(SECTION_HEADER_PATTERNS)
+
+# Every HEADER_LABEL_PATTERNS entry is anchored at a line starting with one of
+# these words, so other (ASCII) lines can be rejected without the regex
+_HEADER_LABEL_PREFIXES = (
+    "patient", "name", "mrn", "uhid", "gender", "age", "date", "dob",
+    "address", "phone", "mobile", "contact", "bill", "invoice", "hospital",
+    "clinic", "consultant", "doctor", "dr", "visit", "admission", "discharge",
+    "gstin", "reg",
+)
+
 
 @dataclass
 class ZoneBoundary:
@@ -123,32 +141,33 @@ def is_table_start(text: str) -> bool:
     """Check if text indicates start of item table."""
     if not text:
         return False
-    t = text.lower().strip()
-    return any(re.search(p, t, re.IGNORECASE) for p in TABLE_START_PATTERNS)
+    return _TABLE_START_RE.search(text.strip()) is not None
 
 
 def is_payment_zone(text: str) -> bool:
     """Check if text indicates payment zone."""
     if not text:
         return False
-    t = text.upper().strip()
-    return any(re.search(p, t, re.IGNORECASE) for p in PAYMENT_ZONE_PATTERNS)
+    return _PAYMENT_ZONE_RE.search(text.strip()) is not None
 
 
+@lru_cache(maxsize=4096)
 def is_header_label(text: str) -> bool:
-    """Check if text is a header label (not an item)."""
+    """Check if text is a header label (not an item). Cached per line text."""
     if not text:
         return False
-    t = text.lower().strip()
-    return any(re.search(p, t, re.IGNORECASE) for p in HEADER_LABEL_PATTERNS)
+    t = text.strip()
+    # Non-ASCII text skips the gate: IGNORECASE folds some letters lower() does not
+    if t.isascii() and not t.lower().startswith(_HEADER_LABEL_PREFIXES):
+        return False
+    return _HEADER_LABEL_RE.search(t) is not None
 
 
 def is_section_header(text: str) -> bool:
     """Check if text is a section header."""
     if not text:
         return False
-    t = text.lower().strip()
-    return any(re.search(p, t, re.IGNORECASE) for p in SECTION_HEADER_PATTERNS)
+    return _SECTION_HEADER_RE.search(text.strip()) is not None
 
 
 def detect_zones_for_page(lines: List[Dict[str, Any]], page: int) -> PageZones:
@@ -167,24 +186,26 @@ def detect_zones_for_page(lines: List[Dict[str, Any]], page: int) -> PageZones:
     page_lines_sorted = sorted(page_lines, key=_get_y)
 
     for line in page_lines_sorted:
-        text = (line.get("text") or "").strip()
-        y = _get_y(line)
+        _update_zones(zones, (line.get("text") or "").strip(), _get_y(line))
 
-        # Detect header end (table start)
-        if zones.header_end_y is None and is_table_start(text):
-            zones.header_end_y = y
+    return zones
 
-        # Detect payment zone start
-        if zones.payment_start_y is None and is_payment_zone(text):
-            zones.payment_start_y = y
 
-        # Detect section headers
-        if is_section_header(text):
-            section = _classify_section(text)
-            if section:
-                zones.section_headers.append((y, section))
+def _update_zones(zones: PageZones, text: str, y: float) -> None:
+    """Apply one line (in Y order) to its page's zone boundaries."""
+    # Detect header end (table start)
+    if zones.header_end_y is None and is_table_start(text):
+        zones.header_end_y = y
 
-    return zones
+    # Detect payment zone start
+    if zones.payment_start_y is None and is_payment_zone(text):
+        zones.payment_start_y = y
+
+    # Detect section headers
+    if is_section_header(text):
+        section = _classify_section(text)
+        if section:
+            zones.section_headers.append((y, section))
 
 
 def detect_all_zones(lines: List[Dict[str, Any]]) -> Dict[int, PageZones]:
@@ -196,15 +217,20 @@ def detect_all_zones(lines: List[Dict[str, Any]]) -> Dict[int, PageZones]:
     Returns:
         Dict mapping page number to PageZones
     """
-    # Group by page
-    pages: Dict[int, List[Dict[str, Any]]] = {}
-    for line in lines:
-        p = int(line.get("page", 0) or 0)
-        pages.setdefault(p, []).append(line)
+    # One walk in (page, y) order instead of grouping, filtering and sorting
+    # per page. Decorated once so Y is computed a single time per line; the
+    # sort is stable and near-free when callers pass lines already sorted.
+    keyed = sorted(
+        ((int(line.get("page", 0) or 0), _get_y(line), i, line) for i, line in enumerate(lines)),
+        key=lambda entry: entry[:3],
+    )
 
     zones: Dict[int, PageZones] = {}
-    for page, page_lines in pages.items():
-        zones[page] = detect_zones_for_page(page_lines, page)
+    for page, y, _, line in keyed:
+        page_zones = zones.get(page)
+        if page_zones is None:
+            page_zones = zones[page] = PageZones(page=page)
+        _update_zones(page_zones, (line.get("text") or "").strip(), y)
 
     return zones
 
@@ -1,10 +1,14 @@
 import os
+import shutil
 import uuid
 from typing import BinaryIO
 
 
 BASE_UPLOAD_DIR = "uploads"
 
+# Chunk size for streaming uploads to disk
+COPY_CHUNK_SIZE = 1 << 20
+
 
 def ensure_upload_dir() -> None:
     """
@@ -27,7 +31,8 @@ def save_uploaded_file(file: BinaryIO, original_filename: str) -> str:
     unique_filename = f"{uuid.uuid4()}{file_extension}"
     file_path = os.path.join(BASE_UPLOAD_DIR, unique_filename)
 
+    # Stream in chunks so large uploads (spooled to disk by FastAPI) are never read whole
     with open(file_path, "wb") as buffer:
-        buffer.write(file.read())
+        shutil.copyfileobj(file, buffer, COPY_CHUNK_SIZE)
 
     return file_path
@@ -30,7 +30,7 @@ from app.verifier.embedding_service import (
 )
 from app.verifier.embedding_cache import EmbeddingCache, get_embedding_cache
 from app.verifier.matcher import SemanticMatcher, get_matcher
-from app.verifier.price_checker import check_price, calculate_allowed_amount
+from app.verifier.price_checker import check_price, check_prices_bulk, calculate_allowed_amount
 from app.verifier.verifier import BillVerifier, get_verifier, load_all_tieups
 
 __all__ = [
@@ -58,6 +58,7 @@ __all__ = [
     "SemanticMatcher",
     "get_matcher",
     "check_price",
+    "check_prices_bulk",
     "calculate_allowed_amount",
     "BillVerifier",
     "get_verifier",
@@ -15,6 +15,9 @@ Usage:
 Environment Variables:
     EMBEDDING_MODEL: Model name (default: BAAI/bge-base-en-v1.5)
     EMBEDDING_DEVICE: Device to use (default: cpu)
+    EMBEDDING_BACKEND: Inference backend - torch, onnx or openvino (default: torch)
+    EMBEDDING_MODEL_FILE: Model file for non-torch backends, e.g. an int8
+        quantized export such as onnx/model_qint8_avx512_vnni.onnx
     EMBEDDING_CACHE_PATH: Path to cache file (default: data/embedding_cache.json)
 """
 
@@ -61,6 +64,7 @@ class EmbeddingServiceError(Exception):
 # Default embedding model (must be valid Hugging Face identifier)
 DEFAULT_EMBEDDING_MODEL = "BAAI/bge-base-en-v1.5"
 DEFAULT_EMBEDDING_DIMENSION = 768  # Dimension for BAAI/bge-base-en-v1.5
+DEFAULT_EMBEDDING_BACKEND = "torch"
 
 
 # =============================================================================
@@ -85,6 +89,8 @@ class EmbeddingService:
         model_name: Optional[str] = None,
         cache: Optional[EmbeddingCache] = None,
         device: Optional[str] = None,
+        backend: Optional[str] = None,
+        model_file: Optional[str] = None,
     ):
         """
         Initialize the local embedding service.
@@ -93,11 +99,17 @@ class EmbeddingService:
             model_name: Model name (defaults to EMBEDDING_MODEL env var)
             cache: EmbeddingCache instance (uses global singleton if None)
             device: Device to run model on ('cpu', 'cuda', or None for auto)
+            backend: Inference backend ('torch', 'onnx', 'openvino');
+                     defaults to EMBEDDING_BACKEND env var
+            model_file: Model file to load for non-torch backends (e.g. an int8
+                        quantized ONNX export); defaults to EMBEDDING_MODEL_FILE
         """
         # Configuration from env vars with defaults
         # IMPORTANT: Model name must be a valid Hugging Face identifier
         self.model_name = model_name or os.getenv("EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL)
         self.device = device or os.getenv("EMBEDDING_DEVICE", "cpu")
+        self.backend = backend or os.getenv("EMBEDDING_BACKEND", DEFAULT_EMBEDDING_BACKEND)
+        self.model_file = model_file or os.getenv("EMBEDDING_MODEL_FILE")
         
         # Use persistent cache (global singleton by default)
         self._cache = cache or get_embedding_cache()
@@ -115,7 +127,8 @@ class EmbeddingService:
         atexit.register(self._save_cache_on_exit)
         
         logger.info(
-            f"EmbeddingService initialized: model={self.model_name}, device={self.device}"
+            f"EmbeddingService initialized: model={self.model_name}, "
+            f"device={self.device}, backend={self.backend}"
         )
     
     def _get_model(self) -> Optional[SentenceTransformer]:
@@ -135,7 +148,9 @@ class EmbeddingService:
                 logger.info(f"This may take a few moments on first run (model download)...")
                 
                 # Load model with explicit error handling
-                self._model = SentenceTransformer(self.model_name, device=self.device)
+                self._model = SentenceTransformer(
+                    self.model_name, device=self.device, **self._backend_kwargs()
+                )
                 
                 # Validate and get embedding dimension explicitly
                 self._dimension = self._model.get_sentence_embedding_dimension()
@@ -172,6 +187,23 @@ class EmbeddingService:
         
         return self._model
     
+    def _backend_kwargs(self) -> dict:
+        """
+        Extra SentenceTransformer arguments for the configured backend.
+        
+        The default torch backend passes nothing, so older sentence-transformers
+        releases (without the ``backend`` argument) keep working.
+        """
+        if self.backend == DEFAULT_EMBEDDING_BACKEND:
+            return {}
+        
+        kwargs = {"backend": self.backend}
+        if self.model_file:
+            # e.g. onnx/model_qint8_avx512_vnni.onnx for int8 CPU inference
+            kwargs["model_kwargs"] = {"file_name": self.model_file}
+        logger.info(f"Using {self.backend} backend (model file: {self.model_file or 'default'})")
+        return kwargs
+    
     @property
     def dimension(self) -> int:
         """Get embedding dimension."""
@@ -14,10 +14,13 @@ Implements the 6-layer matching strategy:
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Optional, List, Tuple, Dict
 from dataclasses import dataclass
 from enum import Enum
 
+from app.verifier.medical_core_extractor_v2 import MedicalCoreResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +38,7 @@ class CategoryMatchingConfig:
     require_bodypart_match: bool = False
     allow_partial_match: bool = False
     hard_boundaries: List[str] = None
+    auto_accept_similarity: float = 0.95   # Top-1 semantic score accepted without re-ranking
     
     def __post_init__(self):
         if self.hard_boundaries is None:
@@ -101,6 +105,9 @@ DEFAULT_CONFIG = CategoryMatchingConfig(
     allow_partial_match=True
 )
 
+# Drugs where form (injection vs tablet) changes what is billed
+CRITICAL_FORM_DRUGS = ('insulin', 'epinephrine', 'adrenaline')
+
 
 def get_category_config(category_name: str) -> CategoryMatchingConfig:
     """
@@ -195,55 +202,112 @@ def validate_hard_constraints(
     if not allowed:
         return False, f"CATEGORY_BOUNDARY: {reason}"
     
-    # Check dosage match (if required)
-    if config.require_dosage_match:
-        bill_dosage = bill_metadata.get('dosage')
-        tieup_dosage = tieup_metadata.get('dosage')
-        
-        if bill_dosage and tieup_dosage:
-            # Normalize dosages for comparison
-            from app.verifier.medical_core_extractor_v2 import MedicalCoreResult
-            
-            bill_norm = MedicalCoreResult._normalize_dosage(bill_dosage)
-            tieup_norm = MedicalCoreResult._normalize_dosage(tieup_dosage)
-            
-            if bill_norm != tieup_norm:
-                return False, f"DOSAGE_MISMATCH: {bill_dosage} ≠ {tieup_dosage}"
+    bill_dosage = bill_metadata.get('dosage')
+    tieup_dosage = tieup_metadata.get('dosage')
+    
+    reason = _check_medical_constraints(
+        bill_dosage=bill_dosage,
+        bill_dosage_norm=MedicalCoreResult._normalize_dosage(bill_dosage) if bill_dosage else None,
+        bill_form=bill_metadata.get('form'),
+        bill_modality=bill_metadata.get('modality'),
+        bill_bodypart=bill_metadata.get('body_part'),
+        bill_core=bill_metadata.get('core_text', ''),
+        tieup_dosage=tieup_dosage,
+        tieup_dosage_norm=MedicalCoreResult._normalize_dosage(tieup_dosage) if tieup_dosage else None,
+        tieup_form=tieup_metadata.get('form'),
+        tieup_modality=tieup_metadata.get('modality'),
+        tieup_bodypart=tieup_metadata.get('body_part'),
+        config=config,
+    )
+    if reason is not None:
+        return False, reason
     
-    # Check form awareness (if required)
-    if config.require_form_awareness:
-        bill_form = bill_metadata.get('form')
-        tieup_form = tieup_metadata.get('form')
-        
-        # Only enforce if both have forms
-        if bill_form and tieup_form:
-            # For certain drugs (insulin, epinephrine), form matters
-            critical_form_drugs = ['insulin', 'epinephrine', 'adrenaline']
-            bill_core = bill_metadata.get('core_text', '').lower()
-            
-            is_critical = any(drug in bill_core for drug in critical_form_drugs)
-            
-            if is_critical and bill_form != tieup_form:
-                return False, f"FORM_MISMATCH: {bill_form} ≠ {tieup_form} (critical drug)"
+    # All constraints passed
+    return True, None
+
+
+def check_medical_constraints(
+    bill_result: MedicalCoreResult,
+    tieup_result: MedicalCoreResult,
+    config: CategoryMatchingConfig
+) -> Optional[str]:
+    """
+    Check per-item hard constraints between two extracted medical cores.
     
+    Returns:
+        Rejection reason, or None if all constraints pass
+    """
+    return _check_medical_constraints(
+        bill_dosage=bill_result.dosage,
+        bill_dosage_norm=bill_result.dosage_norm,
+        bill_form=bill_result.form,
+        bill_modality=bill_result.modality,
+        bill_bodypart=bill_result.body_part,
+        bill_core=bill_result.core_text,
+        tieup_dosage=tieup_result.dosage,
+        tieup_dosage_norm=tieup_result.dosage_norm,
+        tieup_form=tieup_result.form,
+        tieup_modality=tieup_result.modality,
+        tieup_bodypart=tieup_result.body_part,
+        config=config,
+    )
+
+
+def _check_medical_constraints(
+    bill_dosage: Optional[str],
+    bill_dosage_norm: Optional[str],
+    bill_form: Optional[str],
+    bill_modality: Optional[str],
+    bill_bodypart: Optional[str],
+    bill_core: str,
+    tieup_dosage: Optional[str],
+    tieup_dosage_norm: Optional[str],
+    tieup_form: Optional[str],
+    tieup_modality: Optional[str],
+    tieup_bodypart: Optional[str],
+    config: CategoryMatchingConfig
+) -> Optional[str]:
+    """
+    Check dosage/form/modality/body-part constraints on already-extracted fields.
+    
+    Checks run cheapest first and return on the first failure: modality and
+    body part are plain equality tests on interned keywords, dosage compares
+    pre-normalized keys, and the form check only scans the core text for
+    critical drugs once the forms are known to differ. No built-in category
+    requires both the drug (dosage/form) and diagnostic (modality/body part)
+    constraints, so the order does not change which reason is reported.
+    
+    Dosages are compared on their pre-normalized form; the raw values are
+    only used in the rejection message.
+    
+    Returns:
+        Rejection reason, or None if all constraints pass
+    """
     # Check modality match (if required)
     if config.require_modality_match:
-        bill_modality = bill_metadata.get('modality')
-        tieup_modality = tieup_metadata.get('modality')
-        
         if bill_modality and tieup_modality and bill_modality != tieup_modality:
-            return False, f"MODALITY_MISMATCH: {bill_modality} ≠ {tieup_modality}"
+            return f"MODALITY_MISMATCH: {bill_modality} ≠ {tieup_modality}"
     
     # Check body part match (if required)
     if config.require_bodypart_match:
-        bill_bodypart = bill_metadata.get('body_part')
-        tieup_bodypart = tieup_metadata.get('body_part')
-        
         if bill_bodypart and tieup_bodypart and bill_bodypart != tieup_bodypart:
-            return False, f"BODYPART_MISMATCH: {bill_bodypart} ≠ {tieup_bodypart}"
+            return f"BODYPART_MISMATCH: {bill_bodypart} ≠ {tieup_bodypart}"
     
-    # All constraints passed
-    return True, None
+    # Check dosage match (if required)
+    if config.require_dosage_match and bill_dosage and tieup_dosage:
+        if bill_dosage_norm != tieup_dosage_norm:
+            return f"DOSAGE_MISMATCH: {bill_dosage} ≠ {tieup_dosage}"
+    
+    # Check form awareness (if required)
+    # Only enforce if both have forms and they differ
+    if config.require_form_awareness and bill_form and tieup_form and bill_form != tieup_form:
+        # For certain drugs (insulin, epinephrine), form matters
+        bill_core = (bill_core or '').lower()
+        
+        if any(drug in bill_core for drug in CRITICAL_FORM_DRUGS):
+            return f"FORM_MISMATCH: {bill_form} ≠ {tieup_form} (critical drug)"
+    
+    return None
 
 
 # =============================================================================
@@ -256,8 +320,9 @@ def calculate_hybrid_score_v3(
     semantic_similarity: float,
     bill_metadata: Dict,
     tieup_metadata: Dict,
-    category: str
-) -> Tuple[float, Dict]:
+    category: str,
+    return_breakdown: bool = True
+) -> Tuple[float, Optional[Dict]]:
     """
     Calculate hybrid score with medical domain knowledge.
     
@@ -273,15 +338,39 @@ def calculate_hybrid_score_v3(
         bill_metadata: Bill item metadata
         tieup_metadata: Tie-up item metadata
         category: Category name
+        return_breakdown: Build the breakdown dict (False when ranking
+                          candidates and only the score is compared)
         
     Returns:
-        Tuple of (final_score, breakdown_dict)
+        Tuple of (final_score, breakdown_dict or None)
     """
+    return _hybrid_score(bill_text, tieup_text, semantic_similarity, return_breakdown)
+
+
+def _hybrid_score(
+    bill_text: str,
+    tieup_text: str,
+    semantic_similarity: float,
+    return_breakdown: bool = True
+) -> Tuple[float, Optional[Dict]]:
+    """Weighted semantic/medical-anchor/token-overlap score shared by Layer 4 callers."""
     from app.verifier.partial_matcher import calculate_token_overlap
-    from app.verifier.medical_anchors import calculate_medical_anchor_score
+    from app.verifier.medical_anchors import (
+        calculate_medical_anchor_score,
+        medical_anchor_score,
+    )
     
-    # Calculate components
     token_overlap = calculate_token_overlap(bill_text, tieup_text)
+    
+    if not return_breakdown:
+        final_score = (
+            0.50 * semantic_similarity +
+            0.30 * medical_anchor_score(bill_text, tieup_text) +
+            0.20 * token_overlap
+        )
+        return final_score, None
+    
+    # Calculate components
     medical_score, medical_breakdown = calculate_medical_anchor_score(bill_text, tieup_text)
     
     # Weighted combination
@@ -303,6 +392,63 @@ def calculate_hybrid_score_v3(
     return final_score, breakdown
 
 
+# =============================================================================
+# Layer 2 + 4: Fused Validation and Scoring
+# =============================================================================
+
+def validate_and_score(
+    bill_result: MedicalCoreResult,
+    tieup_result: MedicalCoreResult,
+    semantic_similarity: float,
+    category: str,
+    config: CategoryMatchingConfig,
+    tieup_category: Optional[str] = None,
+    return_breakdown: bool = True
+) -> Tuple[bool, Optional[str], float, Optional[Dict]]:
+    """
+    Validate hard constraints and compute the hybrid score in one pass.
+    
+    Equivalent to validate_hard_constraints() followed by
+    calculate_hybrid_score_v3(), but reads the already-extracted fields of
+    both MedicalCoreResult objects directly instead of rebuilding metadata
+    dicts for every candidate, and skips scoring entirely on rejection.
+    Unlike validate_hard_constraints(), the category boundary is checked
+    after the per-item constraints since it is the most expensive test.
+    
+    Args:
+        bill_result: Extracted medical core of the bill item
+        tieup_result: Extracted medical core of the tie-up candidate
+        semantic_similarity: Embedding similarity score
+        category: Bill category name
+        config: Category matching configuration
+        tieup_category: Tie-up category (defaults to ``category``; candidates
+            from the same category index never cross a boundary)
+        return_breakdown: Build the score breakdown dict (see
+            calculate_hybrid_score_v3)
+        
+    Returns:
+        Tuple of (valid, rejection_reason, final_score, breakdown).
+        On rejection the score is 0.0 and the breakdown is None.
+    """
+    reason = check_medical_constraints(bill_result, tieup_result, config)
+    if reason is not None:
+        return False, reason, 0.0, None
+    
+    # Category boundary last: it resolves both category groups by name
+    if tieup_category is not None and tieup_category != category:
+        from app.verifier.category_enforcer import check_category_boundary
+        
+        allowed, reason = check_category_boundary(category, tieup_category, 1.0)
+        if not allowed:
+            return False, f"CATEGORY_BOUNDARY: {reason}", 0.0, None
+    
+    final_score, breakdown = _hybrid_score(
+        bill_result.core_text, tieup_result.core_text, semantic_similarity,
+        return_breakdown
+    )
+    return True, None, final_score, breakdown
+
+
 # =============================================================================
 # Layer 5: Confidence Calibration
 # =============================================================================
@@ -322,6 +468,10 @@ def calibrate_confidence(
     """
     Calibrate confidence and make match decision.
     
+    Only the category's thresholds are cached (a bill has a handful of
+    categories, so they are resolved once per category name); the decision
+    itself is a few comparisons on the score.
+    
     Args:
         final_score: Hybrid score
         category: Category name
@@ -330,35 +480,50 @@ def calibrate_confidence(
     Returns:
         Tuple of (decision, calibrated_confidence)
     """
-    config = get_category_config(category)
-    
-    # High confidence threshold
-    HIGH_CONFIDENCE = 0.80
-    
+    medical_score = breakdown.get('medical_anchors', 0.0) if breakdown else 0.0
+    category_threshold, llm_threshold = _calibration_thresholds(category)
+    return _calibrate_decision(
+        final_score, medical_score, category_threshold, llm_threshold
+    ), final_score
+
+
+@lru_cache(maxsize=256)
+def _calibration_thresholds(category: str) -> Tuple[float, float]:
+    """Category and LLM-verification thresholds for a category name."""
     # Category-specific threshold
-    category_threshold = config.semantic_threshold
+    category_threshold = get_category_config(category).semantic_threshold
     
     # LLM verification threshold (10% below category threshold)
-    llm_threshold = category_threshold - 0.10
+    return category_threshold, category_threshold - 0.10
+
+
+def _calibrate_decision(
+    final_score: float,
+    medical_score: float,
+    category_threshold: float,
+    llm_threshold: float
+) -> MatchDecision:
+    """Decision logic behind calibrate_confidence()."""
+    # High confidence threshold
+    HIGH_CONFIDENCE = 0.80
     
     # Decision logic
     if final_score >= HIGH_CONFIDENCE:
-        return MatchDecision.AUTO_MATCH, final_score
+        return MatchDecision.AUTO_MATCH
     elif final_score >= category_threshold:
         # Check if medical anchors are strong
-        medical_score = breakdown.get('medical_anchors', 0.0)
         if medical_score >= 0.7:
             # Strong medical match, auto-accept
-            return MatchDecision.AUTO_MATCH, final_score
+            return MatchDecision.AUTO_MATCH
         else:
             # Borderline, use LLM
-            return MatchDecision.LLM_VERIFY, final_score
+            return MatchDecision.LLM_VERIFY
     elif final_score >= llm_threshold:
         # Borderline case, use LLM
-        return MatchDecision.LLM_VERIFY, final_score
+        return MatchDecision.LLM_VERIFY
     else:
         # Low confidence, reject
-        return MatchDecision.REJECT, final_score
+        return MatchDecision.REJECT
 
 
 # =============================================================================
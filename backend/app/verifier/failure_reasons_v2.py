@@ -14,7 +14,7 @@ Improvements over V1:
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -105,86 +105,135 @@ def determine_failure_reason_v2(
         ... )
         (FailureReasonV2.DOSAGE_MISMATCH, "Drug name matches but dosage differs: 500mg vs 650mg")
     """
-    
+
+    reason, explanation = _classify_failure(
+        best_candidate=best_candidate,
+        best_similarity=best_similarity,
+        bill_key=_metadata_key(bill_metadata),
+        tieup_key=_metadata_key(tieup_metadata),
+        is_package=is_package,
+        is_admin=is_admin,
+        category_conflict=category_conflict,
+        threshold=threshold,
+        min_similarity=min_similarity,
+    )
+    logger.debug(f"Item '{item_name}' classified as {reason.value}")
+    return reason, explanation
+
+
+# Metadata fields consulted by the mismatch checks, in priority order
+_METADATA_FIELDS = ('dosage', 'form', 'modality', 'body_part')
+
+
+def _metadata_key(metadata: Optional[dict]) -> Optional[Tuple[Optional[str], ...]]:
+    """Reduce a metadata dict to a hashable tuple of the fields we compare."""
+    if not metadata:
+        return None
+    return tuple(metadata.get(field) for field in _METADATA_FIELDS)
+
+
+def _classify_failure(
+    best_candidate: Optional[str],
+    best_similarity: float,
+    bill_key: Optional[Tuple[Optional[str], ...]],
+    tieup_key: Optional[Tuple[Optional[str], ...]],
+    is_package: bool,
+    is_admin: bool,
+    category_conflict: bool,
+    threshold: float,
+    min_similarity: float,
+) -> Tuple[FailureReasonV2, str]:
+    """
+    Priority logic behind determine_failure_reason_v2(), on the metadata
+    fields it compares rather than the full metadata dicts.
+    """
     # Priority 1: Administrative/Artifact items
     if is_admin:
-        logger.debug(f"Item '{item_name}' classified as ADMIN_CHARGE")
         return FailureReasonV2.ADMIN_CHARGE, "Administrative charge or OCR artifact"
     
     # Priority 2: Package-only items
     if is_package:
-        logger.debug(f"Item '{item_name}' classified as PACKAGE_ONLY")
         return FailureReasonV2.PACKAGE_ONLY, "Item only exists as part of a package"
     
     # Priority 3: Wrong category (hard boundary violation)
     if category_conflict and best_similarity >= threshold:
-        # Check if it's a hard boundary violation
-        from app.verifier.category_enforcer import check_category_boundary
-        # This would require knowing the matched category, simplified for now
-        logger.debug(f"Item '{item_name}' classified as WRONG_CATEGORY")
         return FailureReasonV2.WRONG_CATEGORY, "Item found in incompatible category"
     
     # Priority 4-7: Specific medical mismatches (if metadata available)
-    if bill_metadata and tieup_metadata and best_candidate:
+    if bill_key and tieup_key and best_candidate:
+        bill_dosage, bill_form, bill_modality, bill_bodypart = bill_key
+        tieup_dosage, tieup_form, tieup_modality, tieup_bodypart = tieup_key
+        
         # Dosage mismatch
-        if bill_metadata.get('dosage') and tieup_metadata.get('dosage'):
-            if bill_metadata['dosage'] != tieup_metadata['dosage']:
-                explanation = (
-                    f"Drug name matches '{best_candidate}' but dosage differs: "
-                    f"{bill_metadata['dosage']} vs {tieup_metadata['dosage']}"
-                )
-                logger.debug(f"Item '{item_name}' classified as DOSAGE_MISMATCH")
-                return FailureReasonV2.DOSAGE_MISMATCH, explanation
+        if bill_dosage and tieup_dosage and bill_dosage != tieup_dosage:
+            return FailureReasonV2.DOSAGE_MISMATCH, (
+                f"Drug name matches '{best_candidate}' but dosage differs: "
+                f"{bill_dosage} vs {tieup_dosage}"
+            )
         
         # Form mismatch
-        if bill_metadata.get('form') and tieup_metadata.get('form'):
-            if bill_metadata['form'] != tieup_metadata['form']:
-                explanation = (
-                    f"Drug name matches '{best_candidate}' but form differs: "
-                    f"{bill_metadata['form']} vs {tieup_metadata['form']}"
-                )
-                logger.debug(f"Item '{item_name}' classified as FORM_MISMATCH")
-                return FailureReasonV2.FORM_MISMATCH, explanation
+        if bill_form and tieup_form and bill_form != tieup_form:
+            return FailureReasonV2.FORM_MISMATCH, (
+                f"Drug name matches '{best_candidate}' but form differs: "
+                f"{bill_form} vs {tieup_form}"
+            )
         
         # Modality mismatch
-        if bill_metadata.get('modality') and tieup_metadata.get('modality'):
-            if bill_metadata['modality'] != tieup_metadata['modality']:
-                explanation = (
-                    f"Diagnostic modality differs: "
-                    f"{bill_metadata['modality']} vs {tieup_metadata['modality']}"
-                )
-                logger.debug(f"Item '{item_name}' classified as MODALITY_MISMATCH")
-                return FailureReasonV2.MODALITY_MISMATCH, explanation
+        if bill_modality and tieup_modality and bill_modality != tieup_modality:
+            return FailureReasonV2.MODALITY_MISMATCH, (
+                f"Diagnostic modality differs: {bill_modality} vs {tieup_modality}"
+            )
         
         # Body part mismatch
-        if bill_metadata.get('body_part') and tieup_metadata.get('body_part'):
-            if bill_metadata['body_part'] != tieup_metadata['body_part']:
-                explanation = (
-                    f"Body part differs: "
-                    f"{bill_metadata['body_part']} vs {tieup_metadata['body_part']}"
-                )
-                logger.debug(f"Item '{item_name}' classified as BODYPART_MISMATCH")
-                return FailureReasonV2.BODYPART_MISMATCH, explanation
+        if bill_bodypart and tieup_bodypart and bill_bodypart != tieup_bodypart:
+            return FailureReasonV2.BODYPART_MISMATCH, (
+                f"Body part differs: {bill_bodypart} vs {tieup_bodypart}"
+            )
     
     # Priority 8: Category conflict (exists in other category)
     if category_conflict:
-        explanation = f"Item found in different category with similarity {best_similarity:.2f}"
-        logger.debug(f"Item '{item_name}' classified as CATEGORY_CONFLICT")
-        return FailureReasonV2.CATEGORY_CONFLICT, explanation
+        return FailureReasonV2.CATEGORY_CONFLICT, (
+            f"Item found in different category with similarity {best_similarity:.2f}"
+        )
     
     # Priority 9: Low similarity
     if best_similarity >= min_similarity and best_similarity < threshold:
-        explanation = (
+        return FailureReasonV2.LOW_SIMILARITY, (
             f"Best match '{best_candidate}' below threshold "
             f"(similarity={best_similarity:.2f} < {threshold})"
         )
-        logger.debug(f"Item '{item_name}' classified as LOW_SIMILARITY")
-        return FailureReasonV2.LOW_SIMILARITY, explanation
     
     # Priority 10: Not in tie-up (default)
-    explanation = f"No close match found (best similarity={best_similarity:.2f})"
-    logger.debug(f"Item '{item_name}' classified as NOT_IN_TIEUP")
-    return FailureReasonV2.NOT_IN_TIEUP, explanation
+    return FailureReasonV2.NOT_IN_TIEUP, (
+        f"No close match found (best similarity={best_similarity:.2f})"
+    )
+
+
+# Constraint rejection prefixes (see enhanced_matcher) -> failure reason
+_CONSTRAINT_REASONS = {
+    'DOSAGE_MISMATCH': FailureReasonV2.DOSAGE_MISMATCH,
+    'FORM_MISMATCH': FailureReasonV2.FORM_MISMATCH,
+    'CATEGORY_BOUNDARY': FailureReasonV2.WRONG_CATEGORY,
+    'MODALITY_MISMATCH': FailureReasonV2.MODALITY_MISMATCH,
+    'BODYPART_MISMATCH': FailureReasonV2.BODYPART_MISMATCH,
+}
+
+
+def failure_reason_from_constraint(constraint_reason: str) -> FailureReasonV2:
+    """
+    Map a hard-constraint rejection message to its failure reason.
+    
+    Constraint messages have the form "<PREFIX>: <details>", so the prefix
+    is looked up directly instead of substring-searching the message.
+    
+    Args:
+        constraint_reason: Rejection message from constraint validation
+        
+    Returns:
+        FailureReasonV2 enum value (LOW_SIMILARITY if the prefix is unknown)
+    """
+    prefix = constraint_reason.partition(':')[0]
+    return _CONSTRAINT_REASONS.get(prefix, FailureReasonV2.LOW_SIMILARITY)
 
 
 def get_failure_reason_description_v2(reason: FailureReasonV2) -> str:
@@ -13,8 +13,9 @@ Provides complete financial breakdown for audit and reporting.
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from app.verifier.models import VerificationStatus
 from app.verifier.models_v2 import (
@@ -27,6 +28,140 @@ from app.verifier.models_v2 import (
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Vectorized Rollup
+# =============================================================================
+
+_STATUSES = list(VerificationStatus)
+_STATUS_INDEX = {status: i for i, status in enumerate(_STATUSES)}
+
+# Statuses whose bill amount lands in the unclassified bucket (MISMATCH is legacy)
+_UNCLASSIFIED_STATUSES = (VerificationStatus.UNCLASSIFIED, VerificationStatus.MISMATCH)
+_UNCLASSIFIED_MASK = np.array(
+    [status in _UNCLASSIFIED_STATUSES for status in _STATUSES], dtype=np.float64
+)
+
+# Column order of the per-item amount matrix
+_BILL, _ALLOWED, _EXTRA = 0, 1, 2
+
+
+def _rollup(
+    aggregated_items: List[AggregatedItem],
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encode aggregated items as arrays for vectorized totals.
+    
+    One Python pass pulls the amounts, category and status of every item;
+    all sums and counts are then done with NumPy.
+    
+    Returns:
+        (categories, amounts, category_ids, status_ids)
+        - categories: category names in first-seen order
+        - amounts: (n, 3) float64 matrix of bill/allowed/extra totals
+        - category_ids: index into ``categories`` per item
+        - status_ids: index into the VerificationStatus members per item
+    """
+    category_index: Dict[str, int] = {}
+    count = len(aggregated_items)
+    
+    amounts = np.array(
+        [(item.total_bill, item.total_allowed, item.total_extra) for item in aggregated_items],
+        dtype=np.float64,
+    ).reshape(count, 3)
+    category_ids = np.fromiter(
+        (category_index.setdefault(item.category, len(category_index)) for item in aggregated_items),
+        dtype=np.intp,
+        count=count,
+    )
+    status_ids = np.fromiter(
+        (_STATUS_INDEX[item.status] for item in aggregated_items),
+        dtype=np.intp,
+        count=count,
+    )
+    
+    return list(category_index), amounts, category_ids, status_ids
+
+
+def _category_totals_from_rollup(
+    categories: List[str],
+    amounts: np.ndarray,
+    category_ids: np.ndarray,
+    status_ids: np.ndarray,
+) -> List[CategoryTotals]:
+    """Per-category sums and status counts via np.bincount."""
+    n_categories = len(categories)
+    n_statuses = len(_STATUSES)
+    
+    def per_category(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(category_ids, weights=weights, minlength=n_categories)
+    
+    bill = per_category(amounts[:, _BILL])
+    allowed = per_category(amounts[:, _ALLOWED])
+    extra = per_category(amounts[:, _EXTRA])
+    unclassified = per_category(amounts[:, _BILL] * _UNCLASSIFIED_MASK[status_ids])
+    
+    # (category, status) count matrix
+    counts = np.bincount(
+        category_ids * n_statuses + status_ids,
+        minlength=n_categories * n_statuses,
+    ).reshape(n_categories, n_statuses)
+    
+    def count_of(status: VerificationStatus) -> np.ndarray:
+        return counts[:, _STATUS_INDEX[status]]
+    
+    green = count_of(VerificationStatus.GREEN)
+    red = count_of(VerificationStatus.RED)
+    mismatch = count_of(VerificationStatus.MISMATCH)
+    ignored = count_of(VerificationStatus.IGNORED_ARTIFACT)
+    unclassified_count = count_of(VerificationStatus.UNCLASSIFIED)
+    
+    return [
+        CategoryTotals(
+            category=category,
+            total_bill=float(bill[i]),
+            total_allowed=float(allowed[i]),
+            total_extra=float(extra[i]),
+            total_unclassified=float(unclassified[i]),  # Phase-8+: Third financial bucket
+            green_count=int(green[i]),
+            red_count=int(red[i]),
+            mismatch_count=int(mismatch[i]),
+            ignored_count=int(ignored[i]),
+            unclassified_count=int(unclassified_count[i]),  # Phase-8+
+        )
+        for i, category in enumerate(categories)
+    ]
+
+
+def _grand_totals_from_rollup(
+    amounts: np.ndarray,
+    status_ids: np.ndarray,
+) -> GrandTotals:
+    """Bill-wide sums and status counts via np.bincount."""
+    n_statuses = len(_STATUSES)
+    totals = amounts.sum(axis=0)
+    bill_by_status = np.bincount(status_ids, weights=amounts[:, _BILL], minlength=n_statuses)
+    count_by_status = np.bincount(status_ids, minlength=n_statuses)
+    
+    def bill_of(*statuses: VerificationStatus) -> float:
+        return float(sum(bill_by_status[_STATUS_INDEX[s]] for s in statuses))
+    
+    def count_of(*statuses: VerificationStatus) -> int:
+        return int(sum(count_by_status[_STATUS_INDEX[s]] for s in statuses))
+    
+    return GrandTotals(
+        total_bill=float(totals[_BILL]),
+        total_allowed=float(totals[_ALLOWED]),
+        total_extra=float(totals[_EXTRA]),
+        total_unclassified=bill_of(*_UNCLASSIFIED_STATUSES),  # Phase-8+
+        total_allowed_not_comparable=bill_of(VerificationStatus.ALLOWED_NOT_COMPARABLE),
+        green_count=count_of(VerificationStatus.GREEN),
+        red_count=count_of(VerificationStatus.RED),
+        mismatch_count=count_of(VerificationStatus.MISMATCH),
+        ignored_count=count_of(VerificationStatus.IGNORED_ARTIFACT),
+        unclassified_count=count_of(*_UNCLASSIFIED_STATUSES),  # Phase-8+
+    )
+
+
 # =============================================================================
 # Category Totals Calculation
 # =============================================================================
@@ -57,47 +192,8 @@ def calculate_category_totals(
         >>> medicines.red_count
         1
     """
-    category_map = defaultdict(
-        lambda: {
-            "total_bill": 0.0,
-            "total_allowed": 0.0,
-            "total_extra": 0.0,
-            "total_unclassified": 0.0,  # Phase-8+: Third financial bucket
-            "green_count": 0,
-            "red_count": 0,
-            "mismatch_count": 0,
-            "ignored_count": 0,
-            "unclassified_count": 0,  # Phase-8+
-        }
-    )
-    
-    # Aggregate by category
-    for agg_item in aggregated_items:
-        cat_data = category_map[agg_item.category]
-        cat_data["total_bill"] += agg_item.total_bill
-        cat_data["total_allowed"] += agg_item.total_allowed
-        cat_data["total_extra"] += agg_item.total_extra
-        
-        # Count by status (Phase-8+: Include UNCLASSIFIED)
-        if agg_item.status == VerificationStatus.GREEN:
-            cat_data["green_count"] += 1
-        elif agg_item.status == VerificationStatus.RED:
-            cat_data["red_count"] += 1
-        elif agg_item.status == VerificationStatus.UNCLASSIFIED:
-            cat_data["unclassified_count"] += 1
-            cat_data["total_unclassified"] += agg_item.total_bill
-        elif agg_item.status == VerificationStatus.MISMATCH:
-            # Legacy MISMATCH - treat as unclassified
-            cat_data["mismatch_count"] += 1
-            cat_data["total_unclassified"] += agg_item.total_bill
-        elif agg_item.status == VerificationStatus.IGNORED_ARTIFACT:
-            cat_data["ignored_count"] += 1
-    
-    # Convert to CategoryTotals objects
-    category_totals = [
-        CategoryTotals(category=category, **data)
-        for category, data in category_map.items()
-    ]
+    categories, amounts, category_ids, status_ids = _rollup(aggregated_items)
+    category_totals = _category_totals_from_rollup(categories, amounts, category_ids, status_ids)
     
     logger.info(f"Calculated totals for {len(category_totals)} categories")
     return category_totals
@@ -130,44 +226,8 @@ def calculate_grand_totals(aggregated_items: List[AggregatedItem]) -> GrandTotal
         >>> grand_totals.green_count
         3
     """
-    # Phase-8+: Calculate unclassified total
-    total_unclassified = sum(
-        item.total_bill
-        for item in aggregated_items
-        if item.status in (VerificationStatus.UNCLASSIFIED, VerificationStatus.MISMATCH)
-    )
-    
-    unclassified_count = sum(
-        1 for item in aggregated_items 
-        if item.status in (VerificationStatus.UNCLASSIFIED, VerificationStatus.MISMATCH)
-    )
-    
-    return GrandTotals(
-        total_bill=sum(item.total_bill for item in aggregated_items),
-        total_allowed=sum(item.total_allowed for item in aggregated_items),
-        total_extra=sum(item.total_extra for item in aggregated_items),
-        total_unclassified=total_unclassified,  # Phase-8+
-        total_allowed_not_comparable=sum(
-            item.total_bill
-            for item in aggregated_items
-            if item.status == VerificationStatus.ALLOWED_NOT_COMPARABLE
-        ),
-        green_count=sum(
-            1 for item in aggregated_items if item.status == VerificationStatus.GREEN
-        ),
-        red_count=sum(
-            1 for item in aggregated_items if item.status == VerificationStatus.RED
-        ),
-        mismatch_count=sum(
-            1 for item in aggregated_items if item.status == VerificationStatus.MISMATCH
-        ),
-        ignored_count=sum(
-            1
-            for item in aggregated_items
-            if item.status == VerificationStatus.IGNORED_ARTIFACT
-        ),
-        unclassified_count=unclassified_count,  # Phase-8+
-    )
+    _, amounts, _, status_ids = _rollup(aggregated_items)
+    return _grand_totals_from_rollup(amounts, status_ids)
 
 
 # =============================================================================
@@ -195,8 +255,12 @@ def build_financial_summary(aggregated_items: List[AggregatedItem]) -> Financial
         >>> financial_summary.grand_totals.total_bill
         14873.80
     """
-    category_totals = calculate_category_totals(aggregated_items)
-    grand_totals = calculate_grand_totals(aggregated_items)
+    # Encode items once; both levels are derived from the same arrays
+    categories, amounts, category_ids, status_ids = _rollup(aggregated_items)
+    category_totals = _category_totals_from_rollup(categories, amounts, category_ids, status_ids)
+    grand_totals = _grand_totals_from_rollup(amounts, status_ids)
+    
+    logger.info(f"Calculated totals for {len(category_totals)} categories")
     
     # Phase-8+: Validate financial reconciliation
     expected_total = grand_totals.total_allowed + grand_totals.total_extra + grand_totals.total_unclassified
@@ -13,13 +13,18 @@ All aggregation MUST use calculate_financial_contribution() to ensure consistenc
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Sequence
 import logging
 
+import numpy as np
+
 from app.verifier.models import ItemVerificationResult, VerificationStatus
 
 logger = logging.getLogger(__name__)
 
+# Keys of aggregate_contributions() totals, in contribution column order
+TOTAL_KEYS = ("bill", "allowed", "extra", "unclassified")
+
 
 @dataclass
 class FinancialContribution:
@@ -42,6 +47,16 @@ class FinancialContribution:
         unclassified_contribution: Amount needing manual review
         is_excluded: If True, item is excluded from ALL financial totals
     """
+    # One instance per bill item; slots keep them small (dataclass(slots=True) needs 3.10)
+    __slots__ = (
+        "bill_amount",
+        "allowed_limit",
+        "allowed_contribution",
+        "extra_contribution",
+        "unclassified_contribution",
+        "is_excluded",
+    )
+
     bill_amount: float
     allowed_limit: Optional[float]  # Policy ceiling (for reference)
     allowed_contribution: float      # Actual contribution to allowed bucket
@@ -127,7 +142,7 @@ def calculate_financial_contribution(item: ItemVerificationResult) -> FinancialC
     # =========================================================================
     
     if item.status == VerificationStatus.IGNORED_ARTIFACT:
-        logger.debug(f"Item '{item.bill_item}' is IGNORED_ARTIFACT - excluded from financials")
+        logger.debug("Item '%s' is IGNORED_ARTIFACT - excluded from financials", item.bill_item)
         return FinancialContribution(
             bill_amount=bill,
             allowed_limit=None,
@@ -138,7 +153,7 @@ def calculate_financial_contribution(item: ItemVerificationResult) -> FinancialC
         )
     
     if item.status == VerificationStatus.ALLOWED_NOT_COMPARABLE:
-        logger.debug(f"Item '{item.bill_item}' is ALLOWED_NOT_COMPARABLE - excluded from financials")
+        logger.debug("Item '%s' is ALLOWED_NOT_COMPARABLE - excluded from financials", item.bill_item)
         return FinancialContribution(
             bill_amount=bill,
             allowed_limit=None,
@@ -170,9 +185,8 @@ def calculate_financial_contribution(item: ItemVerificationResult) -> FinancialC
         )
         contrib.validate()
         logger.debug(
-            f"Item '{item.bill_item}' is GREEN - "
-            f"bill=₹{bill:.2f}, limit=₹{allowed_limit:.2f}, "
-            f"allowed_contribution=₹{allowed_contribution:.2f}"
+            "Item '%s' is GREEN - bill=₹%.2f, limit=₹%.2f, allowed_contribution=₹%.2f",
+            item.bill_item, bill, allowed_limit, allowed_contribution,
         )
         return contrib
     
@@ -193,10 +207,9 @@ def calculate_financial_contribution(item: ItemVerificationResult) -> FinancialC
         )
         contrib.validate()
         logger.debug(
-            f"Item '{item.bill_item}' is RED - "
-            f"bill=₹{bill:.2f}, limit=₹{allowed_limit:.2f}, "
-            f"allowed_contribution=₹{allowed_contribution:.2f}, "
-            f"extra_contribution=₹{extra_contribution:.2f}"
+            "Item '%s' is RED - bill=₹%.2f, limit=₹%.2f, "
+            "allowed_contribution=₹%.2f, extra_contribution=₹%.2f",
+            item.bill_item, bill, allowed_limit, allowed_contribution, extra_contribution,
         )
         return contrib
     
@@ -213,8 +226,8 @@ def calculate_financial_contribution(item: ItemVerificationResult) -> FinancialC
         )
         contrib.validate()
         logger.debug(
-            f"Item '{item.bill_item}' is {item.status.value} - "
-            f"bill=₹{bill:.2f}, unclassified_contribution=₹{bill:.2f}"
+            "Item '%s' is %s - bill=₹%.2f, unclassified_contribution=₹%.2f",
+            item.bill_item, item.status.value, bill, bill,
         )
         return contrib
     
@@ -222,3 +235,30 @@ def calculate_financial_contribution(item: ItemVerificationResult) -> FinancialC
     raise ValueError(
         f"Unknown verification status for item '{item.bill_item}': {item.status}"
     )
+
+
+def aggregate_contributions(contributions: Sequence[FinancialContribution]) -> Dict[str, float]:
+    """
+    Sum item contributions into the bill-level financial totals.
+    
+    Excluded items (IGNORED_ARTIFACT, ALLOWED_NOT_COMPARABLE) are skipped.
+    The remaining contributions are packed into an (n, 4) array and reduced
+    column-wise in one NumPy call; rows are added in item order, so each
+    total equals accumulating the items one by one.
+    
+    Args:
+        contributions: Results of calculate_financial_contribution()
+        
+    Returns:
+        Dict with "bill", "allowed", "extra" and "unclassified" totals
+    """
+    rows = [
+        (c.bill_amount, c.allowed_contribution, c.extra_contribution, c.unclassified_contribution)
+        for c in contributions
+        if not c.is_excluded
+    ]
+    if not rows:
+        return dict.fromkeys(TOTAL_KEYS, 0.0)
+    
+    totals = np.array(rows, dtype=np.float64).sum(axis=0)
+    return {key: float(total) for key, total in zip(TOTAL_KEYS, totals)}
@@ -92,7 +92,7 @@ class LLMDecisionCache:
         result = self._cache.get(key)
         if result is not None:
             self._hits += 1
-            logger.debug(f"LLM cache hit: {term_a} <-> {term_b}")
+            logger.debug("LLM cache hit: %s <-> %s", term_a, term_b)
         else:
             self._misses += 1
         return result
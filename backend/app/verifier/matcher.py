@@ -19,8 +19,11 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +42,8 @@ from app.verifier.models import TieUpCategory, TieUpItem, TieUpRateSheet
 try:
     from app.verifier.enhanced_matcher import (
         prefilter_item,
-        validate_hard_constraints,
         calculate_hybrid_score_v3,
+        validate_and_score,
         calibrate_confidence,
         get_category_config,
         MatchDecision
@@ -48,6 +51,7 @@ try:
     from app.verifier.medical_core_extractor_v2 import extract_medical_core_v2
     from app.verifier.failure_reasons_v2 import (
         determine_failure_reason_v2,
+        failure_reason_from_constraint,
         FailureReasonV2
     )
     V2_AVAILABLE = True
@@ -68,6 +72,17 @@ CATEGORY_SIMILARITY_THRESHOLD = float(os.getenv("CATEGORY_SIMILARITY_THRESHOLD",
 CATEGORY_SOFT_THRESHOLD = float(os.getenv("CATEGORY_SOFT_THRESHOLD", "0.65"))  # Soft acceptance
 ITEM_SIMILARITY_THRESHOLD = float(os.getenv("ITEM_SIMILARITY_THRESHOLD", "0.85"))
 
+# In-memory LRU of query embeddings (repeated bill items/categories skip the encoder)
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "2048"))
+
+# In-memory LRU of final item decisions (the same bill items recur across bills)
+ITEM_MATCH_CACHE_SIZE = int(os.getenv("ITEM_MATCH_CACHE_SIZE", "4096"))
+
+# Store index vectors as 8-bit scalar-quantized codes (4x less memory read per
+# search). Scores carry a small quantization error, which can flip decisions
+# that sit right at a threshold, so exact float32 indices stay the default.
+FAISS_INT8_INDEX = os.getenv("FAISS_INT8_INDEX", "0") == "1"
+
 # FEATURE FLAGS: Control matching behavior
 USE_V2_MATCHING = False  # V2 disabled by default - V1 has proven quality
 logger.info(f"Matching mode: {'V2 (Enhanced)' if USE_V2_MATCHING else 'V1 (Proven)'}")
@@ -85,7 +100,11 @@ THRESHOLDS = {
 # Data Classes for Match Results
 # =============================================================================
 
-@dataclass
+# Slotted match results are smaller and faster to build (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MatchResult:
     """Result of a semantic match operation."""
     matched_text: Optional[str]
@@ -104,19 +123,19 @@ class MatchResult:
         return self.error is not None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class HospitalMatch(MatchResult):
     """Hospital match result with tie-up rate sheet reference."""
     rate_sheet: Optional[TieUpRateSheet] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CategoryMatch(MatchResult):
     """Category match result with tie-up category reference."""
     category: Optional[TieUpCategory] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ItemMatch(MatchResult):
     """Item match result with tie-up item reference."""
     item: Optional[TieUpItem] = None
@@ -130,6 +149,16 @@ class ItemMatch(MatchResult):
     confidence_decision: Optional[str] = None  # MatchDecision enum value
 
 
+def _constraint_metadata(result) -> Dict[str, Optional[str]]:
+    """Medical metadata of a V2 extraction result, as reported on ItemMatch."""
+    return {
+        'dosage': result.dosage,
+        'form': result.form,
+        'modality': result.modality,
+        'body_part': result.body_part,
+    }
+
+
 # =============================================================================
 # FAISS Index Wrapper
 # =============================================================================
@@ -149,7 +178,12 @@ class FAISSIndex:
         """
         self.dimension = dimension
         # Use IndexFlatIP for inner product (cosine similarity with L2 normalized vectors)
-        self.index = faiss.IndexFlatIP(dimension)
+        if FAISS_INT8_INDEX:
+            self.index = faiss.IndexScalarQuantizer(
+                dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            self.index = faiss.IndexFlatIP(dimension)
         self.texts: List[str] = []
     
     def add(self, embeddings: np.ndarray, texts: List[str]):
@@ -165,6 +199,9 @@ class FAISSIndex:
             
         # L2 normalize for cosine similarity
         faiss.normalize_L2(embeddings)
+        if not self.index.is_trained:
+            # Scalar quantizer: learn per-dimension value ranges from the first batch
+            self.index.train(embeddings)
         self.index.add(embeddings)
         self.texts.extend(texts)
     
@@ -199,6 +236,37 @@ class FAISSIndex:
         
         return results
     
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        k: int = 1
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Search k nearest neighbors for many queries in one FAISS call.
+        
+        Args:
+            query_embeddings: Query vectors of shape (n, dimension)
+            k: Number of results per query
+            
+        Returns:
+            One list of (index, similarity_score) tuples per query row
+        """
+        n = len(query_embeddings)
+        if self.index.ntotal == 0 or n == 0:
+            return [[] for _ in range(n)]
+        
+        # Copy (never normalize caller-owned vectors in place) and normalize
+        queries = np.array(query_embeddings, dtype=np.float32).reshape(n, -1)
+        faiss.normalize_L2(queries)
+        
+        k = min(k, self.index.ntotal)
+        distances, indices = self.index.search(queries, k)
+        
+        return [
+            [(int(idx), float(sim)) for idx, sim in zip(idx_row, dist_row)]
+            for idx_row, dist_row in zip(indices, distances)
+        ]
+    
     def search_with_threshold(
         self, 
         query_embedding: np.ndarray, 
@@ -272,6 +340,21 @@ class SemanticMatcher:
         self._item_indices: Dict[Tuple[str, str], FAISSIndex] = {}
         self._item_refs: Dict[Tuple[str, str], List[TieUpItem]] = {}
         
+        # V2: Pre-extracted medical cores of tie-up items, parallel to _item_refs
+        self._item_cores: Dict[Tuple[str, str], list] = {}
+        
+        # V1: Normalized tie-up item text -> first index, per category index
+        self._item_exact: Dict[Tuple[str, str], Dict[str, int]] = {}
+        
+        # Query embeddings keyed by the exact text sent to the encoder
+        self._query_embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
+        
+        # Item match results keyed by (item name, hospital, category, threshold, use_llm);
+        # valid until the next re-indexing
+        self._item_matches: OrderedDict[tuple, ItemMatch] = OrderedDict()
+        self._item_matches_lock = threading.Lock()
+        
         # Track indexing status
         self._indexing_error: Optional[str] = None
         self._indexed = False
@@ -319,6 +402,9 @@ class SemanticMatcher:
         
         self._hospital_rate_sheets = rate_sheets
         self._indexing_error = None
+        self._item_cores.clear()
+        self._item_exact.clear()
+        self._clear_item_matches()
         
         try:
             # 1. Index hospital names
@@ -343,40 +429,49 @@ class SemanticMatcher:
                 # Category index for this hospital
                 if rs.categories:
                     category_names = [cat.category_name for cat in rs.categories]
-                    category_embeddings, error = self.embedding_service.get_embeddings_safe(category_names)
+                    item_groups = [
+                        (cat, [item.item_name for item in cat.items])
+                        for cat in rs.categories
+                        if cat.items
+                    ]
+                    
+                    # Category and item names of the sheet in one encoder call;
+                    # each index then takes its contiguous block of rows
+                    sheet_texts = category_names + [
+                        name for _, item_names in item_groups for name in item_names
+                    ]
+                    sheet_embeddings, error = self.embedding_service.get_embeddings_safe(sheet_texts)
                     
-                    if error or category_embeddings is None:
+                    if error or sheet_embeddings is None:
                         logger.warning(
                             f"Skipping category indexing for {rs.hospital_name}: {error}"
                         )
                         continue
                     
+                    sheet_embeddings = np.ascontiguousarray(sheet_embeddings, dtype=np.float32)
+                    offset = len(category_names)
+                    
                     cat_index = FAISSIndex(self.dimension)
-                    cat_index.add(category_embeddings, category_names)
+                    cat_index.add(sheet_embeddings[:offset], category_names)
                     
                     self._category_indices[hospital_key] = cat_index
                     self._category_refs[hospital_key] = rs.categories
                     categories_indexed += 1
                     
                     # Item index for each category
-                    for cat in rs.categories:
-                        if cat.items:
-                            cat_key = (hospital_key, cat.category_name.lower())
-                            item_names = [item.item_name for item in cat.items]
-                            item_embeddings, error = self.embedding_service.get_embeddings_safe(item_names)
-                            
-                            if error or item_embeddings is None:
-                                logger.warning(
-                                    f"Skipping item indexing for {rs.hospital_name}/{cat.category_name}: {error}"
-                                )
-                                continue
-                            
-                            item_index = FAISSIndex(self.dimension)
-                            item_index.add(item_embeddings, item_names)
-                            
-                            self._item_indices[cat_key] = item_index
-                            self._item_refs[cat_key] = cat.items
-                            items_indexed += 1
+                    for cat, item_names in item_groups:
+                        cat_key = (hospital_key, cat.category_name.lower())
+                        item_embeddings = sheet_embeddings[offset:offset + len(item_names)]
+                        offset += len(item_names)
+                        
+                        item_index = FAISSIndex(self.dimension)
+                        item_index.add(item_embeddings, item_names)
+                        
+                        self._item_indices[cat_key] = item_index
+                        self._item_refs[cat_key] = cat.items
+                        if USE_V2_MATCHING and V2_AVAILABLE:
+                            self._get_item_cores(cat_key)
+                        items_indexed += 1
             
             self._indexed = True
             logger.info(
@@ -399,6 +494,146 @@ class SemanticMatcher:
             logger.error(self._indexing_error, exc_info=True)
             return False
     
+    def _encode_cached(self, text: str) -> np.ndarray:
+        """
+        Get the query embedding for a text, reusing recent results.
+        
+        Bills often repeat the same item (e.g. daily room charges, the same
+        drug on several dates); after normalization these map to the same
+        text and only the first one reaches the embedding service.
+        
+        Raises:
+            EmbeddingServiceUnavailable: Propagated from the embedding service
+        """
+        with self._query_embeddings_lock:
+            cached = self._query_embeddings.get(text)
+            if cached is not None:
+                self._query_embeddings.move_to_end(text)
+                return cached
+        
+        embedding = self.embedding_service.get_embedding(text)
+        
+        with self._query_embeddings_lock:
+            self._query_embeddings[text] = embedding
+            if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        
+        return embedding
+    
+    def _clear_item_matches(self):
+        """Drop memoized item matches (they depend on the indexed rate sheets)."""
+        with self._item_matches_lock:
+            self._item_matches.clear()
+    
+    def _normalize_item_for_matching(self, item_name: str) -> str:
+        """
+        V1 query text for a bill item: medical core, then OCR-noise normalization.
+        
+        Example: "(30049099) NICORANDIL-TABLET-5MG-KORANDIL- |GTF" → "nicorandil 5mg"
+        """
+        # CRITICAL: Extract medical core FIRST (before any other processing)
+        # This removes inventory metadata: lot numbers, SKUs, expiry dates, brand suffixes
+        from app.verifier.medical_core_extractor import extract_medical_core
+        medical_core = extract_medical_core(item_name)
+        
+        # Then normalize the medical core (remove doctor names, etc.)
+        from app.verifier.text_normalizer import normalize_bill_item_text
+        normalized_item_name = normalize_bill_item_text(medical_core)
+        
+        # Log extraction and normalization for debugging
+        if medical_core != item_name.lower().strip():
+            logger.debug("Medical core extracted: '%s' → '%s'", item_name, medical_core)
+        if normalized_item_name != medical_core.lower().strip():
+            logger.debug("Normalized: '%s' → '%s'", medical_core, normalized_item_name)
+        
+        return normalized_item_name if normalized_item_name else item_name
+    
+    def _item_query_text(self, item_name: str) -> str:
+        """Text that match_item_v2() will embed for a bill item in the active mode."""
+        if USE_V2_MATCHING and V2_AVAILABLE:
+            return extract_medical_core_v2(item_name).core_text
+        return self._normalize_item_for_matching(item_name)
+    
+    def prefetch_item_embeddings(
+        self,
+        item_names: List[str],
+        category_names: Sequence[str] = (),
+    ) -> int:
+        """
+        Encode the query texts of many bill items in a single encoder call.
+        
+        Results seed the query embedding LRU, so the per-item match calls
+        that follow find their vectors already computed. Failures are logged
+        and left to the per-item path, which degrades gracefully.
+        
+        Args:
+            item_names: Raw bill item names (duplicates allowed)
+            category_names: Bill category names to encode in the same batch
+                            (as used by match_category)
+            
+        Returns:
+            Number of texts newly encoded
+        """
+        return self._prefetch_query_embeddings(
+            list(category_names) + [self._item_query_text(name) for name in item_names]
+        )
+    
+    def _prefetch_query_embeddings(self, texts: List[str]) -> int:
+        """Batch-encode the query texts not yet in the embedding LRU (see prefetch_item_embeddings)."""
+        texts = list(dict.fromkeys(texts))
+        
+        with self._query_embeddings_lock:
+            missing = [t for t in texts if t not in self._query_embeddings]
+        
+        if not missing:
+            return 0
+        
+        embeddings, error = self.embedding_service.get_embeddings_safe(missing)
+        if error or embeddings is None:
+            logger.warning(f"Batch item embedding failed, falling back to per-item: {error}")
+            return 0
+        
+        with self._query_embeddings_lock:
+            for text, embedding in zip(missing, embeddings):
+                self._query_embeddings[text] = embedding
+            while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        
+        logger.debug(f"Prefetched {len(missing)} query embeddings ({len(texts)} unique texts)")
+        return len(missing)
+    
+    def _get_item_cores(self, cat_key: Tuple[str, str]) -> list:
+        """
+        Get V2 medical cores for every tie-up item of a category index.
+        
+        Tie-up items are constant between re-indexing, so dosage/form/modality/
+        body-part extraction and normalization is done once per item here
+        instead of once per candidate comparison.
+        """
+        cores = self._item_cores.get(cat_key)
+        if cores is None:
+            cores = [
+                extract_medical_core_v2(text)
+                for text in self._item_indices[cat_key].texts
+            ]
+            self._item_cores[cat_key] = cores
+        return cores
+    
+    def _get_exact_item_lookup(self, cat_key: Tuple[str, str]) -> Dict[str, int]:
+        """
+        Get the exact-match table of a category index: normalized text -> index.
+        
+        Replaces a scan over every tie-up item per query with one dict
+        lookup. The first item wins on duplicates, as in the scan it replaces.
+        """
+        lookup = self._item_exact.get(cat_key)
+        if lookup is None:
+            lookup = {}
+            for idx, text in enumerate(self._item_indices[cat_key].texts):
+                lookup.setdefault(text.lower().strip(), idx)
+            self._item_exact[cat_key] = lookup
+        return lookup
+    
     def match_hospital(self, hospital_name: str) -> HospitalMatch:
         """
         Match a bill hospital name to the best tie-up hospital.
@@ -430,9 +665,10 @@ class SemanticMatcher:
                 error="No hospital index available"
             )
         
-        # Get embedding for query hospital (with graceful degradation)
+        # Get embedding for query hospital (with graceful degradation);
+        # the same few hospitals recur on every bill
         try:
-            query_embedding = self.embedding_service.get_embedding(hospital_name)
+            query_embedding = self._encode_cached(hospital_name)
         except EmbeddingServiceUnavailable as e:
             logger.warning(f"Embedding service unavailable for hospital match: {e}")
             return HospitalMatch(
@@ -509,7 +745,7 @@ class SemanticMatcher:
         
         # Get embedding for query category (with graceful degradation)
         try:
-            query_embedding = self.embedding_service.get_embedding(category_name)
+            query_embedding = self._encode_cached(category_name)
         except EmbeddingServiceUnavailable as e:
             logger.warning(f"Embedding service unavailable for category match: {e}")
             return CategoryMatch(
@@ -543,7 +779,7 @@ class SemanticMatcher:
         matched_name = cat_index.texts[idx]
         category = cat_refs[idx]
         
-        logger.debug(f"Category match: '{category_name}' -> '{matched_name}' (sim={similarity:.4f})")
+        logger.debug("Category match: '%s' -> '%s' (sim=%.4f)", category_name, matched_name, similarity)
         
         # Return match regardless of threshold (caller decides what to do)
         return CategoryMatch(
@@ -560,6 +796,7 @@ class SemanticMatcher:
         category_name: str,
         threshold: float = ITEM_SIMILARITY_THRESHOLD,
         use_llm: bool = True,
+        candidates: Optional[List[Tuple[int, float]]] = None,
     ) -> ItemMatch:
         """
         Match a bill item to a tie-up item with LLM fallback for borderline cases.
@@ -580,6 +817,8 @@ class SemanticMatcher:
             category_name: Matched category name
             threshold: Minimum similarity threshold (default 0.85)
             use_llm: Whether to use LLM for borderline cases (default True)
+            candidates: Pre-computed top-k (index, similarity) search results
+                (from match_items); skips embedding and search when given
             
         Returns:
             ItemMatch (similarity < threshold means MISMATCH unless LLM overrides)
@@ -587,33 +826,13 @@ class SemanticMatcher:
         """
         self._total_matches += 1
         
-        # CRITICAL: Extract medical core FIRST (before any other processing)
-        # This removes inventory metadata: lot numbers, SKUs, expiry dates, brand suffixes
-        # Example: "(30049099) NICORANDIL-TABLET-5MG-KORANDIL- |GTF" → "nicorandil 5mg"
-        from app.verifier.medical_core_extractor import extract_medical_core
-        medical_core = extract_medical_core(item_name)
-        
-        # Then normalize the medical core (remove doctor names, etc.)
-        from app.verifier.text_normalizer import normalize_bill_item_text
-        normalized_item_name = normalize_bill_item_text(medical_core)
-        
-        # Log extraction and normalization for debugging
-        if medical_core != item_name.lower().strip():
-            logger.debug(
-                f"Medical core extracted: '{item_name}' → '{medical_core}'"
-            )
-        if normalized_item_name != medical_core.lower().strip():
-            logger.debug(
-                f"Normalized: '{medical_core}' → '{normalized_item_name}'"
-            )
-        
         # Use normalized medical core for matching
-        item_name_for_matching = normalized_item_name if normalized_item_name else item_name
+        item_name_for_matching = self._normalize_item_for_matching(item_name)
         
         cat_key = (hospital_name.lower(), category_name.lower())
         
         if cat_key not in self._item_indices:
-            logger.warning(f"No item index for: {hospital_name}/{category_name}")
+            logger.warning("No item index for: %s/%s", hospital_name, category_name)
             return ItemMatch(
                 matched_text=None,
                 similarity=0.0,
@@ -627,47 +846,51 @@ class SemanticMatcher:
         
         # EXACT MATCH FAST PATH: Check for identical strings before semantic search
         # This guarantees 100% accuracy for exact matches and avoids unnecessary embeddings
-        for idx, tieup_text in enumerate(item_index.texts):
-            if item_name_for_matching.lower().strip() == tieup_text.lower().strip():
-                logger.info(
-                    f"Exact match found (fast path): '{item_name}' → '{tieup_text}' (confidence=1.0)"
-                )
-                return ItemMatch(
-                    matched_text=tieup_text,
-                    similarity=1.0,  # Perfect match
-                    index=idx,
-                    item=item_refs[idx],
-                    normalized_item_name=item_name_for_matching
-                )
-        
-        # Get embedding for query item (with graceful degradation)
-        try:
-            query_embedding = self.embedding_service.get_embedding(item_name_for_matching)
-        except EmbeddingServiceUnavailable as e:
-            logger.warning(f"Embedding service unavailable for item match: {e}")
-            return ItemMatch(
-                matched_text=None,
-                similarity=0.0,
-                index=-1,
-                item=None,
-                normalized_item_name=item_name_for_matching,
-                error=f"Embedding service temporarily unavailable: {e}"
+        idx = self._get_exact_item_lookup(cat_key).get(item_name_for_matching.lower().strip())
+        if idx is not None:
+            tieup_text = item_index.texts[idx]
+            logger.info(
+                "Exact match found (fast path): '%s' → '%s' (confidence=1.0)", item_name, tieup_text
             )
-        except Exception as e:
-            logger.error(f"Unexpected error getting item embedding: {e}")
             return ItemMatch(
-                matched_text=None,
-                similarity=0.0,
-                index=-1,
-                item=None,
-                normalized_item_name=item_name_for_matching,
-                error=f"Embedding error: {e}"
+                matched_text=tieup_text,
+                similarity=1.0,  # Perfect match
+                index=idx,
+                item=item_refs[idx],
+                normalized_item_name=item_name_for_matching
             )
         
-        # Find best match using TOP-K strategy (PHASE-1 ENHANCEMENT)
-        # Instead of just taking top-1 semantic match, evaluate top-3 with hybrid scoring
-        k = min(3, item_index.size)  # Get top-3 candidates (or fewer if index is small)
-        results = item_index.search(query_embedding, k=k)
+        if candidates is None:
+            # Get embedding for query item (with graceful degradation)
+            try:
+                query_embedding = self._encode_cached(item_name_for_matching)
+            except EmbeddingServiceUnavailable as e:
+                logger.warning(f"Embedding service unavailable for item match: {e}")
+                return ItemMatch(
+                    matched_text=None,
+                    similarity=0.0,
+                    index=-1,
+                    item=None,
+                    normalized_item_name=item_name_for_matching,
+                    error=f"Embedding service temporarily unavailable: {e}"
+                )
+            except Exception as e:
+                logger.error(f"Unexpected error getting item embedding: {e}")
+                return ItemMatch(
+                    matched_text=None,
+                    similarity=0.0,
+                    index=-1,
+                    item=None,
+                    normalized_item_name=item_name_for_matching,
+                    error=f"Embedding error: {e}"
+                )
+            
+            # Find best match using TOP-K strategy (PHASE-1 ENHANCEMENT)
+            # Instead of just taking top-1 semantic match, evaluate top-3 with hybrid scoring
+            k = min(3, item_index.size)  # Get top-3 candidates (or fewer if index is small)
+            results = item_index.search(query_embedding, k=k)
+        else:
+            results = candidates
         
         if not results:
             return ItemMatch(
@@ -697,8 +920,8 @@ class SemanticMatcher:
             )
             
             logger.debug(
-                f"Candidate {idx+1}: '{matched_name}' "
-                f"(semantic={semantic_sim:.4f}, hybrid={hybrid_score:.4f})"
+                "Candidate %d: '%s' (semantic=%.4f, hybrid=%.4f)",
+                idx + 1, matched_name, semantic_sim, hybrid_score,
             )
             
             # Track best hybrid score
@@ -720,10 +943,9 @@ class SemanticMatcher:
         idx, matched_name, item, similarity = best_match
         
         logger.debug(
-            f"Best match: '{item_name_for_matching}' → '{matched_name}' "
-            f"(semantic={similarity:.4f}, hybrid={best_hybrid_score:.4f}, "
-            f"tok={best_breakdown['token_overlap']:.2f}, "
-            f"cont={best_breakdown['containment']:.2f})"
+            "Best match: '%s' → '%s' (semantic=%.4f, hybrid=%.4f, tok=%.2f, cont=%.2f)",
+            item_name_for_matching, matched_name, similarity, best_hybrid_score,
+            best_breakdown['token_overlap'], best_breakdown['containment'],
         )
         
         # PHASE-1: Use hybrid score threshold (0.60) instead of pure semantic threshold
@@ -733,8 +955,8 @@ class SemanticMatcher:
         # Auto-match for high hybrid score
         if best_hybrid_score >= THRESHOLDS["hybrid_auto_match"]:
             logger.info(
-                f"Hybrid match accepted: '{item_name}' → '{matched_name}' "
-                f"(hybrid={best_hybrid_score:.4f})"
+                "Hybrid match accepted: '%s' → '%s' (hybrid=%.4f)",
+                item_name, matched_name, best_hybrid_score,
             )
             return ItemMatch(
                 matched_text=matched_name,
@@ -756,8 +978,8 @@ class SemanticMatcher:
         
         if is_match:
             logger.info(
-                f"Partial match accepted: '{item_name}' → '{matched_name}' "
-                f"(semantic={similarity:.4f}, confidence={confidence:.4f}, reason={reason})"
+                "Partial match accepted: '%s' → '%s' (semantic=%.4f, confidence=%.4f, reason=%s)",
+                item_name, matched_name, similarity, confidence, reason,
             )
             return ItemMatch(
                 matched_text=matched_name,
@@ -772,9 +994,7 @@ class SemanticMatcher:
         PHASE1_LLM_THRESHOLD = 0.55
         if use_llm and similarity >= PHASE1_LLM_THRESHOLD:
             self._llm_calls += 1
-            logger.info(
-                f"Borderline similarity ({similarity:.4f}), using LLM for verification"
-            )
+            logger.info("Borderline similarity (%.4f), using LLM for verification", similarity)
             
             # Use original (non-normalized) text for LLM to preserve context
             llm_result = self.llm_router.match_with_llm(
@@ -786,8 +1006,8 @@ class SemanticMatcher:
             if llm_result.is_valid and llm_result.match:
                 # LLM confirmed match
                 logger.info(
-                    f"LLM confirmed match: '{item_name}' → '{matched_name}' "
-                    f"(confidence={llm_result.confidence:.4f}, model={llm_result.model_used})"
+                    "LLM confirmed match: '%s' → '%s' (confidence=%.4f, model=%s)",
+                    item_name, matched_name, llm_result.confidence, llm_result.model_used,
                 )
                 return ItemMatch(
                     matched_text=matched_name,
@@ -799,14 +1019,14 @@ class SemanticMatcher:
             else:
                 # LLM rejected or failed
                 logger.info(
-                    f"LLM rejected match: '{item_name}' → '{matched_name}' "
-                    f"(confidence={llm_result.confidence:.4f}, error={llm_result.error})"
+                    "LLM rejected match: '%s' → '%s' (confidence=%.4f, error=%s)",
+                    item_name, matched_name, llm_result.confidence, llm_result.error,
                 )
         
         # No match (either below threshold, partial match failed, or LLM rejected)
         logger.debug(
-            f"Item rejected: '{item_name}' → '{matched_name}' "
-            f"(semantic={similarity:.4f}, partial_match={reason if 'reason' in locals() else 'not_tried'})"
+            "Item rejected: '%s' → '%s' (semantic=%.4f, partial_match=%s)",
+            item_name, matched_name, similarity, reason if 'reason' in locals() else 'not_tried',
         )
         return ItemMatch(
             matched_text=matched_name,
@@ -823,6 +1043,7 @@ class SemanticMatcher:
         category_name: str,
         threshold: float = None,  # Will use category-specific threshold
         use_llm: bool = True,
+        candidates: Optional[List[Tuple[int, float]]] = None,
     ) -> ItemMatch:
         """
         Enhanced item matching with V2 architecture (6-layer pipeline).
@@ -842,6 +1063,8 @@ class SemanticMatcher:
             category_name: Category name
             threshold: Override threshold (uses category-specific if None)
             use_llm: Whether to use LLM for borderline cases
+            candidates: Pre-computed top-k (index, similarity) search results
+                (from match_items); skips embedding and search when given
             
         Returns:
             ItemMatch with V2 enhancements (failure reasons, score breakdown, etc.)
@@ -849,12 +1072,12 @@ class SemanticMatcher:
         # Check feature flag first - V2 disabled by default for stability
         if not USE_V2_MATCHING:
             logger.debug("V2 matching disabled by feature flag, using proven V1 logic")
-            return self.match_item(item_name, hospital_name, category_name, threshold or ITEM_SIMILARITY_THRESHOLD, use_llm)
+            return self.match_item(item_name, hospital_name, category_name, threshold or ITEM_SIMILARITY_THRESHOLD, use_llm, candidates)
         
         if not V2_AVAILABLE:
             # Fallback to V1 if V2 modules not available
             logger.debug("V2 modules not available, using V1 match_item")
-            return self.match_item(item_name, hospital_name, category_name, threshold or ITEM_SIMILARITY_THRESHOLD, use_llm)
+            return self.match_item(item_name, hospital_name, category_name, threshold or ITEM_SIMILARITY_THRESHOLD, use_llm, candidates)
         
         self._total_matches += 1
         
@@ -906,27 +1129,31 @@ class SemanticMatcher:
         
         item_index = self._item_indices[cat_key]
         item_refs = self._item_refs[cat_key]
-        
-        # Get embedding
-        try:
-            query_embedding = self.embedding_service.get_embedding(bill_result.core_text)
-        except Exception as e:
-            logger.error(f"Embedding error: {e}")
-            return ItemMatch(
-                matched_text=None,
-                similarity=0.0,
-                index=-1,
-                item=None,
-                normalized_item_name=bill_result.core_text,
-                error=f"Embedding error: {e}"
-            )
+        item_cores = self._get_item_cores(cat_key)
         
         # =====================================================================
         # LAYER 3: Semantic Matching (Top-K)
         # =====================================================================
         
-        k = min(5, item_index.size)  # Increased from 3 to 5 for better re-ranking
-        results = item_index.search(query_embedding, k=k)
+        if candidates is None:
+            # Get embedding
+            try:
+                query_embedding = self._encode_cached(bill_result.core_text)
+            except Exception as e:
+                logger.error(f"Embedding error: {e}")
+                return ItemMatch(
+                    matched_text=None,
+                    similarity=0.0,
+                    index=-1,
+                    item=None,
+                    normalized_item_name=bill_result.core_text,
+                    error=f"Embedding error: {e}"
+                )
+            
+            k = min(5, item_index.size)  # Increased from 3 to 5 for better re-ranking
+            results = item_index.search(query_embedding, k=k)
+        else:
+            results = candidates
         
         if not results:
             return ItemMatch(
@@ -939,12 +1166,52 @@ class SemanticMatcher:
                 failure_explanation="No candidates found in semantic search"
             )
         
+        # Bill-side metadata is shared by every result built below
+        bill_metadata = _constraint_metadata(bill_result)
+        
+        # Fast path on the top semantic hit (category-tunable): an obvious
+        # match is scored on its own and accepted without re-ranking the rest
+        # if it passes the constraints and calibrates to AUTO_MATCH
+        top_idx, top_sim = results[0]
+        if top_sim >= config.auto_accept_similarity:
+            top_result = item_cores[top_idx]
+            valid, _, top_score, top_breakdown = validate_and_score(
+                bill_result=bill_result,
+                tieup_result=top_result,
+                semantic_similarity=top_sim,
+                category=category_name,
+                config=config,
+            )
+            if valid:
+                decision, calibrated_confidence = calibrate_confidence(
+                    top_score, category_name, top_breakdown
+                )
+                if decision == MatchDecision.AUTO_MATCH:
+                    logger.info(
+                        "Best match: '%s' (score=%.3f, decision=%s, fast path)",
+                        item_index.texts[top_idx], top_score, decision.value
+                    )
+                    return ItemMatch(
+                        matched_text=item_index.texts[top_idx],
+                        similarity=calibrated_confidence,
+                        index=top_idx,
+                        item=item_refs[top_idx],
+                        normalized_item_name=bill_result.core_text,
+                        score_breakdown=top_breakdown,
+                        medical_metadata={
+                            'bill': bill_metadata,
+                            'tieup': _constraint_metadata(top_result),
+                        },
+                        confidence_decision=decision.value
+                    )
+        
         # =====================================================================
         # LAYER 2 & 4: Validate Constraints + Hybrid Re-Ranking
         # =====================================================================
         
         best_candidate = None
         best_score = 0.0
+        best_semantic = 0.0
         best_breakdown = None
         best_tieup_result = None
         best_item = None
@@ -957,31 +1224,28 @@ class SemanticMatcher:
         first_failed_candidate_similarity = 0.0
         
         for idx, semantic_sim in results:
+            # Results are sorted by similarity. The medical-anchor and token
+            # components are capped at 1.0, so once a candidate cannot beat
+            # the current best even with perfect scores, neither can the rest.
+            if best_candidate is not None and (
+                0.50 * semantic_sim + 0.30 + 0.20 <= best_score
+            ):
+                break
+            
             matched_name = item_index.texts[idx]
             item = item_refs[idx]
             
-            # Extract medical core from candidate
-            tieup_result = extract_medical_core_v2(matched_name)
+            # Medical core of candidate (extracted once per tie-up item)
+            tieup_result = item_cores[idx]
             
-            # LAYER 2: Validate hard constraints
-            valid, constraint_reason = validate_hard_constraints(
-                bill_metadata={
-                    'dosage': bill_result.dosage,
-                    'form': bill_result.form,
-                    'modality': bill_result.modality,
-                    'body_part': bill_result.body_part,
-                    'core_text': bill_result.core_text,
-                },
-                tieup_metadata={
-                    'dosage': tieup_result.dosage,
-                    'form': tieup_result.form,
-                    'modality': tieup_result.modality,
-                    'body_part': tieup_result.body_part,
-                    'core_text': tieup_result.core_text,
-                },
-                bill_category=category_name,
-                tieup_category=category_name,
-                config=config
+            # LAYER 2 + 4: Validate hard constraints and score in one pass
+            valid, constraint_reason, final_score, breakdown = validate_and_score(
+                bill_result=bill_result,
+                tieup_result=tieup_result,
+                semantic_similarity=semantic_sim,
+                category=category_name,
+                config=config,
+                return_breakdown=False
             )
             
             if not valid:
@@ -990,54 +1254,29 @@ class SemanticMatcher:
                 if first_failure_reason is None: # Only track the very first failure encountered
                     first_failed_candidate_name = matched_name
                     first_failed_candidate_similarity = semantic_sim
-                    # Determine specific failure reason
-                    if "DOSAGE_MISMATCH" in constraint_reason:
-                        first_failure_reason = FailureReasonV2.DOSAGE_MISMATCH.value
-                    elif "FORM_MISMATCH" in constraint_reason:
-                        first_failure_reason = FailureReasonV2.FORM_MISMATCH.value
-                    elif "CATEGORY_BOUNDARY" in constraint_reason:
-                        first_failure_reason = FailureReasonV2.WRONG_CATEGORY.value
-                    elif "MODALITY_MISMATCH" in constraint_reason:
-                        first_failure_reason = FailureReasonV2.MODALITY_MISMATCH.value
-                    elif "BODYPART_MISMATCH" in constraint_reason:
-                        first_failure_reason = FailureReasonV2.BODYPART_MISMATCH.value
-                    else:
-                        first_failure_reason = FailureReasonV2.LOW_SIMILARITY.value
+                    first_failure_reason = failure_reason_from_constraint(constraint_reason).value
                     first_failure_explanation = constraint_reason
                 # Continue to next candidate (don't return yet!)
                 continue
             
-            # LAYER 4: Calculate hybrid score
-            final_score, breakdown = calculate_hybrid_score_v3(
-                bill_text=bill_result.core_text,
-                tieup_text=tieup_result.core_text,
-                semantic_similarity=semantic_sim,
-                bill_metadata={
-                    'dosage': bill_result.dosage,
-                    'form': bill_result.form,
-                    'modality': bill_result.modality,
-                    'body_part': bill_result.body_part,
-                },
-                tieup_metadata={
-                    'dosage': tieup_result.dosage,
-                    'form': tieup_result.form,
-                    'modality': tieup_result.modality,
-                    'body_part': tieup_result.body_part,
-                },
-                category=category_name
-            )
-            
             logger.debug(f"Candidate '{matched_name}': semantic={semantic_sim:.3f}, hybrid={final_score:.3f}")
             
             # Track best candidate
             if final_score > best_score:
                 best_score = final_score
                 best_candidate = matched_name
-                best_breakdown = breakdown
+                best_semantic = semantic_sim
                 best_tieup_result = tieup_result
                 best_item = item
                 best_idx = idx
         
+        # Score breakdown is only reported for the winning candidate
+        if best_candidate:
+            _, best_breakdown = calculate_hybrid_score_v3(
+                bill_result.core_text, best_tieup_result.core_text, best_semantic,
+                bill_metadata, _constraint_metadata(best_tieup_result), category_name
+            )
+        
         # =====================================================================
         # LAYER 5: Confidence Calibration
         # =====================================================================
@@ -1059,18 +1298,8 @@ class SemanticMatcher:
                     normalized_item_name=bill_result.core_text,
                     score_breakdown=best_breakdown,
                     medical_metadata={
-                        'bill': {
-                            'dosage': bill_result.dosage,
-                            'form': bill_result.form,
-                            'modality': bill_result.modality,
-                            'body_part': bill_result.body_part,
-                        },
-                        'tieup': {
-                            'dosage': best_tieup_result.dosage,
-                            'form': best_tieup_result.form,
-                            'modality': best_tieup_result.modality,
-                            'body_part': best_tieup_result.body_part,
-                        }
+                        'bill': bill_metadata,
+                        'tieup': _constraint_metadata(best_tieup_result),
                     },
                     confidence_decision=decision.value
                 )
@@ -1119,18 +1348,8 @@ class SemanticMatcher:
             category=category_name,
             best_candidate=best_candidate,
             best_similarity=best_score if best_candidate else 0.0,
-            bill_metadata={
-                'dosage': bill_result.dosage,
-                'form': bill_result.form,
-                'modality': bill_result.modality,
-                'body_part': bill_result.body_part,
-            } if bill_result else None,
-            tieup_metadata={
-                'dosage': best_tieup_result.dosage if best_tieup_result else None,
-                'form': best_tieup_result.form if best_tieup_result else None,
-                'modality': best_tieup_result.modality if best_tieup_result else None,
-                'body_part': best_tieup_result.body_part if best_tieup_result else None,
-            } if best_tieup_result else None,
+            bill_metadata=bill_metadata,
+            tieup_metadata=_constraint_metadata(best_tieup_result) if best_tieup_result else None,
             threshold=category_threshold
         )
         
@@ -1146,6 +1365,99 @@ class SemanticMatcher:
         )
     
 
+    def match_items(
+        self,
+        item_names: List[str],
+        hospital_name: str,
+        category_name: str,
+        threshold: float = None,
+        use_llm: bool = True,
+    ) -> List[ItemMatch]:
+        """
+        Match all bill items of one category against its tie-up item index.
+        
+        Query vectors of the whole group go through a single batched FAISS
+        search; each item is then re-ranked and decided exactly as in
+        match_item_v2(). If the batch cannot be embedded, items fall back to
+        the per-item path (which reports the embedding error per item).
+        
+        Results are memoized per item name until the next re-indexing, so
+        repeated items (within a bill or across bills) skip matching.
+        
+        Args:
+            item_names: Item names from the bill (same category)
+            hospital_name: Matched hospital name
+            category_name: Matched category name
+            threshold: Override threshold (uses category-specific if None)
+            use_llm: Whether to use LLM for borderline cases
+            
+        Returns:
+            One ItemMatch per item name, in input order
+        """
+        hospital_key, category_key = hospital_name.lower(), category_name.lower()
+        keys = [(name, hospital_key, category_key, threshold, use_llm) for name in item_names]
+        
+        # Items decided before (in this or an earlier bill) are served from
+        # the LRU; the rest are matched once per distinct name
+        with self._item_matches_lock:
+            matches: Dict[tuple, ItemMatch] = {}
+            for key in keys:
+                cached = self._item_matches.get(key)
+                if cached is not None:
+                    self._item_matches.move_to_end(key)
+                    matches[key] = cached
+        
+        pending = [key for key in dict.fromkeys(keys) if key not in matches]
+        self._total_matches += len(keys) - len(pending)
+        pending_names = [key[0] for key in pending]
+        all_candidates: List[Optional[List[Tuple[int, float]]]] = [None] * len(pending)
+        
+        cat_key = (hospital_key, category_key)
+        item_index = self._item_indices.get(cat_key)
+        if item_index is not None and item_index.size > 0 and pending_names:
+            query_texts = [self._item_query_text(name) for name in pending_names]
+            
+            # V1 exact matches are decided by the fast path in match_item()
+            # and need neither an embedding nor a search
+            search_rows = list(range(len(query_texts)))
+            if not (USE_V2_MATCHING and V2_AVAILABLE):
+                exact = self._get_exact_item_lookup(cat_key)
+                search_rows = [i for i in search_rows if query_texts[i].lower().strip() not in exact]
+            search_texts = [query_texts[i] for i in search_rows]
+            
+            # One encoder call for every query vector not cached yet
+            if search_texts:
+                self._prefetch_query_embeddings(search_texts)
+                try:
+                    query_embeddings = np.stack([self._encode_cached(text) for text in search_texts])
+                except Exception as e:
+                    logger.warning(f"Batch item search unavailable, falling back to per-item: {e}")
+                else:
+                    # Same top-k as the per-item paths: 5 for V2 re-ranking, 3 for V1
+                    k = 5 if USE_V2_MATCHING and V2_AVAILABLE else 3
+                    for i, candidates in zip(search_rows, item_index.search_batch(query_embeddings, k=k)):
+                        all_candidates[i] = candidates
+        
+        for key, candidates in zip(pending, all_candidates):
+            matches[key] = self.match_item_v2(
+                item_name=key[0],
+                hospital_name=hospital_name,
+                category_name=category_name,
+                threshold=threshold,
+                use_llm=use_llm,
+                candidates=candidates,
+            )
+        
+        # Errors (e.g. embedding service down) are transient: never memoize them
+        with self._item_matches_lock:
+            for key in pending:
+                if matches[key].error is None:
+                    self._item_matches[key] = matches[key]
+            while len(self._item_matches) > ITEM_MATCH_CACHE_SIZE:
+                self._item_matches.popitem(last=False)
+        
+        return [matches[key] for key in keys]
+    
     def clear_indices(self):
         """Clear all FAISS indices and references."""
         self._hospital_index = None
@@ -1154,6 +1466,9 @@ class SemanticMatcher:
         self._category_refs.clear()
         self._item_indices.clear()
         self._item_refs.clear()
+        self._item_cores.clear()
+        self._item_exact.clear()
+        self._clear_item_matches()
         logger.info("All indices cleared")
     
     @property
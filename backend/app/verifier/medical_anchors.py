@@ -13,6 +13,7 @@ Phase-2 Enhancement: Medical anchors contribute 25% to hybrid matching score.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Set, Tuple
 
 
@@ -147,11 +148,42 @@ def extract_bodypart(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4096)
+def _extract_anchors(text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Extract (dosage, modality, body part) anchors of a text once.
+    
+    A bill item is scored against several candidates and each tie-up item
+    against many bill items, so anchors are cached per text.
+    """
+    return extract_dosage(text), extract_modality(text), extract_bodypart(text)
+
+
 # =============================================================================
 # Medical Anchor Scoring
 # =============================================================================
 
 
+def medical_anchor_score(bill_item: str, tieup_item: str) -> float:
+    """
+    Medical anchor score only, without the breakdown dict.
+    
+    Same value as calculate_medical_anchor_score(...)[0]; used when ranking
+    many candidates where only the winner's breakdown is reported.
+    """
+    bill_dosage, bill_modality, bill_bodypart = _extract_anchors(bill_item)
+    tieup_dosage, tieup_modality, tieup_bodypart = _extract_anchors(tieup_item)
+    
+    score = 0.0
+    if bill_dosage and tieup_dosage and bill_dosage == tieup_dosage:
+        score += 0.4
+    if bill_modality and tieup_modality and bill_modality == tieup_modality:
+        score += 0.3
+    if bill_bodypart and tieup_bodypart and bill_bodypart == tieup_bodypart:
+        score += 0.3
+    return min(score, 1.0)
+
+
 def calculate_medical_anchor_score(
     bill_item: str, tieup_item: str
 ) -> Tuple[float, dict]:
@@ -196,23 +228,20 @@ def calculate_medical_anchor_score(
     
     score = 0.0
     
+    bill_dosage, bill_modality, bill_bodypart = _extract_anchors(bill_item)
+    tieup_dosage, tieup_modality, tieup_bodypart = _extract_anchors(tieup_item)
+    
     # Dosage match (+0.4)
-    bill_dosage = extract_dosage(bill_item)
-    tieup_dosage = extract_dosage(tieup_item)
     if bill_dosage and tieup_dosage and bill_dosage == tieup_dosage:
         score += 0.4
         breakdown['dosage_match'] = True
     
     # Modality match (+0.3)
-    bill_modality = extract_modality(bill_item)
-    tieup_modality = extract_modality(tieup_item)
     if bill_modality and tieup_modality and bill_modality == tieup_modality:
         score += 0.3
         breakdown['modality_match'] = True
     
     # Body part match (+0.3)
-    bill_bodypart = extract_bodypart(bill_item)
-    tieup_bodypart = extract_bodypart(tieup_item)
     if bill_bodypart and tieup_bodypart and bill_bodypart == tieup_bodypart:
         score += 0.3
         breakdown['bodypart_match'] = True
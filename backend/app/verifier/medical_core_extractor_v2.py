@@ -13,7 +13,9 @@ This module extracts medical core while preserving critical semantic information
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List, Tuple
 from enum import Enum
 
@@ -36,7 +38,11 @@ class MedicalItemType(str, Enum):
 # Enhanced Extraction Result
 # =============================================================================
 
-@dataclass
+# Slotted results are smaller and faster to access (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MedicalCoreResult:
     """Result of medical core extraction with metadata."""
     core_text: str                      # Cleaned medical core
@@ -47,6 +53,22 @@ class MedicalCoreResult:
     route: Optional[str] = None         # Administration route
     modality: Optional[str] = None      # Diagnostic modality (MRI, CT, etc.)
     body_part: Optional[str] = None     # Body part (brain, chest, etc.)
+    dosage_norm: Optional[str] = field(default=None, init=False)  # Comparison key for dosage
+    
+    def __post_init__(self):
+        # Normalize and intern categorical fields once so that per-candidate
+        # comparisons reduce to identity checks on shared string objects.
+        if self.dosage:
+            self.dosage = sys.intern(self.dosage)
+            self.dosage_norm = sys.intern(self._normalize_dosage(self.dosage))
+        if self.form:
+            self.form = sys.intern(self.form)
+        if self.route:
+            self.route = sys.intern(self.route)
+        if self.modality:
+            self.modality = sys.intern(self.modality)
+        if self.body_part:
+            self.body_part = sys.intern(self.body_part)
     
     def has_dosage(self) -> bool:
         """Check if item has dosage information."""
@@ -57,25 +79,33 @@ class MedicalCoreResult:
         if not self.has_dosage() or not other.has_dosage():
             return True  # No dosage to compare
         
-        # Normalize dosages for comparison
-        self_dosage = self._normalize_dosage(self.dosage)
-        other_dosage = self._normalize_dosage(other.dosage)
-        
-        return self_dosage == other_dosage
+        # Dosages are normalized once at construction
+        return self.dosage_norm == other.dosage_norm
     
     @staticmethod
     def _normalize_dosage(dosage: str) -> str:
         """Normalize dosage for comparison (remove spaces, lowercase)."""
         if not dosage:
             return ""
-        # Extract number and unit
-        match = re.match(r'(\d+\.?\d*)\s*([a-z]+)', dosage.lower())
-        if match:
-            number, unit = match.groups()
-            # Normalize unit (mg, mcg, ml, etc.)
-            unit = unit.replace('µg', 'mcg').replace('gm', 'g')
-            return f"{number}{unit}"
-        return dosage.lower().replace(' ', '')
+        return _normalize_dosage_cached(dosage)
+
+
+# Number + unit at the start of a dosage string (e.g. "500 mg", "2.5ml")
+_DOSAGE_NORM_RE = re.compile(r'(\d+\.?\d*)\s*([a-z]+)')
+
+
+@lru_cache(maxsize=1024)
+def _normalize_dosage_cached(dosage: str) -> str:
+    """Cached body of MedicalCoreResult._normalize_dosage (few distinct dosages per tie-up)."""
+    dosage_lower = dosage.lower()
+    # Extract number and unit
+    match = _DOSAGE_NORM_RE.match(dosage_lower)
+    if match:
+        number, unit = match.groups()
+        # Normalize unit (mg, mcg, ml, etc.)
+        unit = unit.replace('µg', 'mcg').replace('gm', 'g')
+        return f"{number}{unit}"
+    return dosage_lower.replace(' ', '')
 
 
 # =============================================================================
@@ -157,6 +187,15 @@ ADMINISTRATION_ROUTES = {
 # Core Extraction Function V2
 # =============================================================================
 
+# Final cleaning: every non-word, non-space character becomes a space.
+# ASCII text (the common case) goes through a single str.translate pass.
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_SPECIAL_TO_SPACE = {
+    code: ' ' for code in range(128)
+    if _SPECIAL_CHARS_RE.match(chr(code))
+}
+
+
 def extract_medical_core_v2(text: str) -> MedicalCoreResult:
     """
     Extract medical core with enhanced metadata preservation.
@@ -252,9 +291,11 @@ def extract_medical_core_v2(text: str) -> MedicalCoreResult:
         core_text = cleaned
     
     # Step 8: Final cleaning
-    core_text = re.sub(r'[^\w\s]', ' ', core_text)  # Remove special chars
-    core_text = re.sub(r'\s+', ' ', core_text)      # Normalize whitespace
-    core_text = core_text.lower().strip()
+    if core_text.isascii():
+        core_text = core_text.translate(_SPECIAL_TO_SPACE)  # Remove special chars
+    else:
+        core_text = _SPECIAL_CHARS_RE.sub(' ', core_text)
+    core_text = ' '.join(core_text.split()).lower()      # Normalize whitespace
     
     return MedicalCoreResult(
         core_text=core_text,
@@ -12,8 +12,11 @@ Also includes validation functions to ensure:
 
 from __future__ import annotations
 
+import io
 import logging
-from typing import Dict, List, Tuple
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, Optional, TextIO, Tuple
 
 from app.verifier.models import (
     BillInput,
@@ -53,54 +56,107 @@ def validate_completeness(
         - is_complete: True if all items present exactly once
         - error_message: Empty if complete, otherwise describes the issue
     """
+    output_items, _ = _count_output_items(verification_response)
+    return _check_completeness(bill_input, output_items)
+
+
+def validate_summary_counters(
+    verification_response: VerificationResponse
+) -> Tuple[bool, str]:
+    """
+    Validate that summary counters match actual items.
+    
+    PHASE-7 CRITICAL: Ensures GREEN + RED + MISMATCH + ALLOWED_NOT_COMPARABLE == total items
+    
+    Args:
+        verification_response: Verification result
+        
+    Returns:
+        (is_valid, error_message)
+    """
+    _, status_counts = _count_output_items(verification_response)
+    return _check_summary_counters(verification_response, status_counts)
+
+
+def validate_response(
+    bill_input: BillInput,
+    verification_response: VerificationResponse
+) -> Tuple[Tuple[bool, str], Tuple[bool, str]]:
+    """
+    Run completeness and summary counter validation with one pass over the output.
+    
+    Args:
+        bill_input: Original bill input
+        verification_response: Verification result
+        
+    Returns:
+        ((is_complete, error_message), (is_valid, error_message))
+    """
+    output_items, status_counts = _count_output_items(verification_response)
+    return (
+        _check_completeness(bill_input, output_items),
+        _check_summary_counters(verification_response, status_counts),
+    )
+
+
+def _count_output_items(
+    verification_response: VerificationResponse
+) -> Tuple[Counter, Counter]:
+    """
+    Count output items and their statuses in a single traversal.
+    
+    Returns:
+        (Counter of (category, item, amount) tuples, Counter of statuses)
+    """
+    results = verification_response.results
+    output_items = Counter(chain.from_iterable(
+        ((cat_result.category, item_result.bill_item, item_result.bill_amount)
+         for item_result in cat_result.items)
+        for cat_result in results
+    ))
+    status_counts = Counter(
+        item_result.status
+        for item_result in chain.from_iterable(cat_result.items for cat_result in results)
+    )
+    return output_items, status_counts
+
+
+def _check_completeness(
+    bill_input: BillInput,
+    output_items: Counter
+) -> Tuple[bool, str]:
+    """Completeness check of validate_completeness() on pre-counted output items."""
     from app.db.artifact_filter import is_artifact_item
     
-    # Count input items (excluding artifacts)
-    input_items = []
+    # Count input items as a multiset, then drop artifacts per distinct item
+    input_items = Counter(chain.from_iterable(
+        ((category.category_name, item.item_name, item.amount) for item in category.items)
+        for category in bill_input.categories
+    ))
     filtered_count = 0
     
-    for category in bill_input.categories:
-        for item in category.items:
-            # PHASE-7: Skip artifacts
-            if is_artifact_item(category.category_name, item.item_name, item.amount, item.amount):
-                filtered_count += 1
-                logger.debug(
-                    f"Excluding artifact from validation: [{category.category_name}] "
-                    f"{item.item_name} - ₹{item.amount}"
-                )
-                continue
-            
-            input_items.append((category.category_name, item.item_name, item.amount))
+    for category_name, item_name, amount in list(input_items):
+        # PHASE-7: Skip artifacts
+        if is_artifact_item(category_name, item_name, amount, amount):
+            filtered_count += input_items.pop((category_name, item_name, amount))
+            logger.debug(
+                f"Excluding artifact from validation: [{category_name}] "
+                f"{item_name} - ₹{amount}"
+            )
     
-    input_count = len(input_items)
+    input_count = sum(input_items.values())
     
     if filtered_count > 0:
         logger.info(f"Excluded {filtered_count} artifact items from completeness validation")
     
-    # Count output items
-    output_items = []
-    for cat_result in verification_response.results:
-        for item_result in cat_result.items:
-            output_items.append((cat_result.category, item_result.bill_item, item_result.bill_amount))
-    
-    output_count = len(output_items)
+    output_count = sum(output_items.values())
     
     # Check counts match
     if input_count != output_count:
-        missing_items = []
-        duplicate_items = []
-        
-        # Find missing items (in input but not in output)
-        for inp_item in input_items:
-            if inp_item not in output_items:
-                missing_items.append(inp_item)
-        
-        # Find duplicate items (in output more than once)
-        seen = set()
-        for out_item in output_items:
-            if out_item in seen:
-                duplicate_items.append(out_item)
-            seen.add(out_item)
+        # Missing: in input more often than in output
+        missing_items = list((input_items - output_items).elements())
+        # Duplicate: in output more than once
+        duplicate_items = [item for item, count in output_items.items() if count > 1]
         
         error_parts = []
         if missing_items:
@@ -115,73 +171,41 @@ def validate_completeness(
         return False, error_msg
     
     # Check for duplicates even if counts match
-    if len(set(output_items)) != output_count:
-        return False, f"Duplicate items found in output (count={output_count}, unique={len(set(output_items))})"
+    if len(output_items) != output_count:
+        return False, f"Duplicate items found in output (count={output_count}, unique={len(output_items)})"
     
     return True, ""
 
 
-def validate_summary_counters(
-    verification_response: VerificationResponse
+def _check_summary_counters(
+    verification_response: VerificationResponse,
+    actual: Counter
 ) -> Tuple[bool, str]:
-    """
-    Validate that summary counters match actual items.
-    
-    PHASE-7 CRITICAL: Ensures GREEN + RED + MISMATCH + ALLOWED_NOT_COMPARABLE == total items
-    
-    Args:
-        verification_response: Verification result
-        
-    Returns:
-        (is_valid, error_message)
-    """
-    # Count actual items by status (Phase-8+: Include UNCLASSIFIED)
-    actual_green = 0
-    actual_red = 0
-    actual_mismatch = 0
-    actual_unclassified = 0
-    actual_allowed_not_comparable = 0
-    
-    for cat_result in verification_response.results:
-        for item_result in cat_result.items:
-            if item_result.status == VerificationStatus.GREEN:
-                actual_green += 1
-            elif item_result.status == VerificationStatus.RED:
-                actual_red += 1
-            elif item_result.status == VerificationStatus.UNCLASSIFIED:
-                actual_unclassified += 1
-            elif item_result.status == VerificationStatus.MISMATCH:
-                actual_mismatch += 1
-            elif item_result.status == VerificationStatus.ALLOWED_NOT_COMPARABLE:
-                actual_allowed_not_comparable += 1
-    
+    """Counter check of validate_summary_counters() on pre-counted statuses."""
     # Compare with summary counters (Phase-8+: Include UNCLASSIFIED)
-    summary_green = verification_response.green_count
-    summary_red = verification_response.red_count
-    summary_mismatch = verification_response.mismatch_count
-    summary_unclassified = verification_response.unclassified_count
-    summary_allowed = verification_response.allowed_not_comparable_count
-    
-    errors = []
-    
-    if actual_green != summary_green:
-        errors.append(f"GREEN: actual={actual_green}, summary={summary_green}")
-    if actual_red != summary_red:
-        errors.append(f"RED: actual={actual_red}, summary={summary_red}")
-    if actual_unclassified != summary_unclassified:
-        errors.append(f"UNCLASSIFIED: actual={actual_unclassified}, summary={summary_unclassified}")
-    if actual_mismatch != summary_mismatch:
-        errors.append(f"MISMATCH: actual={actual_mismatch}, summary={summary_mismatch}")
-    if actual_allowed_not_comparable != summary_allowed:
-        errors.append(f"ALLOWED_NOT_COMPARABLE: actual={actual_allowed_not_comparable}, summary={summary_allowed}")
+    vr = verification_response
+    counters = (
+        ("GREEN", actual[VerificationStatus.GREEN], vr.green_count),
+        ("RED", actual[VerificationStatus.RED], vr.red_count),
+        ("UNCLASSIFIED", actual[VerificationStatus.UNCLASSIFIED], vr.unclassified_count),
+        ("MISMATCH", actual[VerificationStatus.MISMATCH], vr.mismatch_count),
+        ("ALLOWED_NOT_COMPARABLE", actual[VerificationStatus.ALLOWED_NOT_COMPARABLE],
+         vr.allowed_not_comparable_count),
+    )
+    
+    errors = [
+        f"{name}: actual={actual_count}, summary={summary_count}"
+        for name, actual_count, summary_count in counters
+        if actual_count != summary_count
+    ]
     
     if errors:
         error_msg = "Counter mismatch: " + "; ".join(errors)
         return False, error_msg
     
     # Verify total (Phase-8+: Include UNCLASSIFIED)
-    total_actual = actual_green + actual_red + actual_unclassified + actual_mismatch + actual_allowed_not_comparable
-    total_summary = summary_green + summary_red + summary_unclassified + summary_mismatch + summary_allowed
+    total_actual = sum(actual_count for _, actual_count, _ in counters)
+    total_summary = sum(summary_count for _, _, summary_count in counters)
     
     if total_actual != total_summary:
         return False, f"Total mismatch: actual={total_actual}, summary={total_summary}"
@@ -193,10 +217,33 @@ def validate_summary_counters(
 # Rendering Functions
 # =============================================================================
 
+# Emoji icon per verification status
+_STATUS_ICONS: Dict[VerificationStatus, str] = {
+    VerificationStatus.GREEN: "✅",
+    VerificationStatus.RED: "❌",
+    VerificationStatus.UNCLASSIFIED: "⚠️",
+    VerificationStatus.MISMATCH: "🔶",  # Legacy
+    VerificationStatus.ALLOWED_NOT_COMPARABLE: "🟦",
+}
+
+# Per-item financial lines of the final view, by status
+_fmt_bill_allowed = "     → Bill: ₹{:.2f}, Allowed: ₹{:.2f}".format
+_fmt_bill_allowed_extra = "     → Bill: ₹{:.2f}, Allowed: ₹{:.2f}, Extra: ₹{:.2f}".format
+_fmt_bill_only = "     → Bill: ₹{:.2f}, Allowed: N/A, Extra: N/A".format
+
+# Statuses rendered without allowed/extra amounts
+_NOT_COMPARED_STATUSES = frozenset((
+    VerificationStatus.UNCLASSIFIED,
+    VerificationStatus.MISMATCH,
+    VerificationStatus.ALLOWED_NOT_COMPARABLE,
+))
+
+
 def render_final_view(
     verification_response: VerificationResponse,
-    options: RenderingOptions = None
-) -> str:
+    options: RenderingOptions = None,
+    out: Optional[TextIO] = None
+) -> Optional[str]:
     """
     Render clean user-facing view.
     
@@ -213,34 +260,38 @@ def render_final_view(
     Args:
         verification_response: Verification result
         options: Rendering options (defaults to standard view)
+        out: Stream to write the view to instead of returning it
         
     Returns:
-        Formatted string for display
+        Formatted string for display (None if written to ``out``)
     """
     if options is None:
         options = RenderingOptions()
     
-    lines = []
-    lines.append("=" * 80)
-    lines.append("VERIFICATION RESULTS (FINAL VIEW)")
-    lines.append("=" * 80)
+    # Lines are written as they are rendered; every line after the first
+    # starts with its newline separator
+    buf = io.StringIO() if out is None else out
+    write = buf.write
+    write("=" * 80)
+    write("\nVERIFICATION RESULTS (FINAL VIEW)")
+    write("\n" + "=" * 80)
     
     # Hospital info
-    lines.append(f"Hospital: {verification_response.hospital}")
+    write(f"\nHospital: {verification_response.hospital}")
     if verification_response.matched_hospital:
-        lines.append(f"Matched Hospital: {verification_response.matched_hospital}")
+        write(f"\nMatched Hospital: {verification_response.matched_hospital}")
         if verification_response.hospital_similarity is not None:
-            lines.append(f"Hospital Similarity: {verification_response.hospital_similarity:.2%}")
+            write(f"\nHospital Similarity: {verification_response.hospital_similarity:.2%}")
     
     # Summary statistics (Phase-8+: Include UNCLASSIFIED)
-    lines.append("")
-    lines.append("Summary:")
-    lines.append(f"  ✅ GREEN (Allowed): {verification_response.green_count}")
-    lines.append(f"  ❌ RED (Overcharged): {verification_response.red_count}")
-    lines.append(f"  ⚠️  UNCLASSIFIED (Needs Review): {verification_response.unclassified_count}")
+    write("\n")
+    write("\nSummary:")
+    write(f"\n  ✅ GREEN (Allowed): {verification_response.green_count}")
+    write(f"\n  ❌ RED (Overcharged): {verification_response.red_count}")
+    write(f"\n  ⚠️  UNCLASSIFIED (Needs Review): {verification_response.unclassified_count}")
     if verification_response.mismatch_count > 0:
-        lines.append(f"  🔶 MISMATCH (Legacy): {verification_response.mismatch_count}")
-    lines.append(f"  🟦 ALLOWED_NOT_COMPARABLE: {verification_response.allowed_not_comparable_count}")
+        write(f"\n  🔶 MISMATCH (Legacy): {verification_response.mismatch_count}")
+    write(f"\n  🟦 ALLOWED_NOT_COMPARABLE: {verification_response.allowed_not_comparable_count}")
     
     total_items = (
         verification_response.green_count +
@@ -249,91 +300,102 @@ def render_final_view(
         verification_response.mismatch_count +
         verification_response.allowed_not_comparable_count
     )
-    lines.append(f"  📊 Total Items: {total_items}")
+    write(f"\n  📊 Total Items: {total_items}")
     
     # Financial summary (Phase-8+: Include UNCLASSIFIED and reconciliation)
-    lines.append("")
-    lines.append("Financial Summary:")
-    lines.append("━" * 60)
-    lines.append(f"  Total Bill Amount:        ₹{verification_response.total_bill_amount:,.2f}")
-    lines.append(f"  Total Allowed Amount:     ₹{verification_response.total_allowed_amount:,.2f}")
-    lines.append(f"  Total Extra Amount:       ₹{verification_response.total_extra_amount:,.2f}")
-    lines.append(f"  Total Unclassified Amount:₹{verification_response.total_unclassified_amount:,.2f}  ← Needs Review")
-    lines.append("━" * 60)
+    write("\n")
+    write("\nFinancial Summary:")
+    write("\n" + "━" * 60)
+    write(f"\n  Total Bill Amount:        ₹{verification_response.total_bill_amount:,.2f}")
+    write(f"\n  Total Allowed Amount:     ₹{verification_response.total_allowed_amount:,.2f}")
+    write(f"\n  Total Extra Amount:       ₹{verification_response.total_extra_amount:,.2f}")
+    write(f"\n  Total Unclassified Amount:₹{verification_response.total_unclassified_amount:,.2f}  ← Needs Review")
+    write("\n" + "━" * 60)
     
     # Phase-8+: Show financial reconciliation status
     balanced_icon = "✅" if verification_response.financials_balanced else "❌"
-    lines.append(f"  Financials Balanced: {balanced_icon} {'YES' if verification_response.financials_balanced else 'NO'}")
+    write(f"\n  Financials Balanced: {balanced_icon} {'YES' if verification_response.financials_balanced else 'NO'}")
     
     if not verification_response.financials_balanced:
         expected = verification_response.total_allowed_amount + verification_response.total_extra_amount + verification_response.total_unclassified_amount
-        lines.append(f"  ⚠️  WARNING: Bill (₹{verification_response.total_bill_amount:.2f}) != Allowed + Extra + Unclassified (₹{expected:.2f})")
+        write(f"\n  ⚠️  WARNING: Bill (₹{verification_response.total_bill_amount:.2f}) != Allowed + Extra + Unclassified (₹{expected:.2f})")
     
     # Category-wise results (PHASE-7: Each category appears ONCE)
-    lines.append("")
-    lines.append("Category-wise Results:")
-    lines.append("-" * 80)
+    write("\n")
+    write("\nCategory-wise Results:")
+    write("\n" + "-" * 80)
+    
+    # Hoist per-item lookups out of the loop
+    show_normalized = options.show_normalized_names
+    show_similarity = options.show_similarity_scores
+    show_diagnostics = options.show_diagnostics
+    GREEN = VerificationStatus.GREEN
+    RED = VerificationStatus.RED
+    icon_of = _STATUS_ICONS.get
     
     for cat_result in verification_response.results:
         # Category header
-        lines.append("")
-        lines.append(f"📁 Category: {cat_result.category}")
+        write(f"\n\n📁 Category: {cat_result.category}")
         if cat_result.matched_category:
-            lines.append(f"   Matched: {cat_result.matched_category}")
+            write(f"\n   Matched: {cat_result.matched_category}")
             if cat_result.category_similarity is not None:
-                lines.append(f"   Similarity: {cat_result.category_similarity:.2%}")
+                write(f"\n   Similarity: {cat_result.category_similarity:.2%}")
         
         # Items in this category
         for item_result in cat_result.items:
             status = item_result.status
-            status_icon = _get_status_icon(status)
+            status_icon = icon_of(status, "❓")
             
             # Item line
             item_line = f"  {status_icon} {item_result.bill_item}"
-            if options.show_normalized_names and item_result.normalized_item_name:
+            if show_normalized and item_result.normalized_item_name:
                 item_line += f" (normalized: {item_result.normalized_item_name})"
-            lines.append(item_line)
+            write("\n" + item_line)
             
             # Matched item
             if item_result.matched_item:
-                lines.append(f"     → Matched: {item_result.matched_item}")
-                if options.show_similarity_scores and item_result.similarity_score is not None:
-                    lines.append(f"     → Similarity: {item_result.similarity_score:.2%}")
+                write(f"\n     → Matched: {item_result.matched_item}")
+                if show_similarity and item_result.similarity_score is not None:
+                    write(f"\n     → Similarity: {item_result.similarity_score:.2%}")
             
             # Financial details (PHASE-7: Strict rules based on status)
-            financial_line = f"     → "
-            if status == VerificationStatus.GREEN:
-                financial_line += f"Bill: ₹{item_result.bill_amount:.2f}, Allowed: ₹{item_result.allowed_amount:.2f}"
+            if status == GREEN:
                 if item_result.extra_amount > 0:
-                    financial_line += f", Extra: ₹{item_result.extra_amount:.2f}"
-            elif status == VerificationStatus.RED:
-                financial_line += (
-                    f"Bill: ₹{item_result.bill_amount:.2f}, "
-                    f"Allowed: ₹{item_result.allowed_amount:.2f}, "
-                    f"Extra: ₹{item_result.extra_amount:.2f}"
+                    financial_line = _fmt_bill_allowed_extra(
+                        item_result.bill_amount, item_result.allowed_amount, item_result.extra_amount
+                    )
+                else:
+                    financial_line = _fmt_bill_allowed(item_result.bill_amount, item_result.allowed_amount)
+            elif status == RED:
+                financial_line = _fmt_bill_allowed_extra(
+                    item_result.bill_amount, item_result.allowed_amount, item_result.extra_amount
                 )
-            elif status in (VerificationStatus.UNCLASSIFIED, VerificationStatus.MISMATCH, VerificationStatus.ALLOWED_NOT_COMPARABLE):
-                financial_line += f"Bill: ₹{item_result.bill_amount:.2f}, Allowed: N/A, Extra: N/A"
+            elif status in _NOT_COMPARED_STATUSES:
+                financial_line = _fmt_bill_only(item_result.bill_amount)
+            else:
+                financial_line = "     → "
             
-            lines.append(financial_line)
+            write("\n" + financial_line)
             
             # Diagnostics (if enabled and present)
-            if options.show_diagnostics and item_result.diagnostics:
+            if show_diagnostics and item_result.diagnostics:
                 diag = item_result.diagnostics
-                lines.append(f"     → Reason: {diag.failure_reason}")
+                write(f"\n     → Reason: {diag.failure_reason}")
                 if diag.best_candidate:
-                    lines.append(f"     → Best Candidate: {diag.best_candidate}")
+                    write(f"\n     → Best Candidate: {diag.best_candidate}")
     
-    lines.append("")
-    lines.append("=" * 80)
+    write("\n")
+    write("\n" + "=" * 80)
     
-    return "\n".join(lines)
+    return buf.getvalue() if out is None else None
 
 
 def render_debug_view(
     verification_response: VerificationResponse,
-    debug_info: Dict[str, DebugItemInfo]
-) -> str:
+    debug_info: Dict[str, DebugItemInfo],
+    final_view: Optional[str] = None,
+    out: Optional[TextIO] = None
+) -> Optional[str]:
     """
     Render detailed debug view.
     
@@ -343,75 +405,69 @@ def render_debug_view(
     Args:
         verification_response: Verification result
         debug_info: Debug information for each item
+        final_view: Already rendered final view to embed (rendered with
+                    default options if not given)
+        out: Stream to write the view to instead of returning it
         
     Returns:
-        Formatted debug output
+        Formatted debug output (None if written to ``out``)
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("VERIFICATION RESULTS (DEBUG VIEW)")
-    lines.append("=" * 80)
+    buf = io.StringIO() if out is None else out
+    write = buf.write
+    write("=" * 80)
+    write("\nVERIFICATION RESULTS (DEBUG VIEW)")
+    write("\n" + "=" * 80)
     
     # First show final view
-    lines.append("")
-    lines.append("[FINAL VIEW]")
-    lines.append(render_final_view(verification_response))
+    write("\n")
+    write("\n[FINAL VIEW]")
+    write("\n")
+    if final_view is None:
+        render_final_view(verification_response, out=buf)
+    else:
+        write(final_view)
     
     # Then show debug details
-    lines.append("")
-    lines.append("=" * 80)
-    lines.append("[DEBUG DETAILS]")
-    lines.append("=" * 80)
+    write("\n")
+    write("\n" + "=" * 80)
+    write("\n[DEBUG DETAILS]")
+    write("\n" + "=" * 80)
+    
+    get_info = debug_info.get
     
     for cat_result in verification_response.results:
-        lines.append("")
-        lines.append(f"Category: {cat_result.category}")
-        lines.append("-" * 80)
+        category = cat_result.category
+        write(f"\n\nCategory: {category}")
+        write("\n" + "-" * 80)
         
         for item_result in cat_result.items:
-            item_key = f"{cat_result.category}::{item_result.bill_item}"
-            
-            lines.append("")
-            lines.append(f"  Item: {item_result.bill_item}")
-            lines.append(f"  Status: {item_result.status}")
+            bill_item = item_result.bill_item
+            write(f"\n\n  Item: {bill_item}\n  Status: {item_result.status}")
             
             # Show debug info if available
-            if item_key in debug_info:
-                info = debug_info[item_key]
-                lines.append(f"  Original: {info.bill_item_original}")
-                lines.append(f"  Normalized: {info.normalized_item}")
-                lines.append(f"  Final Decision: {info.final_decision}")
-                lines.append(f"  Decision Reason: {info.decision_reason}")
-                
-                if info.category_attempts:
-                    lines.append("  Category Attempts:")
-                    for attempt in info.category_attempts:
-                        lines.append(f"    - {attempt}")
-                
-                if info.item_candidates:
-                    lines.append("  Item Candidates:")
-                    for candidate in info.item_candidates:
-                        lines.append(f"    - {candidate}")
-            else:
-                lines.append("  [No debug info available]")
+            info = get_info(f"{category}::{bill_item}")
+            if info is None:
+                write("\n  [No debug info available]")
+                continue
+            
+            write(
+                f"\n  Original: {info.bill_item_original}"
+                f"\n  Normalized: {info.normalized_item}"
+                f"\n  Final Decision: {info.final_decision}"
+                f"\n  Decision Reason: {info.decision_reason}"
+            )
+            
+            if info.category_attempts:
+                write("\n  Category Attempts:")
+                for attempt in info.category_attempts:
+                    write(f"\n    - {attempt}")
+            
+            if info.item_candidates:
+                write("\n  Item Candidates:")
+                for candidate in info.item_candidates:
+                    write(f"\n    - {candidate}")
     
-    lines.append("")
-    lines.append("=" * 80)
+    write("\n")
+    write("\n" + "=" * 80)
     
-    return "\n".join(lines)
-
-
-def _get_status_icon(status: VerificationStatus) -> str:
-    """Get emoji icon for verification status."""
-    if status == VerificationStatus.GREEN:
-        return "✅"
-    elif status == VerificationStatus.RED:
-        return "❌"
-    elif status == VerificationStatus.UNCLASSIFIED:
-        return "⚠️"
-    elif status == VerificationStatus.MISMATCH:
-        return "🔶"  # Legacy
-    elif status == VerificationStatus.ALLOWED_NOT_COMPARABLE:
-        return "🟦"
-    else:
-        return "❓"
+    return buf.getvalue() if out is None else None
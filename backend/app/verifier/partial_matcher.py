@@ -17,10 +17,23 @@ Without hardcoding specific item names.
 from __future__ import annotations
 
 import re
-from typing import Set, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 
+# Common medical stop words
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'of', 'for', 'with', 'in', 'on', 'at',
+    'to', 'from', 'by', 'and', 'or', 'but', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'should', 'could',
+    'may', 'might', 'must', 'can', 'shall',
+})
 
-def extract_core_terms(text: str) -> Set[str]:
+_PUNCTUATION_RE = re.compile(r'[^\w]')
+
+
+@lru_cache(maxsize=4096)
+def extract_core_terms(text: str) -> FrozenSet[str]:
     """
     Extract core medical/service terms from text.
     
@@ -28,29 +41,20 @@ def extract_core_terms(text: str) -> Set[str]:
     - Common stop words (the, a, an, of, for, with, etc.)
     - Very short words (< 2 chars)
     - Pure numbers
+
+    Memoized: the same bill and tie-up names are compared against many
+    candidates, so each text is tokenized once.
     
     Args:
         text: Input text (should be normalized)
         
     Returns:
-        Set of core terms
+        Frozen set of core terms
     """
-    # Common medical stop words
-    stop_words = {
-        'the', 'a', 'an', 'of', 'for', 'with', 'in', 'on', 'at',
-        'to', 'from', 'by', 'and', 'or', 'but', 'is', 'are',
-        'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
-        'do', 'does', 'did', 'will', 'would', 'should', 'could',
-        'may', 'might', 'must', 'can', 'shall',
-    }
-    
-    # Tokenize and filter
-    tokens = text.lower().split()
-    
     core_terms = set()
-    for token in tokens:
+    for token in text.lower().split():
         # Remove punctuation
-        token = re.sub(r'[^\w]', '', token)
+        token = _PUNCTUATION_RE.sub('', token)
         
         # Skip if too short
         if len(token) < 2:
@@ -61,12 +65,12 @@ def extract_core_terms(text: str) -> Set[str]:
             continue
         
         # Skip stop words
-        if token in stop_words:
+        if token in _STOP_WORDS:
             continue
         
         core_terms.add(token)
     
-    return core_terms
+    return frozenset(core_terms)
 
 
 def calculate_token_overlap(text1: str, text2: str) -> float:
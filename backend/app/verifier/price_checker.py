@@ -10,20 +10,39 @@ Pricing logic:
 Status determination:
 - GREEN: bill_amount <= allowed_amount
 - RED: bill_amount > allowed_amount (overcharged)
+
+Amounts are compared as whole paise (integers) so that the comparison and
+the extra amount are exact; rupee floats are produced only for results.
 """
 
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
 
 from app.verifier.models import ItemType, TieUpItem, VerificationStatus
 
 logger = logging.getLogger(__name__)
 
+# One result per bill line: slotted (Python 3.10+) and immutable
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Status codes used by check_prices_bulk; index into PRICE_STATUS_CODES
+GREEN_CODE = 0
+RED_CODE = 1
+UNCLASSIFIED_CODE = 2
+PRICE_STATUS_CODES = (
+    VerificationStatus.GREEN,
+    VerificationStatus.RED,
+    VerificationStatus.UNCLASSIFIED,
+)
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PriceCheckResult:
     """Result of a price comparison."""
     status: VerificationStatus
@@ -37,6 +56,30 @@ class PriceCheckResult:
         return self.status == VerificationStatus.RED
 
 
+def _to_paise(amount: float) -> int:
+    """Convert a rupee amount to whole paise (rounded to nearest)."""
+    return round(amount * 100)
+
+
+# Allowed-amount formula per item type: (rate, quantity) -> allowed
+_ALLOWED_CALC = {
+    ItemType.UNIT: lambda rate, quantity: rate * quantity,     # Per-unit pricing
+    ItemType.SERVICE: lambda rate, quantity: rate,             # Fixed service price
+    ItemType.BUNDLE: lambda rate, quantity: rate,              # Package/bundle price
+}
+
+
+def _allowed_paise(tieup_item: TieUpItem, quantity: float) -> int:
+    """Allowed amount in paise based on tie-up rate and item type."""
+    calc = _ALLOWED_CALC.get(tieup_item.type)
+    if calc is None:
+        # Default to unit pricing for unknown types
+        logger.warning(f"Unknown item type '{tieup_item.type}', defaulting to unit pricing")
+        calc = _ALLOWED_CALC[ItemType.UNIT]
+    
+    return _to_paise(calc(tieup_item.rate, quantity))
+
+
 def calculate_allowed_amount(
     tieup_item: TieUpItem,
     quantity: float = 1.0
@@ -49,26 +92,9 @@ def calculate_allowed_amount(
         quantity: Quantity from the bill (used only for 'unit' type)
         
     Returns:
-        The maximum allowed amount
+        The maximum allowed amount (rounded to paise)
     """
-    rate = tieup_item.rate
-    item_type = tieup_item.type
-    
-    if item_type == ItemType.UNIT:
-        # Per-unit pricing: rate × quantity
-        allowed = rate * quantity
-    elif item_type == ItemType.SERVICE:
-        # Fixed service price (quantity doesn't matter)
-        allowed = rate
-    elif item_type == ItemType.BUNDLE:
-        # Package/bundle price (quantity doesn't matter)
-        allowed = rate
-    else:
-        # Default to unit pricing for unknown types
-        logger.warning(f"Unknown item type '{item_type}', defaulting to unit pricing")
-        allowed = rate * quantity
-    
-    return round(allowed, 2)
+    return _allowed_paise(tieup_item, quantity) / 100
 
 
 def check_price(
@@ -87,41 +113,81 @@ def check_price(
     Returns:
         PriceCheckResult with status, amounts, and extra charge
     """
-    bill_amount = round(bill_amount, 2)
+    bill_paise = _to_paise(bill_amount)
     
     # No match = UNCLASSIFIED status (Phase-8+: third financial bucket)
     if tieup_item is None:
         return PriceCheckResult(
             status=VerificationStatus.UNCLASSIFIED,
-            bill_amount=bill_amount,
+            bill_amount=bill_paise / 100,
             allowed_amount=0.0,
             extra_amount=0.0
         )
     
     # Calculate allowed amount
-    allowed_amount = calculate_allowed_amount(tieup_item, quantity)
+    allowed_paise = _allowed_paise(tieup_item, quantity)
     
     # Determine status
-    if bill_amount <= allowed_amount:
+    if bill_paise <= allowed_paise:
         # Within allowed limit
         status = VerificationStatus.GREEN
-        extra_amount = 0.0
+        extra_paise = 0
     else:
         # Overcharged
         status = VerificationStatus.RED
-        extra_amount = round(bill_amount - allowed_amount, 2)
+        extra_paise = bill_paise - allowed_paise
     
-    logger.debug(
-        f"Price check: bill={bill_amount}, allowed={allowed_amount}, "
-        f"extra={extra_amount}, status={status.value}"
+    result = PriceCheckResult(
+        status=status,
+        bill_amount=bill_paise / 100,
+        allowed_amount=allowed_paise / 100,
+        extra_amount=extra_paise / 100
     )
     
-    return PriceCheckResult(
-        status=status,
-        bill_amount=bill_amount,
-        allowed_amount=allowed_amount,
-        extra_amount=extra_amount
+    logger.debug(
+        "Price check: bill=%s, allowed=%s, extra=%s, status=%s",
+        result.bill_amount, result.allowed_amount, result.extra_amount, status.value,
     )
+    
+    return result
+
+
+def check_prices_bulk(
+    bill_amounts: np.ndarray,
+    allowed_amounts: np.ndarray,
+    has_match: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized check_price over arrays of already computed allowed amounts.
+    
+    Uses the same paise arithmetic as check_price, so element i gives the
+    same status and extra amount as a scalar check of the same inputs.
+    
+    Args:
+        bill_amounts: Amounts charged in the bill
+        allowed_amounts: Allowed amounts (see calculate_allowed_amount)
+        has_match: Boolean mask of items with a tie-up match (default: all)
+        
+    Returns:
+        Tuple of (status_codes, extra_amounts):
+        - status_codes: int8 array, index into PRICE_STATUS_CODES
+        - extra_amounts: float64 array, 0 unless RED
+    """
+    bill_paise = np.rint(np.asarray(bill_amounts, dtype=np.float64) * 100)
+    allowed_paise = np.rint(np.asarray(allowed_amounts, dtype=np.float64) * 100)
+    
+    overcharged = bill_paise > allowed_paise
+    if has_match is not None:
+        has_match = np.asarray(has_match, dtype=bool)
+        overcharged &= has_match
+    
+    status_codes = np.where(overcharged, RED_CODE, GREEN_CODE).astype(np.int8)
+    if has_match is not None:
+        status_codes[~has_match] = UNCLASSIFIED_CODE
+    
+    extra_amounts = np.where(overcharged, bill_paise - allowed_paise, 0.0) / 100
+    
+    return status_codes, extra_amounts
 
 
 def create_mismatch_result(bill_amount: float) -> PriceCheckResult:
@@ -139,7 +205,7 @@ def create_mismatch_result(bill_amount: float) -> PriceCheckResult:
     """
     return PriceCheckResult(
         status=VerificationStatus.UNCLASSIFIED,
-        bill_amount=round(bill_amount, 2),
+        bill_amount=_to_paise(bill_amount) / 100,
         allowed_amount=0.0,
         extra_amount=0.0
     )
@@ -8,6 +8,7 @@ Handles common OCR artifacts like numbering, doctor names, separators, etc.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 # =============================================================================
@@ -45,6 +46,12 @@ SPLIT_PATTERNS = [
     r"\s+\|\s+Dr", # Pipe before doctor
 ]
 
+# Pseudo-category names skipped during verification (artifacts from old schema)
+SKIP_CATEGORY_NAMES = frozenset({"hospital", "hospital -", "hospital-", "hospital_"})
+
+# Category names made of special characters only
+_SPECIAL_CHARS_ONLY_RE = re.compile(r"^[\W_]+$")
+
 
 # =============================================================================
 # Normalization Functions
@@ -156,18 +163,22 @@ def should_skip_category(category_name: str) -> bool:
     if not category_name or not isinstance(category_name, str):
         return True
     
-    normalized = category_name.strip().lower()
-    
+    return _should_skip_normalized_category(category_name.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _should_skip_normalized_category(normalized: str) -> bool:
+    """should_skip_category() on a stripped, lower-cased name (memoized)."""
     # Skip empty or very short
     if len(normalized) < 2:
         return True
     
     # Skip "Hospital" pseudo-category (artifact from old schema)
-    if normalized in ["hospital", "hospital -", "hospital-", "hospital_"]:
+    if normalized in SKIP_CATEGORY_NAMES:
         return True
     
     # Skip if only special characters
-    if re.match(r"^[\W_]+$", normalized):
+    if _SPECIAL_CHARS_ONLY_RE.match(normalized):
         return True
     
     return False
@@ -255,8 +266,12 @@ def is_administrative_charge(text: str) -> bool:
     if not text or not isinstance(text, str):
         return False
     
-    text_lower = text.strip().lower()
-    
+    return _is_administrative_charge_normalized(text.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _is_administrative_charge_normalized(text_lower: str) -> bool:
+    """is_administrative_charge() on a stripped, lower-cased name (memoized)."""
     # PHASE-1: Administrative charge patterns
     ADMIN_PATTERNS = [
         r'\b(registration|admission|processing|file)\s+(fee|charge)s?\b',
@@ -17,15 +17,33 @@ Processing Flow:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+# orjson parses rate sheets several times faster than stdlib json (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from app.verifier.financial_contribution import (
+    FinancialContribution,
+    aggregate_contributions,
+    calculate_financial_contribution,
+)
 from app.verifier.matcher import (
     CATEGORY_SIMILARITY_THRESHOLD,
     ITEM_SIMILARITY_THRESHOLD,
+    ItemMatch,
     SemanticMatcher,
     get_matcher,
 )
@@ -34,15 +52,57 @@ from app.verifier.models import (
     BillInput,
     BillItem,
     CategoryVerificationResult,
+    FailureReason,
     ItemVerificationResult,
+    MismatchDiagnostics,
     TieUpRateSheet,
     VerificationResponse,
     VerificationStatus,
 )
+from app.verifier.output_renderer import validate_response
 from app.verifier.price_checker import check_price, create_mismatch_result
+from app.verifier.text_normalizer import is_administrative_charge, should_skip_category
 
 logger = logging.getLogger(__name__)
 
+# Worker threads used to verify the categories of one bill concurrently.
+# Only the GIL-releasing parts overlap across categories: batch encoding,
+# FAISS search and LLM HTTP calls. Per-item re-ranking (prefilter, medical
+# core extraction, regex, hybrid scoring, calibration, result models) is
+# pure Python and stays serialized by the GIL, so more workers mainly help
+# bills that wait on the encoder or the LLM. Set to 1 to verify categories
+# sequentially.
+CATEGORY_MATCH_WORKERS = int(os.getenv("CATEGORY_MATCH_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+# In-memory LRU of verification responses keyed by bill content
+# (re-submitted bills skip matching entirely). Set to 0 to disable.
+VERIFY_CACHE_SIZE = int(os.getenv("VERIFY_CACHE_SIZE", "512"))
+
+# PHASE-7 completeness/counter validation re-walks every item of the
+# response; it is a diagnostic, so it only runs when explicitly enabled.
+VALIDATE_RESPONSES = os.getenv("BILL_VERIFIER_VALIDATE", "0") == "1"
+
+# VerificationResponse summary counter per item status
+_STATUS_COUNTERS = {
+    VerificationStatus.GREEN: "green_count",
+    VerificationStatus.RED: "red_count",
+    VerificationStatus.UNCLASSIFIED: "unclassified_count",
+    VerificationStatus.MISMATCH: "mismatch_count",
+    VerificationStatus.ALLOWED_NOT_COMPARABLE: "allowed_not_comparable_count",
+}
+
+# V2 failure reason (FailureReasonV2 value) -> closest V1 FailureReason;
+# anything else maps to LOW_SIMILARITY
+_V2_REASON_MAP = {
+    "DOSAGE_MISMATCH": FailureReason.LOW_SIMILARITY,
+    "FORM_MISMATCH": FailureReason.LOW_SIMILARITY,
+    "WRONG_CATEGORY": FailureReason.CATEGORY_CONFLICT,
+    "CATEGORY_CONFLICT": FailureReason.CATEGORY_CONFLICT,
+    "ADMIN_CHARGE": FailureReason.ADMIN_CHARGE,
+    "PACKAGE_ONLY": FailureReason.PACKAGE_ONLY,
+    "NOT_IN_TIEUP": FailureReason.NOT_IN_TIEUP,
+}
+
 
 # =============================================================================
 # Tie-Up Rate Sheet Loader
@@ -52,15 +112,36 @@ def load_tieup_from_file(file_path: str) -> TieUpRateSheet:
     """
     Load a single tie-up rate sheet from a JSON file.
     
+    Parsed sheets are cached per (path, mtime, size), so reloading an
+    unchanged file costs one stat() call; editing the file invalidates it.
+    Cached sheets are shared between callers and must not be mutated.
+    
     Args:
         file_path: Path to the JSON file
         
     Returns:
         TieUpRateSheet object
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return TieUpRateSheet(**data)
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return _load_tieup_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_tieup_cached(path: str, mtime_ns: int, size: int) -> TieUpRateSheet:
+    """Parse a rate sheet; mtime_ns and size only serve as cache key."""
+    data = _json_loads(Path(path).read_bytes())
+    return TieUpRateSheet.model_validate(data)
+
+
+def _safe_load_tieup(
+    file_path: Path
+) -> Tuple[Path, Optional[TieUpRateSheet], Optional[Exception]]:
+    """Load one rate sheet, returning the error instead of raising (for worker threads)."""
+    try:
+        return file_path, load_tieup_from_file(str(file_path)), None
+    except Exception as e:
+        return file_path, None, e
 
 
 def load_all_tieups(directory: str) -> List[TieUpRateSheet]:
@@ -95,18 +176,45 @@ def load_all_tieups(directory: str) -> List[TieUpRateSheet]:
         logger.warning(f"No JSON files found in: {abs_dir_path}")
         return rate_sheets
     
-    for file_path in json_files:
-        try:
-            rate_sheet = load_tieup_from_file(str(file_path))
-            rate_sheets.append(rate_sheet)
-            logger.info(f"✅ Loaded: {rate_sheet.hospital_name} ({file_path.name})")
-        except Exception as e:
-            logger.error(f"❌ Failed to load {file_path.name}: {e}")
+    # Read and parse files concurrently (file I/O releases the GIL);
+    # results come back in file order and are logged here.
+    with ThreadPoolExecutor(max_workers=min(16, len(json_files))) as pool:
+        results = list(pool.map(_safe_load_tieup, json_files))
+    
+    for file_path, rate_sheet, error in results:
+        if error is not None:
+            logger.error(f"❌ Failed to load {file_path.name}: {error}")
+            continue
+        rate_sheets.append(rate_sheet)
+        logger.info(f"✅ Loaded: {rate_sheet.hospital_name} ({file_path.name})")
     
     logger.info(f"Successfully loaded {len(rate_sheets)}/{len(json_files)} rate sheets")
     return rate_sheets
 
 
+# =============================================================================
+# Category Worker Pool
+# =============================================================================
+
+_category_pool: Optional[ThreadPoolExecutor] = None
+_category_pool_lock = threading.Lock()
+
+
+def _get_category_pool() -> ThreadPoolExecutor:
+    """Get or create the worker pool shared by all bills (threads are reused across requests)."""
+    global _category_pool
+    
+    if _category_pool is None:
+        with _category_pool_lock:
+            if _category_pool is None:
+                _category_pool = ThreadPoolExecutor(
+                    max_workers=max(1, CATEGORY_MATCH_WORKERS),
+                    thread_name_prefix="verify-category",
+                )
+    
+    return _category_pool
+
+
 # =============================================================================
 # Bill Verifier Service
 # =============================================================================
@@ -134,12 +242,20 @@ class BillVerifier:
         # Use config-based ABSOLUTE path resolution
         # CRITICAL: Always use get_tieup_dir() which returns absolute path
         # This ensures the path works regardless of current working directory
-        from app.config import get_tieup_dir
-        self.tieup_directory = tieup_directory or os.getenv(
-            "TIEUP_DATA_DIR", 
-            get_tieup_dir()  # Returns absolute path string
-        )
+        # (only resolved when neither the argument nor TIEUP_DATA_DIR is given)
+        self.tieup_directory = tieup_directory or os.getenv("TIEUP_DATA_DIR")
+        if self.tieup_directory is None:
+            from app.config import get_tieup_dir
+            self.tieup_directory = get_tieup_dir()  # Returns absolute path string
         self._initialized = False
+        self._validation_enabled = VALIDATE_RESPONSES
+        
+        # Responses by bill content digest; valid until the next initialize()
+        self._response_cache: OrderedDict[bytes, VerificationResponse] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
+        # Serializes the lazy initialize() of concurrent first requests
+        self._init_lock = threading.Lock()
         
         logger.info(f"BillVerifier initialized with tie-up directory: {self.tieup_directory}")
     
@@ -168,6 +284,8 @@ class BillVerifier:
             raise RuntimeError(error_msg)
         
         self.matcher.index_rate_sheets(rate_sheets)
+        with self._response_cache_lock:
+            self._response_cache.clear()
         self._initialized = True
         logger.info(f"✅ BillVerifier initialized with {len(rate_sheets)} rate sheets")
         
@@ -179,6 +297,10 @@ class BillVerifier:
         """
         Verify a hospital bill against tie-up rates.
         
+        Identical bills (same content, e.g. re-submissions and retries) are
+        answered from an in-memory LRU until the verifier is re-initialized.
+        Each caller gets its own copy of the response.
+        
         Args:
             bill: BillInput object (from MongoDB)
             
@@ -186,8 +308,34 @@ class BillVerifier:
             VerificationResponse with all verification results
         """
         if not self._initialized:
-            self.initialize()
+            with self._init_lock:
+                if not self._initialized:
+                    self.initialize()
+        
+        if VERIFY_CACHE_SIZE <= 0:
+            return self._verify_bill(bill)
         
+        key = hashlib.blake2b(bill.model_dump_json().encode("utf-8"), digest_size=16).digest()
+        
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+        if cached is not None:
+            logger.info(f"Verification cache hit for bill from hospital: {bill.hospital_name}")
+            return cached.model_copy(deep=True)
+        
+        response = self._verify_bill(bill)
+        
+        with self._response_cache_lock:
+            self._response_cache[key] = response.model_copy(deep=True)
+            while len(self._response_cache) > VERIFY_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        
+        return response
+    
+    def _verify_bill(self, bill: BillInput) -> VerificationResponse:
+        """Verify a bill without consulting the response cache (see verify_bill)."""
         logger.info(f"Verifying bill from hospital: {bill.hospital_name}")
         
         # Step 1: Match hospital
@@ -197,8 +345,9 @@ class BillVerifier:
             # No matching hospital - all items are MISMATCH
             logger.warning(f"No matching hospital found for: {bill.hospital_name}")
             response = self._create_all_mismatch_response(bill)
-            # PHASE-7: Validate before returning
-            self._validate_response(bill, response)
+            # PHASE-7: Validate before returning (opt-in)
+            if self._validation_enabled:
+                self._validate_response(bill, response)
             return response
         
         matched_hospital = hospital_match.matched_text
@@ -209,16 +358,17 @@ class BillVerifier:
             f"(similarity={hospital_match.similarity:.4f})"
         )
         
-        # Initialize response
-        response = VerificationResponse(
+        # Initialize response. Result models are built from values that are
+        # already typed (validated bill input, matcher and price results), so
+        # model_construct skips re-validating them field by field.
+        response = VerificationResponse.model_construct(
             hospital=bill.hospital_name,
             matched_hospital=matched_hospital,
             hospital_similarity=hospital_match.similarity,
         )
         
         # Step 2: Process each category (with filtering)
-        from app.verifier.text_normalizer import should_skip_category
-        
+        categories_to_verify = []
         for bill_category in bill.categories:
             # Skip pseudo-categories (e.g., "Hospital -" artifact)
             if should_skip_category(bill_category.category_name):
@@ -227,43 +377,58 @@ class BillVerifier:
                     f"({len(bill_category.items)} items ignored)"
                 )
                 continue
-            
-            category_result = self._verify_category(
-                bill_category=bill_category,
-                hospital_name=matched_hospital,
-            )
+            categories_to_verify.append(bill_category)
+        
+        # Encode all category names and matchable items of the bill in one
+        # batch up front; per-category matching below then reuses the cached
+        # query vectors.
+        self.matcher.prefetch_item_embeddings(
+            [
+                bill_item.item_name
+                for bill_category in categories_to_verify
+                for bill_item in bill_category.items
+                if not is_administrative_charge(bill_item.item_name)
+            ],
+            category_names=[c.category_name for c in categories_to_verify],
+        )
+        
+        category_results = self._verify_categories(categories_to_verify, matched_hospital)
+        
+        # Single pass over all items: status counts and contributions together
+        calc = calculate_financial_contribution
+        status_counts: Dict[VerificationStatus, int] = {}
+        count_of = status_counts.get
+        contributions: List[FinancialContribution] = []
+        add_contribution = contributions.append
+        
+        for category_result in category_results:
             response.results.append(category_result)
             
             # Phase-8+ CORRECTED: Use single source of truth for financial contributions
             # This fixes the critical bug where IGNORED_ARTIFACT items were added to
             # total_bill_amount but not to any bucket, causing financial imbalance.
-            from app.verifier.financial_contribution import calculate_financial_contribution
-            
             for item_result in category_result.items:
-                # Calculate financial contribution (single source of truth)
-                contribution = calculate_financial_contribution(item_result)
-                
                 # Update status counts (all items counted)
-                if item_result.status == VerificationStatus.GREEN:
-                    response.green_count += 1
-                elif item_result.status == VerificationStatus.RED:
-                    response.red_count += 1
-                elif item_result.status == VerificationStatus.UNCLASSIFIED:
-                    response.unclassified_count += 1
-                elif item_result.status == VerificationStatus.MISMATCH:
-                    response.mismatch_count += 1
-                elif item_result.status == VerificationStatus.ALLOWED_NOT_COMPARABLE:
-                    response.allowed_not_comparable_count += 1
-                # IGNORED_ARTIFACT is counted implicitly (not in any status bucket)
+                status = item_result.status
+                status_counts[status] = count_of(status, 0) + 1
                 
-                # Update financial totals (ONLY for non-excluded items)
-                # CRITICAL: This is where IGNORED_ARTIFACT and ALLOWED_NOT_COMPARABLE
-                # are properly excluded from ALL financial totals
-                if not contribution.is_excluded:
-                    response.total_bill_amount += contribution.bill_amount
-                    response.total_allowed_amount += contribution.allowed_contribution
-                    response.total_extra_amount += contribution.extra_contribution
-                    response.total_unclassified_amount += contribution.unclassified_contribution
+                # Calculate financial contribution (single source of truth)
+                add_contribution(calc(item_result))
+        
+        # Update financial totals (ONLY for non-excluded items)
+        # CRITICAL: aggregate_contributions is where IGNORED_ARTIFACT and
+        # ALLOWED_NOT_COMPARABLE are properly excluded from ALL financial totals
+        totals = aggregate_contributions(contributions)
+        response.total_bill_amount += totals["bill"]
+        response.total_allowed_amount += totals["allowed"]
+        response.total_extra_amount += totals["extra"]
+        response.total_unclassified_amount += totals["unclassified"]
+        
+        # IGNORED_ARTIFACT is counted implicitly (not in any status bucket)
+        for status, counter_name in _STATUS_COUNTERS.items():
+            count = count_of(status, 0)
+            if count:
+                setattr(response, counter_name, getattr(response, counter_name) + count)
         
         # Phase-8+ CORRECTED: Validate financial reconciliation
         expected_total = (
@@ -304,8 +469,9 @@ class BillVerifier:
             f"Financials Balanced={response.financials_balanced}"
         )
         
-        # PHASE-7: Validate response before returning
-        self._validate_response(bill, response)
+        # PHASE-7: Validate response before returning (opt-in)
+        if self._validation_enabled:
+            self._validate_response(bill, response)
         
         return response
     
@@ -315,22 +481,52 @@ class BillVerifier:
         
         Logs warnings if validation fails (non-blocking).
         """
-        from app.verifier.output_renderer import validate_completeness, validate_summary_counters
+        # Both checks share one pass over the response items
+        (is_complete, msg), (is_valid, counter_msg) = validate_response(bill, response)
         
         # Validate completeness
-        is_complete, msg = validate_completeness(bill, response)
         if not is_complete:
             logger.error(f"⚠️  PHASE-7 COMPLETENESS VALIDATION FAILED: {msg}")
         else:
             logger.debug("✅ PHASE-7 Completeness validation passed")
         
         # Validate counters
-        is_valid, msg = validate_summary_counters(response)
         if not is_valid:
-            logger.error(f"⚠️  PHASE-7 COUNTER VALIDATION FAILED: {msg}")
+            logger.error(f"⚠️  PHASE-7 COUNTER VALIDATION FAILED: {counter_msg}")
         else:
             logger.debug("✅ PHASE-7 Counter validation passed")
     
+    def _verify_categories(
+        self,
+        bill_categories: List[BillCategory],
+        hospital_name: str,
+    ) -> List[CategoryVerificationResult]:
+        """
+        Verify several categories, concurrently when more than one worker is configured.
+        
+        Categories are independent of each other, so each one is matched on
+        a thread of the shared category pool. Results keep the bill's
+        category order.
+        
+        Args:
+            bill_categories: Categories from the bill (pseudo-categories removed)
+            hospital_name: Matched hospital name
+            
+        Returns:
+            List of CategoryVerificationResult, in input order
+        """
+        workers = min(CATEGORY_MATCH_WORKERS, len(bill_categories))
+        if workers <= 1:
+            return [
+                self._verify_category(bill_category=c, hospital_name=hospital_name)
+                for c in bill_categories
+            ]
+        
+        return list(_get_category_pool().map(
+            lambda c: self._verify_category(bill_category=c, hospital_name=hospital_name),
+            bill_categories,
+        ))
+    
     def _verify_category(
         self,
         bill_category: BillCategory,
@@ -353,7 +549,7 @@ class BillVerifier:
             threshold=CATEGORY_SIMILARITY_THRESHOLD,
         )
         
-        result = CategoryVerificationResult(
+        result = CategoryVerificationResult.model_construct(
             category=bill_category.category_name,
             matched_category=category_match.matched_text,
             category_similarity=category_match.similarity,
@@ -361,20 +557,19 @@ class BillVerifier:
         # PHASE-1: Soft category acceptance - ALWAYS process items
         # Even if category confidence is low, still try to match items
         # Category is used to narrow search space, not to block matching
-        from app.verifier.matcher import CATEGORY_SOFT_THRESHOLD
-        
         if not category_match.is_match:
             # Check if it's a soft match (0.50 <= similarity < 0.70)
             if category_match.similarity >= 0.50:  # PHASE-1: Lowered from 0.65
                 logger.info(
-                    f"Category soft match: '{bill_category.category_name}' → '{category_match.matched_text}' "
-                    f"(similarity={category_match.similarity:.4f}), continuing to match items"
+                    "Category soft match: '%s' → '%s' (similarity=%.4f), continuing to match items",
+                    bill_category.category_name, category_match.matched_text, category_match.similarity,
                 )
             else:
                 # Very low category confidence, but STILL try to match items (PHASE-1)
                 logger.warning(
-                    f"Low category confidence: '{bill_category.category_name}' → '{category_match.matched_text}' "
-                    f"(similarity={category_match.similarity:.4f}), but STILL trying to match items (Phase-1 behavior)"
+                    "Low category confidence: '%s' → '%s' (similarity=%.4f), "
+                    "but STILL trying to match items (Phase-1 behavior)",
+                    bill_category.category_name, category_match.matched_text, category_match.similarity,
                 )
                 # PHASE-1: DO NOT block items, continue processing
                 # Old behavior (commented out):
@@ -385,13 +580,30 @@ class BillVerifier:
         
         # PHASE-1: ALWAYS process items (regardless of category confidence)
         # This maximizes coverage and minimizes false negatives
-        for bill_item in bill_category.items:
-            item_result = self._verify_item(
+        
+        # Match all comparable items of the category in one batched call;
+        # administrative charges never reach the matcher.
+        is_admin = [is_administrative_charge(item.item_name) for item in bill_category.items]
+        item_matches = iter(self.matcher.match_items(
+            item_names=[
+                item.item_name
+                for item, admin in zip(bill_category.items, is_admin)
+                if not admin
+            ],
+            hospital_name=hospital_name,
+            category_name=category_match.matched_text,
+            threshold=None,  # Use category-specific threshold
+        ))
+        
+        result.items = [
+            self._verify_item(
                 bill_item=bill_item,
                 hospital_name=hospital_name,
                 category_name=category_match.matched_text,
+                item_match=None if admin else next(item_matches),
             )
-            result.items.append(item_result)
+            for bill_item, admin in zip(bill_category.items, is_admin)
+        ]
         
         return result
     
@@ -400,6 +612,7 @@ class BillVerifier:
         bill_item: BillItem,
         hospital_name: str,
         category_name: str,
+        item_match=None,  # Optional pre-computed ItemMatch (from match_items)
     ) -> ItemVerificationResult:
         """
         Verify a single item.
@@ -413,23 +626,21 @@ class BillVerifier:
             bill_item: Item from the bill
             hospital_name: Matched hospital name
             category_name: Matched category name
+            item_match: Result of batched matching; matched here if None
             
         Returns:
             ItemVerificationResult (NEVER None)
         """
         # PHASE-1: Check if this is an administrative charge FIRST
-        from app.verifier.text_normalizer import is_administrative_charge
-        
         if is_administrative_charge(bill_item.item_name):
             # Administrative charges cannot be compared against tie-up rates
-            from app.verifier.models import FailureReason, MismatchDiagnostics, VerificationStatus
-            
             logger.info(
-                f"Administrative charge detected: '{bill_item.item_name}' "
-                f"(marked as ALLOWED_NOT_COMPARABLE)"
+                "Administrative charge detected: '%s' (marked as ALLOWED_NOT_COMPARABLE)",
+                bill_item.item_name,
             )
+            normalized_name = bill_item.item_name.lower().strip()
             
-            return ItemVerificationResult(
+            return ItemVerificationResult.model_construct(
                 bill_item=bill_item.item_name,
                 matched_item=None,
                 status=VerificationStatus.ALLOWED_NOT_COMPARABLE,
@@ -437,9 +648,9 @@ class BillVerifier:
                 allowed_amount=0.0,  # N/A
                 extra_amount=0.0,    # N/A
                 similarity_score=None,
-                normalized_item_name=bill_item.item_name.lower().strip(),
-                diagnostics=MismatchDiagnostics(
-                    normalized_item_name=bill_item.item_name.lower().strip(),
+                normalized_item_name=normalized_name,
+                diagnostics=MismatchDiagnostics.model_construct(
+                    normalized_item_name=normalized_name,
                     best_candidate=None,
                     attempted_category=category_name,
                     failure_reason=FailureReason.ADMIN_CHARGE
@@ -448,12 +659,13 @@ class BillVerifier:
         
         # Match item (V2: Enhanced 6-layer matching architecture)
         # Falls back to V1 automatically if V2 modules not available
-        item_match = self.matcher.match_item_v2(
-            item_name=bill_item.item_name,
-            hospital_name=hospital_name,
-            category_name=category_name,
-            threshold=None,  # Use category-specific threshold
-        )
+        if item_match is None:
+            item_match = self.matcher.match_item_v2(
+                item_name=bill_item.item_name,
+                hospital_name=hospital_name,
+                category_name=category_name,
+                threshold=None,  # Use category-specific threshold
+            )
         
         # Check price if match found
         if item_match.is_match and item_match.item is not None:
@@ -463,7 +675,7 @@ class BillVerifier:
                 quantity=bill_item.quantity,
             )
             
-            return ItemVerificationResult(
+            return ItemVerificationResult.model_construct(
                 bill_item=bill_item.item_name,
                 matched_item=item_match.matched_text,
                 status=price_result.status,
@@ -475,11 +687,12 @@ class BillVerifier:
                 diagnostics=None  # No diagnostics for GREEN/RED
             )
         else:
-            # Item mismatch - create diagnostics
-            logger.debug(
-                f"Item mismatch: '{bill_item.item_name}' "
-                f"(best similarity={item_match.similarity:.4f} < {ITEM_SIMILARITY_THRESHOLD})"
-            )
+            # Item mismatch - create diagnostics (per-item log, formatted lazily)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Item mismatch: '%s' (best similarity=%.4f < %s)",
+                    bill_item.item_name, item_match.similarity, ITEM_SIMILARITY_THRESHOLD,
+                )
             return self._create_mismatch_item_result(
                 bill_item=bill_item,
                 item_match=item_match,
@@ -489,7 +702,7 @@ class BillVerifier:
     def _create_mismatch_item_result(
         self,
         bill_item: BillItem,
-        item_match,  # ItemMatch from matcher
+        item_match: ItemMatch,
         category_name: str,
     ) -> ItemVerificationResult:
         """
@@ -504,30 +717,17 @@ class BillVerifier:
         - Uses V2 failure reasons when available (more specific)
         - Includes failure explanation for better user feedback
         """
-        from app.verifier.models import FailureReason, MismatchDiagnostics
-        
         # V2: Use enhanced failure reason if available
-        if hasattr(item_match, 'failure_reason_v2') and item_match.failure_reason_v2:
+        v2_reason = item_match.failure_reason_v2
+        if v2_reason:
             # Map V2 failure reason to V1 enum (for backward compatibility)
-            v2_reason = item_match.failure_reason_v2
-            if 'DOSAGE_MISMATCH' in v2_reason or 'FORM_MISMATCH' in v2_reason:
-                failure_reason = FailureReason.LOW_SIMILARITY  # Closest V1 equivalent
-            elif 'WRONG_CATEGORY' in v2_reason or 'CATEGORY' in v2_reason:
-                failure_reason = FailureReason.CATEGORY_CONFLICT
-            elif 'ADMIN' in v2_reason:
-                failure_reason = FailureReason.ADMIN_CHARGE
-            elif 'PACKAGE' in v2_reason:
-                failure_reason = FailureReason.PACKAGE_ONLY
-            elif 'NOT_IN_TIEUP' in v2_reason:
-                failure_reason = FailureReason.NOT_IN_TIEUP
-            else:
-                failure_reason = FailureReason.LOW_SIMILARITY
+            failure_reason = _V2_REASON_MAP.get(v2_reason, FailureReason.LOW_SIMILARITY)
             
             best_candidate = item_match.matched_text
             
             # Log V2 enhanced explanation
-            if hasattr(item_match, 'failure_explanation') and item_match.failure_explanation:
-                logger.info(f"V2 Failure: {item_match.failure_explanation}")
+            if item_match.failure_explanation:
+                logger.info("V2 Failure: %s", item_match.failure_explanation)
         else:
             # V1: Determine failure reason (legacy logic)
             if item_match.similarity < 0.5:
@@ -538,14 +738,14 @@ class BillVerifier:
                 best_candidate = item_match.matched_text  # Show best candidate
         
         # Create diagnostics
-        diagnostics = MismatchDiagnostics(
+        diagnostics = MismatchDiagnostics.model_construct(
             normalized_item_name=item_match.normalized_item_name or bill_item.item_name.lower().strip(),
             best_candidate=best_candidate,
             attempted_category=category_name,
             failure_reason=failure_reason
         )
         
-        return ItemVerificationResult(
+        return ItemVerificationResult.model_construct(
             bill_item=bill_item.item_name,
             matched_item=None,
             status=VerificationStatus.UNCLASSIFIED,  # Phase-8+: Use UNCLASSIFIED instead of MISMATCH
@@ -565,54 +765,66 @@ class BillVerifier:
         - Every item gets diagnostics
         - Failure reason: NOT_IN_TIEUP (hospital not matched)
         """
-        from app.verifier.models import FailureReason, MismatchDiagnostics
-        from app.verifier.text_normalizer import should_skip_category
-        
-        response = VerificationResponse(
+        response = VerificationResponse.model_construct(
             hospital=bill.hospital_name,
             matched_hospital=None,
             hospital_similarity=0.0,
         )
         
+        # Bind per-item constants and constructors once
+        NOT_IN_TIEUP = FailureReason.NOT_IN_TIEUP
+        UNCLASSIFIED = VerificationStatus.UNCLASSIFIED
+        Diagnostics = MismatchDiagnostics.model_construct
+        ItemResult = ItemVerificationResult.model_construct
+        total_amount = 0.0
+        item_count = 0
+        
         for bill_category in bill.categories:
             # Skip pseudo-categories even when hospital doesn't match
             if should_skip_category(bill_category.category_name):
                 continue
             
-            category_result = CategoryVerificationResult(
-                category=bill_category.category_name,
+            items = bill_category.items
+            attempted_category = bill_category.category_name
+            
+            # Create MISMATCH with diagnostics (hospital not found)
+            category_result = CategoryVerificationResult.model_construct(
+                category=attempted_category,
                 matched_category=None,
                 category_similarity=0.0,
+                items=[
+                    ItemResult(
+                        bill_item=bill_item.item_name,
+                        matched_item=None,
+                        status=UNCLASSIFIED,  # Phase-8+: Use UNCLASSIFIED for no hospital match
+                        bill_amount=bill_item.amount,
+                        allowed_amount=0.0,
+                        extra_amount=0.0,
+                        similarity_score=0.0,
+                        normalized_item_name=(normalized_name := bill_item.item_name.lower().strip()),
+                        diagnostics=Diagnostics(
+                            normalized_item_name=normalized_name,
+                            best_candidate=None,
+                            attempted_category=attempted_category,
+                            failure_reason=NOT_IN_TIEUP
+                        ),
+                    )
+                    for bill_item in items
+                ],
             )
             
-            for bill_item in bill_category.items:
-                # Create MISMATCH with diagnostics (hospital not found)
-                diagnostics = MismatchDiagnostics(
-                    normalized_item_name=bill_item.item_name.lower().strip(),
-                    best_candidate=None,
-                    attempted_category=bill_category.category_name,
-                    failure_reason=FailureReason.NOT_IN_TIEUP
-                )
-                
-                item_result = ItemVerificationResult(
-                    bill_item=bill_item.item_name,
-                    matched_item=None,
-                    status=VerificationStatus.UNCLASSIFIED,  # Phase-8+: Use UNCLASSIFIED for no hospital match
-                    bill_amount=bill_item.amount,
-                    allowed_amount=0.0,
-                    extra_amount=0.0,
-                    similarity_score=0.0,
-                    normalized_item_name=bill_item.item_name.lower().strip(),
-                    diagnostics=diagnostics
-                )
-                
-                category_result.items.append(item_result)
-                response.total_bill_amount += bill_item.amount
-                response.total_unclassified_amount += bill_item.amount  # Phase-8+: Track in unclassified bucket
-                response.unclassified_count += 1  # Phase-8+: Count as unclassified
+            for bill_item in items:
+                total_amount += bill_item.amount
+            item_count += len(items)
             
             response.results.append(category_result)
         
+        # Phase-8+: Every item counts as unclassified and its amount goes to
+        # the unclassified bucket
+        response.total_bill_amount = total_amount
+        response.total_unclassified_amount = total_amount
+        response.unclassified_count = item_count
+        
         return response
 
 
@@ -621,11 +833,16 @@ class BillVerifier:
 # =============================================================================
 
 _verifier: Optional[BillVerifier] = None
+_verifier_lock = threading.Lock()
 
 
 def get_verifier() -> BillVerifier:
     """Get or create the global bill verifier instance."""
     global _verifier
+    
     if _verifier is None:
-        _verifier = BillVerifier()
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = BillVerifier()
+    
     return _verifier
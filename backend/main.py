@@ -164,10 +164,10 @@ Available hospitals are determined by JSON files in backend/data/tieups/
                     else:
                         response = verification_result
                     
-                    # Render based on debug flag
+                    # Render based on debug flag (streamed straight to stdout)
                     if args.debug:
                         # Debug view (includes all matching attempts)
-                        output = render_debug_view(response, {})
+                        render_debug_view(response, {}, out=sys.stdout)
                     else:
                         # Final view (clean user-facing)
                         options = RenderingOptions(
@@ -175,9 +175,9 @@ Available hospitals are determined by JSON files in backend/data/tieups/
                             show_similarity_scores=True,
                             show_diagnostics=True
                         )
-                        output = render_final_view(response, options)
+                        render_final_view(response, options, out=sys.stdout)
                     
-                    print(output)
+                    print()
                     logger.info("Verification complete!")
                     
             except ImportError as e:
@@ -1,19 +1,19 @@
 from paddleocr import PaddleOCR
-import os
+from pathlib import Path
 
 ocr = PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
 
 # Test with first image
 images_dir = "uploads/processed"
-image_files = sorted([f for f in os.listdir(images_dir) if f.startswith("Bill_page_") and f.endswith(".png")])
+image_files = sorted(Path(images_dir).glob("Bill_page_*.png"))
 
 if image_files:
-    img_path = os.path.join(images_dir, image_files[0])
+    img_path = image_files[0]
     print(f"Testing with: {img_path}")
-    print(f"File exists: {os.path.exists(img_path)}")
-    print(f"File size: {os.path.getsize(img_path)} bytes\n")
+    print(f"File exists: {img_path.exists()}")
+    print(f"File size: {img_path.stat().st_size} bytes\n")
     
-    result = ocr(img_path) # type: ignore
+    result = ocr(str(img_path)) # type: ignore
     
     print(f"Result type: {type(result)}")
     print(f"Result length: {len(result) if result else 0}\n")
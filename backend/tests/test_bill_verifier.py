@@ -0,0 +1,219 @@
+"""Unit tests for the bill verification flow.
+
+Runs BillVerifier end to end on an in-memory rate sheet, using the
+deterministic embedding service from the matcher tests.
+
+Tests:
+- GREEN / RED / UNCLASSIFIED / ALLOWED_NOT_COMPARABLE item statuses
+- Summary counters and financial reconciliation
+- Unknown hospital handling
+- Unvalidated result models still match the schema
+- One encoder batch for the categories and items of a bill
+- Response cache for identical bills
+- Opt-in PHASE-7 response validation
+- Parallel category verification matches sequential results (shared pool)
+- Tie-up directory loading
+"""
+
+import sys
+sys.path.insert(0, ".")
+
+import json
+
+import pytest
+
+from app.verifier.matcher import SemanticMatcher
+from app.verifier.models import BillInput, VerificationResponse, VerificationStatus
+from app.verifier import verifier as verifier_module
+from app.verifier.verifier import BillVerifier, load_all_tieups, load_tieup_from_file
+from tests.test_matcher import FakeEmbeddingService, FakeLLMRouter, _rate_sheet
+
+
+def _verifier():
+    matcher = SemanticMatcher(
+        embedding_service=FakeEmbeddingService(),
+        llm_router=FakeLLMRouter(),
+    )
+    verifier = BillVerifier(matcher=matcher, tieup_directory=".")
+    verifier.initialize([_rate_sheet()])
+    return verifier
+
+
+def _bill(hospital_name="Apollo Hospital"):
+    return BillInput(
+        hospital_name=hospital_name,
+        categories=[
+            {
+                "category_name": "Consultation",
+                "items": [
+                    {"item_name": "Consultation", "quantity": 1, "amount": 400.0},
+                    {"item_name": "Registration Fee", "quantity": 1, "amount": 100.0},
+                ],
+            },
+            {
+                "category_name": "Radiology",
+                "items": [
+                    {"item_name": "MRI Brain", "quantity": 1, "amount": 7000.0},
+                    {"item_name": "Unknown Procedure XYZ", "quantity": 1, "amount": 250.0},
+                ],
+            },
+        ],
+    )
+
+
+def test_verify_bill_statuses_and_totals():
+    """Each item gets a status and totals reconcile."""
+    response = _verifier().verify_bill(_bill())
+
+    statuses = {
+        item.bill_item: item.status
+        for category in response.results
+        for item in category.items
+    }
+    assert statuses == {
+        "Consultation": VerificationStatus.GREEN,
+        "Registration Fee": VerificationStatus.ALLOWED_NOT_COMPARABLE,
+        "MRI Brain": VerificationStatus.RED,
+        "Unknown Procedure XYZ": VerificationStatus.UNCLASSIFIED,
+    }
+
+    assert response.green_count == 1
+    assert response.red_count == 1
+    assert response.unclassified_count == 1
+    assert response.allowed_not_comparable_count == 1
+
+    # Admin charge is excluded from financial totals
+    assert response.total_bill_amount == pytest.approx(7650.0)
+    assert response.total_allowed_amount == pytest.approx(400.0 + 6000.0)
+    assert response.total_extra_amount == pytest.approx(1000.0)
+    assert response.total_unclassified_amount == pytest.approx(250.0)
+    assert response.financials_balanced
+
+
+def test_verify_bill_encodes_in_one_batch():
+    """Category names and item queries of a bill share one encoder call."""
+    verifier = _verifier()
+    service = verifier.matcher.embedding_service
+    batches = []
+    encode_batch = service.get_embeddings
+    service.get_embeddings = lambda texts: batches.append(list(texts)) or encode_batch(texts)
+    service.encoded_texts.clear()
+
+    verifier.verify_bill(_bill())
+
+    assert len(batches) == 1
+    assert {"Consultation", "Radiology"} <= set(batches[0])
+    assert service.encoded_texts == ["Apollo Hospital"] + batches[0]
+
+
+def test_verify_bill_unknown_hospital():
+    """A hospital with no similar tie-up marks every item UNCLASSIFIED."""
+    verifier = _verifier()
+    # Only one rate sheet is indexed, so force a miss through the matcher
+    verifier.matcher._hospital_index = None
+
+    response = verifier.verify_bill(_bill("Completely Different Clinic"))
+
+    assert response.matched_hospital is None
+    assert response.unclassified_count == 4
+    assert response.total_bill_amount == pytest.approx(7750.0)
+
+
+@pytest.mark.parametrize("hospital_name", ["Apollo Hospital", "Completely Different Clinic"])
+def test_response_round_trips_through_schema(hospital_name):
+    """Results built with model_construct re-validate to equal models."""
+    verifier = _verifier()
+    if hospital_name != "Apollo Hospital":
+        verifier.matcher._hospital_index = None
+
+    response = verifier.verify_bill(_bill(hospital_name))
+
+    assert VerificationResponse.model_validate(response.model_dump()) == response
+    assert VerificationResponse.model_validate_json(response.model_dump_json()) == response
+
+
+def test_parallel_categories_match_sequential(monkeypatch):
+    """Category results and totals do not depend on the worker count."""
+    def summary(response):
+        return (
+            [(c.category, [(i.bill_item, i.status, i.allowed_amount) for i in c.items])
+             for c in response.results],
+            response.total_allowed_amount,
+            response.total_extra_amount,
+        )
+
+    monkeypatch.setattr(verifier_module, "CATEGORY_MATCH_WORKERS", 1)
+    sequential = summary(_verifier().verify_bill(_bill()))
+
+    monkeypatch.setattr(verifier_module, "CATEGORY_MATCH_WORKERS", 4)
+    parallel = summary(_verifier().verify_bill(_bill()))
+
+    assert parallel == sequential
+
+    # Worker threads are shared across bills, not spawned per bill
+    pool = verifier_module._get_category_pool()
+    _verifier().verify_bill(_bill())
+    assert verifier_module._get_category_pool() is pool
+
+
+def test_load_all_tieups_skips_invalid_files(tmp_path):
+    """Valid sheets are loaded and broken files are skipped."""
+    for name in ("a_hospital", "b_hospital"):
+        sheet = _rate_sheet().model_dump()
+        sheet["hospital_name"] = name
+        (tmp_path / f"{name}.json").write_text(json.dumps(sheet), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    rate_sheets = load_all_tieups(str(tmp_path))
+
+    assert sorted(s.hospital_name for s in rate_sheets) == ["a_hospital", "b_hospital"]
+
+
+def test_load_tieup_from_file_reparses_only_on_change(tmp_path):
+    """Unchanged files come from the cache; edits are picked up."""
+    path = tmp_path / "apollo.json"
+    path.write_text(json.dumps(_rate_sheet().model_dump()), encoding="utf-8")
+
+    first = load_tieup_from_file(str(path))
+    assert load_tieup_from_file(str(path)) is first
+
+    sheet = _rate_sheet().model_dump()
+    sheet["hospital_name"] = "Apollo Hospitals Renamed"
+    path.write_text(json.dumps(sheet), encoding="utf-8")
+
+    assert load_tieup_from_file(str(path)).hospital_name == "Apollo Hospitals Renamed"
+
+
+def test_verify_bill_caches_identical_bills():
+    """A re-submitted bill is answered from the cache with an independent copy."""
+    verifier = _verifier()
+    first = verifier.verify_bill(_bill())
+
+    calls = []
+    verifier._verify_bill = lambda bill: calls.append(bill) or first
+
+    again = verifier.verify_bill(_bill())
+
+    assert calls == []
+    assert again == first
+    assert again is not first
+
+    again.results[0].items.clear()
+    assert verifier.verify_bill(_bill()) == first
+
+    verifier.verify_bill(_bill("Other Hospital"))
+    assert len(calls) == 1
+
+
+def test_response_validation_is_opt_in():
+    """PHASE-7 validation only runs when enabled."""
+    verifier = _verifier()
+    calls = []
+    verifier._validate_response = lambda bill, response: calls.append(response)
+
+    verifier.verify_bill(_bill())
+    assert calls == []
+
+    verifier._validation_enabled = True
+    verifier.verify_bill(_bill("Other Hospital"))
+    assert len(calls) == 1
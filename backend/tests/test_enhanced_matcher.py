@@ -0,0 +1,167 @@
+"""Unit tests for the V2 enhanced matching layers.
+
+Tests:
+- Fused constraint validation + hybrid scoring (validate_and_score)
+- Equivalence with the separate validate/score functions
+- Score-only fast path (no breakdown)
+- Confidence calibration decisions
+- Failure reason determination
+- Constraint rejection -> failure reason mapping
+"""
+
+import sys
+sys.path.insert(0, ".")
+
+from app.verifier.enhanced_matcher import (
+    MatchDecision,
+    calculate_hybrid_score_v3,
+    calibrate_confidence,
+    get_category_config,
+    validate_and_score,
+    validate_hard_constraints,
+)
+from app.verifier.failure_reasons_v2 import (
+    FailureReasonV2,
+    determine_failure_reason_v2,
+    failure_reason_from_constraint,
+)
+from app.verifier.medical_core_extractor_v2 import extract_medical_core_v2
+
+
+def _metadata(result):
+    return {
+        'dosage': result.dosage,
+        'form': result.form,
+        'modality': result.modality,
+        'body_part': result.body_part,
+        'core_text': result.core_text,
+    }
+
+
+def test_validate_and_score_rejects_dosage_mismatch():
+    """Dosage mismatch is rejected before any scoring happens."""
+    bill = extract_medical_core_v2("PARACETAMOL 500MG TABLET")
+    tieup = extract_medical_core_v2("Paracetamol 650mg Tablet")
+    config = get_category_config("Medicines")
+
+    valid, reason, score, breakdown = validate_and_score(
+        bill, tieup, 0.95, "Medicines", config
+    )
+
+    assert valid is False
+    assert reason.startswith("DOSAGE_MISMATCH")
+    assert score == 0.0
+    assert breakdown is None
+
+
+def test_validate_and_score_matches_separate_layers():
+    """Fused path returns the same verdict and score as the two-step path."""
+    bill = extract_medical_core_v2("MRI BRAIN | Dr. Vivek")
+    tieup = extract_medical_core_v2("MRI Brain")
+    config = get_category_config("Radiology")
+
+    valid, reason, score, breakdown = validate_and_score(
+        bill, tieup, 0.91, "Radiology", config
+    )
+    expected_valid, expected_reason = validate_hard_constraints(
+        _metadata(bill), _metadata(tieup), "Radiology", "Radiology", config
+    )
+    expected_score, expected_breakdown = calculate_hybrid_score_v3(
+        bill.core_text, tieup.core_text, 0.91,
+        _metadata(bill), _metadata(tieup), "Radiology"
+    )
+
+    assert (valid, reason) == (expected_valid, expected_reason)
+    assert score == expected_score
+    assert breakdown == expected_breakdown
+
+
+def test_validate_and_score_without_breakdown():
+    """Score-only path returns the same score and skips the breakdown."""
+    config = get_category_config("Radiology")
+    for bill_text, tieup_text in [
+        ("MRI BRAIN | Dr. Vivek", "MRI Brain"),
+        ("CT SCAN ABDOMEN 5MG", "CT Abdomen 5mg"),
+        ("ULTRASOUND KNEE", "Ultrasound Knee Joint"),
+    ]:
+        bill = extract_medical_core_v2(bill_text)
+        tieup = extract_medical_core_v2(tieup_text)
+
+        full = validate_and_score(bill, tieup, 0.88, "Radiology", config)
+        fast = validate_and_score(
+            bill, tieup, 0.88, "Radiology", config, return_breakdown=False
+        )
+
+        assert fast[:3] == full[:3]
+        assert fast[3] is None
+
+
+def test_validate_and_score_category_boundary():
+    """An explicit tie-up category across a hard boundary is rejected."""
+    bill = extract_medical_core_v2("PARACETAMOL 500MG TABLET")
+    tieup = extract_medical_core_v2("Paracetamol 500mg Tablet")
+    config = get_category_config("Medicines")
+
+    valid, reason, _, _ = validate_and_score(
+        bill, tieup, 0.99, "Medicines", config, tieup_category="Diagnostics"
+    )
+
+    assert valid is False
+    assert reason.startswith("CATEGORY_BOUNDARY")
+
+
+def test_calibrate_confidence_decisions():
+    """Decisions follow the high/category/LLM thresholds."""
+    assert calibrate_confidence(0.90, "Medicines", {})[0] == MatchDecision.AUTO_MATCH
+    assert calibrate_confidence(0.77, "Medicines", {'medical_anchors': 0.8})[0] == MatchDecision.AUTO_MATCH
+    assert calibrate_confidence(0.77, "Medicines", {'medical_anchors': 0.2})[0] == MatchDecision.LLM_VERIFY
+    assert calibrate_confidence(0.50, "Medicines", {})[0] == MatchDecision.REJECT
+    # Confidence is passed through unchanged
+    assert calibrate_confidence(0.7712, "Medicines", {})[1] == 0.7712
+
+
+def test_determine_failure_reason_v2_priorities():
+    """Specific mismatches win over generic low-similarity reasons."""
+    reason, explanation = determine_failure_reason_v2(
+        item_name="Paracetamol 500mg",
+        normalized_name="paracetamol 500mg",
+        category="Medicines",
+        best_candidate="Paracetamol 650mg",
+        best_similarity=0.92,
+        bill_metadata={"dosage": "500mg"},
+        tieup_metadata={"dosage": "650mg"},
+    )
+    assert reason == FailureReasonV2.DOSAGE_MISMATCH
+    assert "500mg vs 650mg" in explanation
+
+    reason, _ = determine_failure_reason_v2(
+        item_name="Registration Fee",
+        normalized_name="registration fee",
+        category="Administrative",
+        best_candidate=None,
+        best_similarity=0.0,
+        is_admin=True,
+    )
+    assert reason == FailureReasonV2.ADMIN_CHARGE
+
+    reason, _ = determine_failure_reason_v2(
+        item_name="Some Item",
+        normalized_name="some item",
+        category="Misc",
+        best_candidate="Other Item",
+        best_similarity=0.6,
+    )
+    assert reason == FailureReasonV2.LOW_SIMILARITY
+
+
+def test_failure_reason_from_constraint():
+    """Constraint rejection prefixes map to their failure reasons."""
+    bill = extract_medical_core_v2("PARACETAMOL 500MG TABLET")
+    tieup = extract_medical_core_v2("Paracetamol 650mg Tablet")
+    _, reason, _, _ = validate_and_score(
+        bill, tieup, 0.95, "Medicines", get_category_config("Medicines")
+    )
+
+    assert failure_reason_from_constraint(reason) == FailureReasonV2.DOSAGE_MISMATCH
+    assert failure_reason_from_constraint("CATEGORY_BOUNDARY: x") == FailureReasonV2.WRONG_CATEGORY
+    assert failure_reason_from_constraint("something else") == FailureReasonV2.LOW_SIMILARITY
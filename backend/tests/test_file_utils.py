@@ -1,8 +1,11 @@
+from tempfile import SpooledTemporaryFile
+
 from app.utils.file_utils import save_uploaded_file
 
-class DummyFile:
-    def read(self):
-        return b"Test PDF content"
+# FastAPI's UploadFile.file is a SpooledTemporaryFile
+upload = SpooledTemporaryFile(max_size=1 << 20)
+upload.write(b"Test PDF content")
+upload.seek(0)
 
-file_path = save_uploaded_file(DummyFile(), "sample.pdf")
+file_path = save_uploaded_file(upload, "sample.pdf")
 print("Saved at:", file_path)
@@ -0,0 +1,82 @@
+"""Unit tests for the Phase-2 financial aggregator.
+
+Tests:
+- Category totals and status counts
+- Grand totals, including the unclassified and not-comparable buckets
+- Empty input
+"""
+
+import sys
+sys.path.insert(0, ".")
+
+import pytest
+
+from app.verifier.financial import (
+    build_financial_summary,
+    calculate_category_totals,
+    calculate_grand_totals,
+)
+from app.verifier.models import VerificationStatus
+from app.verifier.models_v2 import AggregatedItem
+
+
+def _item(category, status, bill, allowed=0.0, extra=0.0):
+    return AggregatedItem(
+        normalized_name=f"{category}-{status.value}-{bill}",
+        category=category,
+        occurrences=1,
+        total_bill=bill,
+        allowed_per_unit=allowed,
+        total_allowed=allowed,
+        total_extra=extra,
+        status=status,
+    )
+
+
+def _items():
+    return [
+        _item("medicines", VerificationStatus.GREEN, 50.0, allowed=50.0),
+        _item("radiology", VerificationStatus.RED, 7000.0, allowed=6000.0, extra=1000.0),
+        _item("medicines", VerificationStatus.UNCLASSIFIED, 30.0),
+        _item("medicines", VerificationStatus.MISMATCH, 20.0),
+        _item("radiology", VerificationStatus.ALLOWED_NOT_COMPARABLE, 100.0),
+        _item("radiology", VerificationStatus.IGNORED_ARTIFACT, 0.0),
+    ]
+
+
+def test_calculate_category_totals():
+    """Amounts and status counts are grouped per category, in first-seen order."""
+    medicines, radiology = calculate_category_totals(_items())
+
+    assert medicines.category == "medicines"
+    assert medicines.total_bill == pytest.approx(100.0)
+    assert medicines.total_allowed == pytest.approx(50.0)
+    assert medicines.total_unclassified == pytest.approx(50.0)
+    assert (medicines.green_count, medicines.unclassified_count, medicines.mismatch_count) == (1, 1, 1)
+
+    assert radiology.category == "radiology"
+    assert radiology.total_bill == pytest.approx(7100.0)
+    assert radiology.total_extra == pytest.approx(1000.0)
+    assert (radiology.red_count, radiology.ignored_count) == (1, 1)
+
+
+def test_calculate_grand_totals():
+    """Grand totals cover all items; MISMATCH counts as unclassified."""
+    totals = calculate_grand_totals(_items())
+
+    assert totals.total_bill == pytest.approx(7200.0)
+    assert totals.total_allowed == pytest.approx(6050.0)
+    assert totals.total_extra == pytest.approx(1000.0)
+    assert totals.total_unclassified == pytest.approx(50.0)
+    assert totals.total_allowed_not_comparable == pytest.approx(100.0)
+    assert (totals.green_count, totals.red_count, totals.mismatch_count) == (1, 1, 1)
+    assert (totals.ignored_count, totals.unclassified_count) == (1, 2)
+
+
+def test_build_financial_summary_empty():
+    """No items produce zero totals and no categories."""
+    summary = build_financial_summary([])
+
+    assert summary.category_totals == []
+    assert summary.grand_totals.total_bill == 0.0
+    assert summary.grand_totals.green_count == 0
@@ -7,6 +7,7 @@ Tests the CORRECTED semantic: allowed_amount is a policy LIMIT, not a component.
 import pytest
 from app.verifier.financial_contribution import (
     FinancialContribution,
+    aggregate_contributions,
     calculate_financial_contribution
 )
 from app.verifier.models import (
@@ -18,217 +19,76 @@ from app.verifier.models import (
 class TestFinancialContributionSemantics:
     """Test that allowed_amount is treated as a LIMIT, not a component"""
     
-    def test_green_bill_less_than_allowed(self):
-        """
-        GREEN: bill < allowed
-        
-        Example: X-Ray costs ₹450, policy allows up to ₹800
-        Result: Patient pays ₹450, all covered by policy
-        
-        allowed_contribution = ₹450 (full bill, since bill < limit)
-        extra_contribution = ₹0
-        """
-        item = ItemVerificationResult(
-            bill_item="X-Ray Chest PA",
-            matched_item="X-Ray Chest PA",
-            status=VerificationStatus.GREEN,
-            bill_amount=450.0,
-            allowed_amount=800.0,  # Policy limit
-            extra_amount=0.0,
-            similarity_score=1.0,
-            normalized_item_name="x-ray chest pa"
-        )
-        
-        contrib = calculate_financial_contribution(item)
-        
-        # Validate
-        assert contrib.bill_amount == 450.0
-        assert contrib.allowed_limit == 800.0
-        assert contrib.allowed_contribution == 450.0  # Full bill covered
-        assert contrib.extra_contribution == 0.0
-        assert contrib.unclassified_contribution == 0.0
-        assert contrib.is_excluded == False
-        
-        # Invariant: bill = allowed_contribution + extra_contribution + unclassified_contribution
-        assert contrib.bill_amount == (
-            contrib.allowed_contribution + 
-            contrib.extra_contribution + 
-            contrib.unclassified_contribution
-        )
-        
-        # Validation should pass
-        contrib.validate()
-    
-    def test_green_bill_equals_allowed(self):
-        """
-        GREEN: bill = allowed
-        
-        Example: MRI costs ₹800, policy allows ₹800
-        Result: Patient pays ₹800, all covered
-        
-        allowed_contribution = ₹800
-        extra_contribution = ₹0
-        """
-        item = ItemVerificationResult(
-            bill_item="MRI Brain",
-            matched_item="MRI Brain",
-            status=VerificationStatus.GREEN,
-            bill_amount=800.0,
-            allowed_amount=800.0,
-            extra_amount=0.0,
-            similarity_score=1.0,
-            normalized_item_name="mri brain"
-        )
-        
-        contrib = calculate_financial_contribution(item)
-        
-        assert contrib.bill_amount == 800.0
-        assert contrib.allowed_limit == 800.0
-        assert contrib.allowed_contribution == 800.0
-        assert contrib.extra_contribution == 0.0
-        assert contrib.unclassified_contribution == 0.0
-        
-        # Invariant
-        assert contrib.bill_amount == (
-            contrib.allowed_contribution + 
-            contrib.extra_contribution + 
-            contrib.unclassified_contribution
-        )
-        
-        contrib.validate()
-    
-    def test_red_bill_exceeds_allowed(self):
-        """
-        RED: bill > allowed
-        
-        Example: CT Scan costs ₹1200, policy allows ₹800
-        Result: Patient pays ₹1200, policy covers ₹800, patient pays extra ₹400
-        
-        allowed_contribution = ₹800 (policy limit)
-        extra_contribution = ₹400 (overcharge)
-        """
-        item = ItemVerificationResult(
-            bill_item="CT Scan Abdomen",
-            matched_item="CT Scan Abdomen",
-            status=VerificationStatus.RED,
-            bill_amount=1200.0,
-            allowed_amount=800.0,
-            extra_amount=400.0,  # bill - allowed
-            similarity_score=1.0,
-            normalized_item_name="ct scan abdomen"
-        )
-        
-        contrib = calculate_financial_contribution(item)
-        
-        assert contrib.bill_amount == 1200.0
-        assert contrib.allowed_limit == 800.0
-        assert contrib.allowed_contribution == 800.0  # Policy covers up to limit
-        assert contrib.extra_contribution == 400.0    # Overcharge
-        assert contrib.unclassified_contribution == 0.0
-        
-        # Invariant
-        assert contrib.bill_amount == (
-            contrib.allowed_contribution + 
-            contrib.extra_contribution + 
-            contrib.unclassified_contribution
-        )
-        
-        contrib.validate()
-    
-    def test_unclassified_no_match(self):
-        """
-        UNCLASSIFIED: No policy match
-        
-        Example: Custom package ₹5000, no tie-up found
-        Result: Full amount needs manual review
-        
-        allowed_contribution = ₹0
-        extra_contribution = ₹0
-        unclassified_contribution = ₹5000
-        """
-        item = ItemVerificationResult(
-            bill_item="Custom Health Package",
-            matched_item=None,
-            status=VerificationStatus.UNCLASSIFIED,
-            bill_amount=5000.0,
-            allowed_amount=0.0,
-            extra_amount=0.0,
-            similarity_score=0.0,
-            normalized_item_name="custom health package"
-        )
-        
-        contrib = calculate_financial_contribution(item)
-        
-        assert contrib.bill_amount == 5000.0
-        assert contrib.allowed_limit is None
-        assert contrib.allowed_contribution == 0.0
-        assert contrib.extra_contribution == 0.0
-        assert contrib.unclassified_contribution == 5000.0
-        
-        # Invariant
-        assert contrib.bill_amount == (
-            contrib.allowed_contribution + 
-            contrib.extra_contribution + 
-            contrib.unclassified_contribution
-        )
-        
-        contrib.validate()
-    
-    def test_excluded_artifact(self):
-        """
-        IGNORED_ARTIFACT: OCR artifact
-        
-        Example: "UNKNOWN" ₹100
-        Result: Excluded from all totals
-        """
-        item = ItemVerificationResult(
-            bill_item="UNKNOWN",
-            matched_item=None,
-            status=VerificationStatus.IGNORED_ARTIFACT,
-            bill_amount=100.0,
-            allowed_amount=0.0,
-            extra_amount=0.0,
-            similarity_score=0.0,
-            normalized_item_name="unknown"
-        )
-        
-        contrib = calculate_financial_contribution(item)
-        
-        assert contrib.bill_amount == 100.0
-        assert contrib.allowed_limit is None
-        assert contrib.allowed_contribution == 0.0
-        assert contrib.extra_contribution == 0.0
-        assert contrib.unclassified_contribution == 0.0
-        assert contrib.is_excluded == True
-        
-        contrib.validate()
-    
-    def test_excluded_admin_charge(self):
+    @pytest.mark.parametrize(
+        "status, bill, allowed, extra, expected",
+        [
+            # X-Ray ₹450, policy allows up to ₹800: full bill covered
+            pytest.param(
+                VerificationStatus.GREEN, 450.0, 800.0, 0.0,
+                (800.0, 450.0, 0.0, 0.0, False),
+                id="green_bill_less_than_allowed",
+            ),
+            # MRI ₹800, policy allows ₹800: all covered
+            pytest.param(
+                VerificationStatus.GREEN, 800.0, 800.0, 0.0,
+                (800.0, 800.0, 0.0, 0.0, False),
+                id="green_bill_equals_allowed",
+            ),
+            # CT Scan ₹1200, policy allows ₹800: policy covers up to limit,
+            # patient pays the ₹400 overcharge
+            pytest.param(
+                VerificationStatus.RED, 1200.0, 800.0, 400.0,
+                (800.0, 800.0, 400.0, 0.0, False),
+                id="red_bill_exceeds_allowed",
+            ),
+            # Custom package ₹5000, no tie-up: full amount needs manual review
+            pytest.param(
+                VerificationStatus.UNCLASSIFIED, 5000.0, 0.0, 0.0,
+                (None, 0.0, 0.0, 5000.0, False),
+                id="unclassified_no_match",
+            ),
+            # OCR artifact "UNKNOWN" ₹100: excluded from all totals
+            pytest.param(
+                VerificationStatus.IGNORED_ARTIFACT, 100.0, 0.0, 0.0,
+                (None, 0.0, 0.0, 0.0, True),
+                id="excluded_artifact",
+            ),
+            # Registration fee ₹50: excluded from all totals
+            pytest.param(
+                VerificationStatus.ALLOWED_NOT_COMPARABLE, 50.0, 0.0, 0.0,
+                (None, 0.0, 0.0, 0.0, True),
+                id="excluded_admin_charge",
+            ),
+        ],
+    )
+    def test_contribution(self, status, bill, allowed, extra, expected):
         """
-        ALLOWED_NOT_COMPARABLE: Admin charge
-        
-        Example: Registration fee ₹50
-        Result: Excluded from all totals
+        Expected is (allowed_limit, allowed_contribution, extra_contribution,
+        unclassified_contribution, is_excluded).
         """
         item = ItemVerificationResult(
-            bill_item="Registration Fee",
+            bill_item="Item",
             matched_item=None,
-            status=VerificationStatus.ALLOWED_NOT_COMPARABLE,
-            bill_amount=50.0,
-            allowed_amount=0.0,
-            extra_amount=0.0,
-            similarity_score=0.0,
-            normalized_item_name="registration fee"
+            status=status,
+            bill_amount=bill,
+            allowed_amount=allowed,  # Policy limit
+            extra_amount=extra,
+            similarity_score=1.0,
+            normalized_item_name="item"
         )
         
         contrib = calculate_financial_contribution(item)
         
-        assert contrib.bill_amount == 50.0
-        assert contrib.is_excluded == True
-        assert contrib.allowed_contribution == 0.0
-        assert contrib.extra_contribution == 0.0
-        assert contrib.unclassified_contribution == 0.0
+        assert contrib.bill_amount == pytest.approx(bill)
+        assert (
+            contrib.allowed_limit,
+            contrib.allowed_contribution,
+            contrib.extra_contribution,
+            contrib.unclassified_contribution,
+            contrib.is_excluded,
+        ) == pytest.approx(expected)
         
+        # Invariant (bill = allowed + extra + unclassified) is owned by validate()
         contrib.validate()
 
 
@@ -311,20 +171,20 @@ class TestFinancialReconciliation:
         contributions = [calculate_financial_contribution(item) for item in items]
         
         # Aggregate totals (excluding is_excluded items)
-        total_bill = sum(c.bill_amount for c in contributions if not c.is_excluded)
-        total_allowed = sum(c.allowed_contribution for c in contributions if not c.is_excluded)
-        total_extra = sum(c.extra_contribution for c in contributions if not c.is_excluded)
-        total_unclassified = sum(c.unclassified_contribution for c in contributions if not c.is_excluded)
+        totals = aggregate_contributions(contributions)
+        total_bill = totals["bill"]
+        total_allowed = totals["allowed"]
+        total_extra = totals["extra"]
+        total_unclassified = totals["unclassified"]
         
         # Verify totals
-        assert total_bill == 6650.0  # 450 + 1200 + 5000
-        assert total_allowed == 1250.0  # 450 + 800
-        assert total_extra == 400.0  # 400
-        assert total_unclassified == 5000.0  # 5000
+        assert total_bill == pytest.approx(6650.0)  # 450 + 1200 + 5000
+        assert total_allowed == pytest.approx(1250.0)  # 450 + 800
+        assert total_extra == pytest.approx(400.0)  # 400
+        assert total_unclassified == pytest.approx(5000.0)  # 5000
         
         # CRITICAL: Reconciliation equation
-        tolerance = 0.01
-        assert abs(total_bill - (total_allowed + total_extra + total_unclassified)) < tolerance
+        assert total_bill == pytest.approx(total_allowed + total_extra + total_unclassified, abs=0.01)
         
         print(f"✅ Reconciliation passed:")
         print(f"   Bill = ₹{total_bill:.2f}")
@@ -350,9 +210,9 @@ class TestEdgeCases:
         
         contrib = calculate_financial_contribution(item)
         
-        assert contrib.bill_amount == 0.0
-        assert contrib.allowed_contribution == 0.0  # No bill, no contribution
-        assert contrib.extra_contribution == 0.0
+        assert contrib.bill_amount == pytest.approx(0.0)
+        assert contrib.allowed_contribution == pytest.approx(0.0)  # No bill, no contribution
+        assert contrib.extra_contribution == pytest.approx(0.0)
         
         contrib.validate()
     
@@ -373,6 +233,21 @@ class TestEdgeCases:
         
         # Should not raise assertion error due to floating-point tolerance
         contrib.validate()
+    
+    def test_aggregate_only_excluded_items(self):
+        """A bill with only excluded items aggregates to zero totals"""
+        excluded = FinancialContribution(
+            bill_amount=50.0,
+            allowed_limit=None,
+            allowed_contribution=0.0,
+            extra_contribution=0.0,
+            unclassified_contribution=0.0,
+            is_excluded=True
+        )
+        
+        expected = {"bill": 0.0, "allowed": 0.0, "extra": 0.0, "unclassified": 0.0}
+        assert aggregate_contributions([excluded]) == expected
+        assert aggregate_contributions([]) == expected
 
 
 if __name__ == "__main__":
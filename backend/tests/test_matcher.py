@@ -0,0 +1,346 @@
+"""Unit tests for the semantic matcher.
+
+Uses a deterministic bag-of-words embedding service so that FAISS indexing
+and matching can be exercised without loading a sentence-transformers model.
+
+Tests:
+- One encoder call per rate sheet when indexing
+- Exact and semantic item matching
+- Optional int8 scalar-quantized indices
+- Query embedding reuse for repeated bill items and hospitals
+- Item match memoization across calls
+- Batched query encoding in match_items
+- Exact matches skip encoding and search
+- V2 weak semantic hits still reach LLM verification
+- V2 auto-accept fast path reports the hybrid score
+- V2 calibration thresholds cached per category across bills
+"""
+
+import sys
+sys.path.insert(0, ".")
+
+import hashlib
+from types import SimpleNamespace
+
+import faiss
+import numpy as np
+
+from app.verifier import matcher as matcher_module
+from app.verifier.matcher import SemanticMatcher
+from app.verifier.models import TieUpCategory, TieUpItem, TieUpRateSheet
+
+
+class FakeEmbeddingService:
+    """Hashes tokens into a fixed-size vector and counts encoder calls."""
+
+    dimension = 64
+
+    def __init__(self):
+        self.encoded_texts = []
+
+    def _embed(self, text):
+        vec = np.zeros(self.dimension, dtype=np.float32)
+        for token in text.lower().split():
+            digest = hashlib.md5(token.encode("utf-8")).digest()
+            vec[digest[0] % self.dimension] += 1.0
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def get_embedding(self, text):
+        self.encoded_texts.append(text)
+        return self._embed(text)
+
+    def get_embeddings(self, texts):
+        self.encoded_texts.extend(texts)
+        return np.stack([self._embed(t) for t in texts], axis=0)
+
+    def get_embeddings_safe(self, texts):
+        return self.get_embeddings(texts), None
+
+    def save_cache(self):
+        pass
+
+
+class FakeLLMRouter:
+    """LLM router stub that never confirms a match."""
+
+    cache_size = 0
+    cache_hit_rate = 0.0
+
+    def match_with_llm(self, bill_item, tieup_item, similarity):
+        raise AssertionError("LLM should not be called in these tests")
+
+
+def _rate_sheet():
+    return TieUpRateSheet(
+        hospital_name="Apollo Hospital",
+        categories=[
+            TieUpCategory(
+                category_name="Consultation",
+                items=[
+                    TieUpItem(item_name="Consultation", rate=500),
+                    TieUpItem(item_name="Specialist Consultation", rate=800),
+                ],
+            ),
+            TieUpCategory(
+                category_name="Radiology",
+                items=[
+                    TieUpItem(item_name="MRI Brain", rate=6000),
+                    TieUpItem(item_name="CT Scan Abdomen", rate=4000),
+                ],
+            ),
+        ],
+    )
+
+
+def _matcher():
+    service = FakeEmbeddingService()
+    matcher = SemanticMatcher(embedding_service=service, llm_router=FakeLLMRouter())
+    assert matcher.index_rate_sheets([_rate_sheet()])
+    service.encoded_texts.clear()
+    return matcher, service
+
+
+def test_index_rate_sheets_one_batch_per_sheet():
+    """Each rate sheet's category and item names are encoded together."""
+    service = FakeEmbeddingService()
+    batches = []
+    encode_batch = service.get_embeddings
+    service.get_embeddings = lambda texts: batches.append(list(texts)) or encode_batch(texts)
+    matcher = SemanticMatcher(embedding_service=service, llm_router=FakeLLMRouter())
+    sheet = _rate_sheet()
+
+    assert matcher.index_rate_sheets([sheet])
+
+    assert len(batches) == 2  # hospital names, then the sheet
+    for cat in sheet.categories:
+        key = ("apollo hospital", cat.category_name.lower())
+        assert matcher._item_indices[key].texts == [item.item_name for item in cat.items]
+        assert matcher._item_indices[key].size == len(cat.items)
+
+
+def test_exact_match_fast_path():
+    """Identical normalized text matches with confidence 1.0."""
+    matcher, _ = _matcher()
+
+    result = matcher.match_item("Consultation", "Apollo Hospital", "Consultation", use_llm=False)
+
+    assert result.is_match
+    assert result.matched_text == "Consultation"
+    assert result.similarity == 1.0
+
+
+def test_semantic_match():
+    """Near-identical item text is matched through the FAISS index."""
+    matcher, _ = _matcher()
+
+    result = matcher.match_item("MRI BRAIN PLAIN", "Apollo Hospital", "Radiology", use_llm=False)
+
+    assert result.is_match
+    assert result.item.rate == 6000
+
+
+def test_int8_index_keeps_top_match(monkeypatch):
+    """Scalar-quantized indices rank the same best item as float32 ones."""
+    monkeypatch.setattr(matcher_module, "FAISS_INT8_INDEX", True)
+    matcher, _ = _matcher()
+
+    assert isinstance(matcher._hospital_index.index, faiss.IndexScalarQuantizer)
+    result = matcher.match_item("MRI BRAIN PLAIN", "Apollo Hospital", "Radiology", use_llm=False)
+
+    assert result.is_match
+    assert result.item.rate == 6000
+
+
+def test_repeated_items_encoded_once():
+    """Repeated bill items reuse the cached query embedding."""
+    matcher, service = _matcher()
+
+    for _ in range(3):
+        matcher.match_item("MRI BRAIN PLAIN", "Apollo Hospital", "Radiology", use_llm=False)
+
+    assert len(service.encoded_texts) == 1
+
+
+def test_repeated_hospitals_encoded_once():
+    """Re-matching the same hospital reuses its cached query embedding."""
+    matcher, service = _matcher()
+
+    first = matcher.match_hospital("Apollo Hospital")
+    second = matcher.match_hospital("Apollo Hospital")
+
+    assert first == second
+    assert service.encoded_texts == ["Apollo Hospital"]
+
+
+def test_prefetch_item_embeddings_single_batch():
+    """Prefetching encodes unique items once; matching then hits the cache."""
+    matcher, service = _matcher()
+    names = ["MRI BRAIN PLAIN", "CT SCAN ABDOMEN CONTRAST", "MRI BRAIN PLAIN"]
+
+    assert matcher.prefetch_item_embeddings(names) == 2
+    encoded = list(service.encoded_texts)
+
+    for name in names:
+        matcher.match_item(name, "Apollo Hospital", "Radiology", use_llm=False)
+
+    assert service.encoded_texts == encoded
+    assert matcher.prefetch_item_embeddings(names) == 0
+
+
+def test_match_items_equals_per_item_matching():
+    """Batched category matching gives the same results as per-item calls."""
+    names = ["MRI BRAIN PLAIN", "CT SCAN ABDOMEN", "Unknown Procedure XYZ", "MRI Brain"]
+
+    batch_matcher, _ = _matcher()
+    batched = batch_matcher.match_items(names, "Apollo Hospital", "Radiology", use_llm=False)
+
+    single_matcher, _ = _matcher()
+    single = [
+        single_matcher.match_item_v2(name, "Apollo Hospital", "Radiology", use_llm=False)
+        for name in names
+    ]
+
+    assert [(m.matched_text, m.index, m.similarity) for m in batched] == [
+        (m.matched_text, m.index, m.similarity) for m in single
+    ]
+
+
+def test_match_items_memoized_until_reindex():
+    """Repeated items are served from the item match cache until re-indexing."""
+    matcher, _ = _matcher()
+    names = ["MRI BRAIN PLAIN", "CT SCAN ABDOMEN"]
+
+    first = matcher.match_items(names, "Apollo Hospital", "Radiology", use_llm=False)
+
+    calls = []
+    original = matcher.match_item_v2
+    matcher.match_item_v2 = lambda *args, **kwargs: calls.append(kwargs) or original(*args, **kwargs)
+
+    again = matcher.match_items(names + names, "Apollo Hospital", "Radiology", use_llm=False)
+
+    assert calls == []
+    assert again == first + first
+    assert matcher.stats["total_matches"] == 6
+
+    assert matcher.index_rate_sheets([_rate_sheet()])
+    matcher.match_items(names, "Apollo Hospital", "Radiology", use_llm=False)
+
+    assert len(calls) == 2
+
+
+def test_match_items_encodes_in_one_batch():
+    """Unseen query texts of a category are encoded with a single batch call."""
+    matcher, service = _matcher()
+
+    def fail(text):
+        raise AssertionError("per-item encoding should not be needed")
+
+    service.get_embedding = fail
+    matcher.match_items(["MRI BRAIN PLAIN", "CT SCAN ABDOMEN CONTRAST"], "Apollo Hospital", "Radiology", use_llm=False)
+
+    assert len(service.encoded_texts) == 2
+
+
+def test_match_items_exact_matches_skip_encoder():
+    """Items equal to a tie-up name are matched without an embedding."""
+    matcher, service = _matcher()
+
+    [result] = matcher.match_items(["1. CONSULTATION"], "Apollo Hospital", "Consultation", use_llm=False)
+
+    assert result.matched_text == "Consultation"
+    assert result.similarity == 1.0
+    assert service.encoded_texts == []
+
+
+class ConfirmingLLMRouter(FakeLLMRouter):
+    """LLM router stub that confirms every match it is asked about."""
+
+    def __init__(self):
+        self.calls = []
+
+    def match_with_llm(self, bill_item, tieup_item, similarity):
+        self.calls.append((bill_item, tieup_item, similarity))
+        return SimpleNamespace(is_valid=True, match=True, confidence=0.9, model_used="fake")
+
+
+def test_v2_low_semantic_top_hit_still_reaches_llm(monkeypatch):
+    """A weak semantic hit with perfect anchors and tokens goes to the LLM, not a hard reject."""
+    monkeypatch.setattr(matcher_module, "USE_V2_MATCHING", True)
+    router = ConfirmingLLMRouter()
+    matcher = SemanticMatcher(embedding_service=FakeEmbeddingService(), llm_router=router)
+    sheet = TieUpRateSheet(
+        hospital_name="Apollo Hospital",
+        categories=[
+            TieUpCategory(
+                category_name="Procedures",
+                items=[TieUpItem(item_name="MRI Brain 5mg", rate=6000)],
+            ),
+        ],
+    )
+    assert matcher.index_rate_sheets([sheet])
+
+    # 0.50 * 0.29 + 0.30 * 1.0 + 0.20 * 1.0 = 0.645, above the 0.55 LLM band of "procedures"
+    result = matcher.match_item_v2(
+        "MRI Brain 5mg", "Apollo Hospital", "Procedures", candidates=[(0, 0.29)]
+    )
+
+    assert router.calls == [("mri brain 5mg", "mri brain 5mg", 0.645)]
+    assert result.is_match
+    assert result.item.rate == 6000
+    assert result.confidence_decision == "LLM_VERIFY"
+    assert result.failure_reason_v2 is None
+
+
+def test_v2_auto_accept_fast_path_reports_hybrid_score(monkeypatch):
+    """The auto-accept fast path returns the same calibrated score and breakdown as re-ranking."""
+    from app.verifier.enhanced_matcher import get_category_config
+
+    monkeypatch.setattr(matcher_module, "USE_V2_MATCHING", True)
+    matcher = SemanticMatcher(embedding_service=FakeEmbeddingService(), llm_router=FakeLLMRouter())
+    sheet = TieUpRateSheet(
+        hospital_name="Apollo Hospital",
+        categories=[
+            TieUpCategory(
+                category_name="Procedures",
+                items=[TieUpItem(item_name="MRI Brain 5mg", rate=6000)],
+            ),
+        ],
+    )
+    assert matcher.index_rate_sheets([sheet])
+
+    def match():
+        return matcher.match_item_v2(
+            "MRI Brain 5mg", "Apollo Hospital", "Procedures", candidates=[(0, 0.97)]
+        )
+
+    fast = match()
+    monkeypatch.setattr(get_category_config("Procedures"), "auto_accept_similarity", 1.1)
+    reranked = match()
+
+    assert fast.confidence_decision == "AUTO_MATCH"
+    assert fast.similarity == fast.score_breakdown["final_score"]
+    assert (fast.similarity, fast.index, fast.score_breakdown) == (
+        reranked.similarity, reranked.index, reranked.score_breakdown
+    )
+
+
+def test_v2_calibration_thresholds_reused_across_bills(monkeypatch):
+    """A second bill in the same category calibrates from the cached thresholds."""
+    from app.verifier.enhanced_matcher import _calibration_thresholds
+
+    monkeypatch.setattr(matcher_module, "USE_V2_MATCHING", True)
+    matcher, _ = _matcher()
+    _calibration_thresholds.cache_clear()
+
+    matcher.match_items(["MRI BRAIN PLAIN"], "Apollo Hospital", "Radiology", use_llm=False)
+    first = _calibration_thresholds.cache_info()
+
+    matcher.match_items(
+        ["CT SCAN ABDOMEN CONTRAST", "MRI BRAIN WITH CONTRAST"],
+        "Apollo Hospital", "Radiology", use_llm=False,
+    )
+    second = _calibration_thresholds.cache_info()
+
+    assert first.misses == second.misses == 1
+    assert second.hits > first.hits
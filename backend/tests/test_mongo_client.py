@@ -19,3 +19,11 @@ print("Inserted Bill ID:", bill_id)
 
 retrieved = client.get_bill_by_id(bill_id)
 print("Retrieved Bill:", retrieved)
+
+# Bulk path: one round-trip to insert, one to read back
+bill_ids = client.insert_bills_bulk([dict(sample_bill) for _ in range(3)])
+print("Inserted Bill IDs:", bill_ids)
+
+retrieved_bills = client.get_bills_by_ids(bill_ids)
+assert [str(b["_id"]) for b in retrieved_bills] == bill_ids
+print("Retrieved Bills:", len(retrieved_bills))
@@ -0,0 +1,162 @@
+"""Unit tests for the Phase-7 output renderer.
+
+Tests:
+- Output completeness validation (missing / duplicate items)
+- Summary counter reconciliation
+- Combined single-pass validation
+- Final view item rendering
+- Debug view reuse of a pre-rendered final view
+- Rendering to a stream
+"""
+
+import sys
+sys.path.insert(0, ".")
+
+import io
+
+from app.verifier.models import (
+    BillInput,
+    CategoryVerificationResult,
+    ItemVerificationResult,
+    VerificationResponse,
+    VerificationStatus,
+)
+from app.verifier.output_renderer import (
+    render_debug_view,
+    render_final_view,
+    validate_completeness,
+    validate_response,
+    validate_summary_counters,
+)
+
+
+def _bill():
+    return BillInput(
+        hospital_name="Apollo Hospital",
+        categories=[
+            {
+                "category_name": "Radiology",
+                "items": [
+                    {"item_name": "MRI Brain", "quantity": 1, "amount": 7000.0},
+                    {"item_name": "CT Scan", "quantity": 1, "amount": 4000.0},
+                ],
+            },
+        ],
+    )
+
+
+def _response(*items):
+    return VerificationResponse(
+        hospital="Apollo Hospital",
+        results=[
+            CategoryVerificationResult(
+                category="Radiology",
+                items=[
+                    ItemVerificationResult(
+                        bill_item=name,
+                        status=VerificationStatus.GREEN,
+                        bill_amount=amount,
+                    )
+                    for name, amount in items
+                ],
+            )
+        ],
+    )
+
+
+def test_validate_completeness_ok():
+    """Every input item present once in the output."""
+    response = _response(("MRI Brain", 7000.0), ("CT Scan", 4000.0))
+
+    assert validate_completeness(_bill(), response) == (True, "")
+
+
+def test_validate_completeness_missing_item():
+    """An input item absent from the output is reported as missing."""
+    is_complete, error = validate_completeness(_bill(), _response(("MRI Brain", 7000.0)))
+
+    assert not is_complete
+    assert "Input=2, Output=1" in error
+    assert "Missing 1 items" in error
+    assert "CT Scan" in error
+
+
+def test_validate_completeness_duplicate_item():
+    """A repeated output item is reported even when counts match."""
+    is_complete, error = validate_completeness(
+        _bill(), _response(("MRI Brain", 7000.0), ("MRI Brain", 7000.0))
+    )
+
+    assert not is_complete
+    assert "unique=1" in error
+
+
+def test_validate_summary_counters():
+    """Summary counters must equal the per-status item counts."""
+    response = _response(("MRI Brain", 7000.0), ("CT Scan", 4000.0))
+    response.results[0].items[1].status = VerificationStatus.RED
+    response.green_count = 1
+    response.red_count = 1
+
+    assert validate_summary_counters(response) == (True, "")
+
+    response.red_count = 0
+    is_valid, error = validate_summary_counters(response)
+
+    assert not is_valid
+    assert error == "Counter mismatch: RED: actual=1, summary=0"
+
+
+def test_validate_response_matches_individual_validators():
+    """Combined validation returns both individual results."""
+    bill = _bill()
+    response = _response(("MRI Brain", 7000.0))
+    response.green_count = 2
+
+    assert validate_response(bill, response) == (
+        validate_completeness(bill, response),
+        validate_summary_counters(response),
+    )
+    assert not validate_response(bill, response)[0][0]
+    assert not validate_response(bill, response)[1][0]
+
+
+def test_render_final_view_items():
+    """Each item renders its icon, match and status-specific amounts."""
+    response = _response(("MRI Brain", 7000.0), ("CT Scan", 4000.0))
+    red = response.results[0].items[0]
+    red.status = VerificationStatus.RED
+    red.matched_item = "MRI Brain"
+    red.allowed_amount = 6000.0
+    red.extra_amount = 1000.0
+    response.results[0].items[1].status = VerificationStatus.UNCLASSIFIED
+
+    lines = render_final_view(response).splitlines()
+
+    assert "  ❌ MRI Brain" in lines
+    assert "     → Matched: MRI Brain" in lines
+    assert "     → Bill: ₹7000.00, Allowed: ₹6000.00, Extra: ₹1000.00" in lines
+    assert "  ⚠️ CT Scan" in lines
+    assert "     → Bill: ₹4000.00, Allowed: N/A, Extra: N/A" in lines
+
+
+def test_render_debug_view_reuses_final_view():
+    """A pre-rendered final view is embedded as is."""
+    response = _response(("MRI Brain", 7000.0))
+    final_view = render_final_view(response)
+
+    assert render_debug_view(response, {}, final_view=final_view) == render_debug_view(response, {})
+    assert "<final>" in render_debug_view(response, {}, final_view="<final>")
+
+
+def test_render_views_to_stream():
+    """Views written to a stream equal the returned strings."""
+    response = _response(("MRI Brain", 7000.0), ("CT Scan", 4000.0))
+
+    final_out = io.StringIO()
+    debug_out = io.StringIO()
+
+    assert render_final_view(response, out=final_out) is None
+    assert render_debug_view(response, {}, out=debug_out) is None
+    assert final_out.getvalue() == render_final_view(response)
+    assert debug_out.getvalue() == render_debug_view(response, {})
@@ -1,7 +1,17 @@
 import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
 from app.ocr.paddle_engine import run_ocr
 
 
+def emit(lines):
+    """Write collected report lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def test_ocr_processing():
     print(" Starting OCR Test ---\n")
 
@@ -14,23 +24,19 @@ def test_ocr_processing():
         return
 
     # Find all bill page images
-    all_files = os.listdir(images_dir)
-    image_paths = sorted([
-        os.path.join(images_dir, f)
-        for f in all_files
-        if f.startswith("Bill_page_") and f.endswith(".png")
-    ])
+    image_paths = sorted(Path(images_dir).glob("Bill_page_*.png"))
 
     if not image_paths:
         print(f" No bill page images found in {images_dir}")
-        print(f"   Files in directory: {all_files}")
+        print(f"   Files in directory: {os.listdir(images_dir)}")
         return
 
-    print(f"📄 Found {len(image_paths)} pages:")
+    lines = [f"📄 Found {len(image_paths)} pages:"]
     for path in image_paths:
-        file_size = os.path.getsize(path)
-        print(f"   - {path} ({file_size:,} bytes)")
-    print()
+        file_size = path.stat().st_size
+        lines.append(f"   - {path} ({file_size:,} bytes)")
+    lines.append("")
+    emit(lines)
 
     try:
         result = run_ocr(image_paths)
@@ -43,25 +49,40 @@ def test_ocr_processing():
             print("   - PaddleOCR installation issue")
             return
 
-        print("\n" + "="*60)
-        print("RAW OCR TEXT")
-        print("="*60 + "\n")
-        print(result["raw_text"])
-
-        print(f"\n" + "="*60)
-        print(f"GROUPED BILL ITEMS ({len(result['item_blocks'])} blocks)")
-        print("="*60 + "\n")
-
+        lines = [
+            "\n" + "="*60,
+            "RAW OCR TEXT",
+            "="*60 + "\n",
+            result["raw_text"],
+            "\n" + "="*60,
+            f"GROUPED BILL ITEMS ({len(result['item_blocks'])} blocks)",
+            "="*60 + "\n",
+        ]
+
+        # Only blocks with text are printed; skip the rest before any confidence math
+        printable = []
         for idx, block in enumerate(result["item_blocks"], start=1):
             text = block["text"].strip()
-            if not text:
-                continue
-
-            confidence_avg = sum(line["confidence"] for line in block["lines"]) / len(block["lines"])
-            
-            print(f"[BLOCK {idx}] (confidence: {confidence_avg:.2f})")
-            print(text)
-            print("-" * 60)
+            if text:
+                printable.append((idx, text, block["lines"]))
+
+        # Mean line confidence of every printed block in one pass
+        confidences = np.fromiter(
+            (line["confidence"] for _, _, block_lines in printable for line in block_lines),
+            dtype=np.float64,
+        )
+        block_ids = np.fromiter(
+            (i for i, (_, _, block_lines) in enumerate(printable) for _ in block_lines),
+            dtype=np.intp,
+        )
+        line_counts = np.bincount(block_ids, minlength=len(printable))
+        confidence_sums = np.bincount(block_ids, weights=confidences, minlength=len(printable))
+
+        for pos, (idx, text, _) in enumerate(printable):
+            confidence_avg = confidence_sums[pos] / line_counts[pos]
+            lines.extend((f"[BLOCK {idx}] (confidence: {confidence_avg:.2f})", text, "-" * 60))
+
+        emit(lines)
 
         # Save results to file
         output_file = "ocr_results.txt"
@@ -0,0 +1,100 @@
+"""Unit tests for the price checker.
+
+Tests:
+- Allowed amount per item type (unit / service / bundle)
+- GREEN / RED / UNCLASSIFIED price checks
+- Paise-exact comparison and extra amount
+- Vectorized bulk price checks
+- PriceCheckResult immutability
+"""
+
+import sys
+sys.path.insert(0, ".")
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from app.verifier.models import ItemType, TieUpItem, VerificationStatus
+from app.verifier.price_checker import (
+    PRICE_STATUS_CODES,
+    calculate_allowed_amount,
+    check_price,
+    check_prices_bulk,
+    create_mismatch_result,
+)
+
+
+@pytest.mark.parametrize("item_type, expected", [
+    (ItemType.UNIT, 150.0),
+    (ItemType.SERVICE, 50.0),
+    (ItemType.BUNDLE, 50.0),
+])
+def test_calculate_allowed_amount(item_type, expected):
+    """Only unit pricing multiplies by quantity."""
+    item = TieUpItem(item_name="X", rate=50.0, type=item_type)
+
+    assert calculate_allowed_amount(item, quantity=3) == expected
+
+
+def test_check_price_green():
+    result = check_price(450.0, TieUpItem(item_name="X-Ray", rate=800.0, type=ItemType.SERVICE))
+
+    assert result.status == VerificationStatus.GREEN
+    assert (result.bill_amount, result.allowed_amount, result.extra_amount) == (450.0, 800.0, 0.0)
+    assert not result.is_overcharged
+
+
+def test_check_price_red():
+    result = check_price(7000.0, TieUpItem(item_name="MRI", rate=6000.0, type=ItemType.SERVICE))
+
+    assert result.status == VerificationStatus.RED
+    assert result.extra_amount == 1000.0
+    assert result.is_overcharged
+
+
+def test_check_price_unmatched():
+    result = check_price(250.0, None)
+
+    assert result.status == VerificationStatus.UNCLASSIFIED
+    assert result == create_mismatch_result(250.0)
+
+
+def test_price_check_result_is_frozen():
+    result = create_mismatch_result(10.0)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.bill_amount = 20.0
+
+
+def test_check_price_paise_arithmetic():
+    """Amounts are compared in whole paise, free of float drift."""
+    result = check_price(0.3, TieUpItem(item_name="Swab", rate=0.1, type=ItemType.UNIT), quantity=3)
+
+    assert result.status == VerificationStatus.GREEN
+
+    result = check_price(100.35, TieUpItem(item_name="Gauze", rate=33.45, type=ItemType.UNIT), quantity=3)
+
+    assert result.status == VerificationStatus.GREEN
+    assert result.extra_amount == 0.0
+
+    result = check_price(1234.57, TieUpItem(item_name="ECG", rate=1000.1, type=ItemType.SERVICE))
+
+    assert result.extra_amount == 234.47
+
+
+def test_check_prices_bulk_matches_check_price():
+    """Vectorized statuses and extras agree with scalar check_price."""
+    bills = [450.0, 7000.0, 250.0, 100.35, 1234.57]
+    allowed = [800.0, 6000.0, 0.0, 100.35, 1000.1]
+    has_match = np.array([True, True, False, True, True])
+
+    codes, extras = check_prices_bulk(np.array(bills), np.array(allowed), has_match)
+
+    assert codes.dtype == np.int8
+    for i, (bill, rate) in enumerate(zip(bills, allowed)):
+        item = TieUpItem(item_name="X", rate=rate, type=ItemType.SERVICE) if has_match[i] else None
+        expected = check_price(bill, item)
+        assert PRICE_STATUS_CODES[codes[i]] == expected.status
+        assert extras[i] == expected.extra_amount
@@ -6,6 +6,7 @@ Tests defensive regex handling for OCR text extraction edge cases:
 - Multi-line fields
 - Missing values
 - OCR noise (missing colons, extra spaces, broken tokens)
+- Combined pattern alternations
 """
 
 import sys
@@ -20,6 +21,7 @@ from app.extraction.regex_utils import (
     is_label_only,
     extract_from_next_line,
     SafeFieldExtractor,
+    compile_any,
 )
 
 
@@ -215,6 +217,38 @@ def test_safe_field_extractor():
     print("  ✓ SafeFieldExtractor working")
 
 
+def test_safe_field_extractor_extract_all():
+    """Test single-pass extraction of every field."""
+    print("Testing SafeFieldExtractor.extract_all...")
+    
+    lines = [
+        "Hospital Name",
+        "Patient Name: John Doe",
+        "Bill No:",
+        "BL12345",
+        "Date: 2024-01-15",
+        "Date: 2024-02-01",
+    ]
+    
+    label_patterns = {
+        "patient_name": [r"patient\s*name\s*[:.]?"],
+        "bill_number": [r"bill\s*no\s*[:.]?"],
+        "date": [r"date\s*[:.]?"],
+        "uhid": [r"uhid\s*[:.]?"],
+        "empty": [],
+    }
+    
+    result = SafeFieldExtractor(lines, label_patterns).extract_all()
+    expected = {
+        "patient_name": "John Doe",
+        "bill_number": "BL12345",
+        "date": "2024-01-15",  # First value wins
+    }
+    assert result == expected, f"Expected {expected}, got {result}"
+    
+    print("  ✓ extract_all working")
+
+
 def test_ocr_noise_patterns():
     """Test handling of common OCR noise patterns."""
     print("Testing OCR noise patterns...")
@@ -272,6 +306,20 @@ def test_edge_cases():
     print("  ✓ Edge cases handled")
 
 
+def test_compile_any():
+    """Test compile_any matches exactly where any single pattern matches."""
+    print("Testing compile_any...")
+    
+    patterns = [r"^\s*patient\s*(name|id)\s*[:.]?", r"\brefund\b", r"^\s*#\s*$"]
+    combined = compile_any(patterns)
+    
+    for text in ["Patient Name:", "REFUND issued", "  #  ", "refunded", "Name: patient", "#1", ""]:
+        expected = any(re.search(p, text, re.IGNORECASE) for p in patterns)
+        assert bool(combined.search(text)) == expected, f"Mismatch for {text!r}"
+    
+    print("  ✓ compile_any agrees with per-pattern search")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "=" * 60)
@@ -288,8 +336,10 @@ def run_all_tests():
         test_is_label_only,
         test_extract_from_next_line,
         test_safe_field_extractor,
+        test_safe_field_extractor_extract_all,
         test_ocr_noise_patterns,
         test_edge_cases,
+        test_compile_any,
     ]
     
     passed = 0
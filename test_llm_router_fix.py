@@ -12,9 +12,12 @@ sys.path.insert(0, str(backend_path))
 
 from app.verifier.llm_router import LLMRouter, LLMMatchResult
 
+# One router shared by all tests (construction reads the LLM config)
+ROUTER = LLMRouter()
+
 def test_llm_router_method_exists():
     """Verify that match_with_llm method exists and has correct signature."""
-    router = LLMRouter()
+    router = ROUTER
     
     # Check method exists
     assert hasattr(router, 'match_with_llm'), "LLMRouter missing match_with_llm method"
@@ -27,7 +30,7 @@ def test_llm_router_method_exists():
 
 def test_llm_result_structure():
     """Verify LLMMatchResult has expected attributes."""
-    router = LLMRouter()
+    router = ROUTER
     
     # Test auto-match case (high similarity)
     result = router.match_with_llm(
@@ -60,7 +63,7 @@ def test_llm_result_structure():
 
 def test_llm_auto_reject():
     """Test that low similarity auto-rejects without calling LLM."""
-    router = LLMRouter()
+    router = ROUTER
     
     result = router.match_with_llm(
         bill_item="X-Ray Chest",